@@ -83,12 +83,21 @@ if __name__ == '__main__':
     models = [Model() for i in range(500)]
 
     serializer = ModelSchema()
+    compiled_serializer = ModelSchema(compiled=True)
     schema = MM_ModelSchema(many=True)
 
     s = time.time()
     data = serializer.dumps(models)
     print('WebAPI - dump: ' + str(time.time() - s))
 
+    s = time.time()
+    compiled_serializer.dumps(models)
+    print('WebAPI (compiled) - dump: ' + str(time.time() - s))
+
+    s = time.time()
+    serializer.dump_columns(models)
+    print('WebAPI (columns) - dump: ' + str(time.time() - s))
+
     s = time.time()
     data2 = schema.dump(models).data
     print('Marshmallow - dump: ' + str(time.time() - s))
@@ -97,6 +106,10 @@ if __name__ == '__main__':
     serializer.loads(data)
     print('WebAPI - load: ' + str(time.time() - s))
 
+    s = time.time()
+    compiled_serializer.loads(data)
+    print('WebAPI (compiled) - load: ' + str(time.time() - s))
+
     s = time.time()
     d = schema.load(data2)
     print('Marshmallow - load: ' + str(time.time() - s))
@@ -5,11 +5,18 @@ Provides the main class for Flask WebAPI.
 import importlib
 import inspect
 
-from .formatters import get_default_input_formatters, get_default_output_formatters
+from .formatters import FlaskJsonBackend, get_default_input_formatters, get_default_output_formatters
 from .internal import ActionContext, ActionDescriptorBuilder, ActionExecutor, ObjectResultFactory, ObjectResultExecutor
+from .negotiators import DefaultContentNegotiator
 from .routers import has_routes, DefaultRouter
 from .values import get_default_providers
 
+# async actions require the `async` syntax of Python 3.5.
+try:
+    from .asynchronous import AsyncActionExecutor, make_async_view
+except SyntaxError:
+    AsyncActionExecutor = make_async_view = None
+
 
 class WebAPI(object):
     """
@@ -23,10 +30,12 @@ class WebAPI(object):
     after it has been constructed.
     """
 
-    def __init__(self, app=None):
+    def __init__(self, app=None, json_backend=None):
         """
         Initialize this class with the given `flask.Flask` application.
         :param flask.Flask app: The Flask application
+        :param JsonBackend json_backend: The backend used to encode and decode JSON,
+                                         including error responses. `flask.json` by default.
         Examples::
             api = WebAPI()
             api.add_view(...)
@@ -36,9 +45,12 @@ class WebAPI(object):
 
         self.app = None
         self.action_executor = ActionExecutor()
+        self.async_action_executor = AsyncActionExecutor() if AsyncActionExecutor else None
         self.filters = []
-        self.input_formatters = get_default_input_formatters()
-        self.output_formatters = get_default_output_formatters()
+        self.json_backend = json_backend or FlaskJsonBackend()
+        self.input_formatters = get_default_input_formatters(self.json_backend)
+        self.output_formatters = get_default_output_formatters(self.json_backend)
+        self.content_negotiator = DefaultContentNegotiator()
         self.object_result_factory = ObjectResultFactory()
         self.object_result_executor = ObjectResultExecutor()
         self.router = DefaultRouter()
@@ -107,12 +119,23 @@ class WebAPI(object):
                 elif inspect.isclass(member) and member.__name__.endswith('View'):
                     self.add_view(member)
 
+    def get_requested_fields(self):
+        """
+        Gets the fields of the result requested by the client for the current request,
+        so the action can fetch only them.
+        :return: A `frozenset` with the name of the fields or `None` if all the fields are requested.
+        """
+        return self.object_result_executor.get_requested_fields()
+
     def _make_view(self, descriptor):
         """
         Returns a view function expected by Flask.
         :param ActionDescriptor descriptor: The action descriptor.
         :return: A function
         """
+        if descriptor.is_async:
+            return make_async_view(self, descriptor)
+
         def func_view(*args, **kwargs):
             context = ActionContext(self, descriptor, args, kwargs)
             self.action_executor.execute(context)
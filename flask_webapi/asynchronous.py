@@ -0,0 +1,228 @@
+"""
+Provides the classes to execute actions and filters declared with `async def`.
+"""
+
+import asyncio
+import inspect
+import threading
+
+from .internal import ActionContext, ActionExecutor, FilterPipeline
+
+
+def make_async_view(api, descriptor):
+    """
+    Returns a view function expected by Flask for an async action.
+    Flask 2.0 or later runs the coroutine views by itself, otherwise
+    the coroutine runs on an event loop bound to the current thread.
+    :param WebAPI api: The Flask WebAPI.
+    :param ActionDescriptor descriptor: The action descriptor.
+    :return: A function
+    """
+    async def async_view(*args, **kwargs):
+        context = ActionContext(api, descriptor, args, kwargs)
+        await api.async_action_executor.execute(context)
+        return context.response
+
+    if hasattr(api.app, 'ensure_sync'):
+        return async_view
+
+    def func_view(*args, **kwargs):
+        return _get_event_loop().run_until_complete(async_view(*args, **kwargs))
+
+    return func_view
+
+
+_local = threading.local()
+
+
+def _get_event_loop():
+    """
+    Returns the event loop of the current thread, creating it if necessary.
+    :return: An event loop.
+    """
+    loop = getattr(_local, 'loop', None)
+
+    if loop is None or loop.is_closed():
+        loop = _local.loop = asyncio.new_event_loop()
+
+    return loop
+
+
+async def _maybe_await(value):
+    """
+    Awaits the given value if it is awaitable.
+    :param value: The value returned by a filter.
+    """
+    if inspect.isawaitable(value):
+        await value
+
+
+def _check_filter(filter, method):
+    """
+    Checks that the given method of a filter can be used on async actions.
+    A sync method cannot wait for the next filter, so the code after
+    `next_filter` would run before the action.
+    :param filter: The filter.
+    :param method: The method of the filter that receives the next filter.
+    """
+    if not asyncio.iscoroutinefunction(method) and not filter.async_compatible:
+        raise RuntimeError('%s cannot be used on async actions, declare `%s` with `async def`.'
+                           % (type(filter).__name__, method.__name__))
+
+
+async def _call_filter(method, context, next_filter):
+    """
+    Calls a filter that receives the next filter, either sync or async.
+    A sync filter cannot await the next filter, so it is
+    awaited as soon as the filter returns, see `Filter.async_compatible`.
+    :param method: The method of the filter.
+    :param ActionContext context: The action context.
+    :param next_filter: The coroutine function of the next filter.
+    """
+    pending = []
+
+    def call_next(context):
+        coroutine = next_filter(context)
+        pending.append(coroutine)
+        return coroutine
+
+    await _maybe_await(method(context, call_next))
+
+    for coroutine in pending:
+        if inspect.getcoroutinestate(coroutine) == inspect.CORO_CREATED:
+            await coroutine
+
+
+class AsyncFilterPipeline(FilterPipeline):
+    """
+    A `FilterPipeline` whose chains are coroutine functions,
+    the filters can be either sync or async.
+    :raises RuntimeError: If a sync filter cannot be used on async actions.
+    """
+
+    def _check_filters(self, all_filters):
+        # async and sync methods are both awaited, the sync methods
+        # that receive `next_filter` are checked by `_check_filter`.
+        pass
+
+    def _link_resource_filter(self, filter, next_filter):
+        _check_filter(filter, filter.on_resource_execution)
+        executor = self.executor
+
+        async def invoke(context):
+            if context.result is not None:
+                executor._execute_action_result(context)
+                return
+
+            await _call_filter(filter.on_resource_execution, context, next_filter)
+
+        return invoke
+
+    def _link_action_filter(self, filter, next_filter):
+        _check_filter(filter, filter.on_action_execution)
+
+        async def invoke(context):
+            if context.result is not None:
+                return
+
+            await _call_filter(filter.on_action_execution, context, next_filter)
+
+        return invoke
+
+    def _link_result_filter(self, filter, next_filter):
+        _check_filter(filter, filter.on_result_execution)
+
+        async def invoke(context):
+            if context.result is None:
+                return
+
+            await _call_filter(filter.on_result_execution, context, next_filter)
+
+        return invoke
+
+    async def _execute_inner_stages(self, context):
+        """
+        Executes the action filters, the exception filters and the result filters.
+        :param ActionContext context: The action context.
+        """
+        if context.result is not None:
+            self.executor._execute_action_result(context)
+            return
+
+        pipeline = context.get_pipeline()
+
+        try:
+            await pipeline.action_chain(context)
+        except Exception as e:
+            context.exception = e
+
+        for filter in pipeline.exception_filters:
+            if context.exception and not context.exception_handled:
+                await _maybe_await(filter.on_exception(context))
+
+        if context.exception and not context.exception_handled:
+            raise context.exception
+
+        await pipeline.result_chain(context)
+
+    async def _execute_result(self, context):
+        """
+        Executes the action result once all result filters have been called.
+        :param ActionContext context: The action context.
+        """
+        if context.result is not None:
+            self.executor._execute_action_result(context)
+
+
+class AsyncActionExecutor(ActionExecutor):
+    """
+    Responsible to execute an async action and its filters,
+    keeping the same order of execution as `ActionExecutor`.
+    """
+
+    def create_pipeline(self, filters):
+        """
+        Creates the filter pipeline executed by this executor.
+        :param list filters: The filters ordered by order of execution.
+        :return: An `AsyncFilterPipeline`.
+        """
+        return AsyncFilterPipeline(filters, self)
+
+    async def execute(self, context):
+        """
+        Executes an action with all its filters.
+        :param context: The action context.
+        """
+        try:
+            for filter in self._iter_filters(context, 'authentication_filters'):
+                await _maybe_await(filter.on_authentication(context))
+
+                if context.result is not None:
+                    self._execute_action_result(context)
+                    return
+
+            for filter in self._iter_filters(context, 'authorization_filters'):
+                await _maybe_await(filter.on_authorization(context))
+
+                if context.result is not None:
+                    self._execute_action_result(context)
+                    return
+
+            await context.get_pipeline().resource_chain(context)
+        except Exception as e:
+            context.exception = e
+            self._handle_exception(context)
+
+    async def _execute_action(self, context):
+        """
+        Executes and awaits the action once all action filters have been called.
+        :param context: The action context.
+        """
+        if context.result is not None:
+            return
+
+        descriptor = context.descriptor
+        view = descriptor.view_class()
+        result = await descriptor.func(view, *context.args, **context.kwargs)
+
+        self._set_action_result(context, result)
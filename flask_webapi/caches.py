@@ -0,0 +1,98 @@
+"""
+Provides a set of classes to store cached values.
+"""
+
+import threading
+import time
+
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+
+
+class Cache(metaclass=ABCMeta):
+    """
+    A base class from which all cache classes should inherit.
+    """
+
+    @abstractmethod
+    def get(self, key):
+        """
+        Gets the value stored under the given key.
+        :param str key: The key.
+        :return: The value or `None` if it is not found or has expired.
+        """
+
+    @abstractmethod
+    def set(self, key, value, timeout=None):
+        """
+        Stores the value under the given key.
+        :param str key: The key.
+        :param value: The value.
+        :param int timeout: The number of seconds the value is kept, `None` for the default timeout.
+        """
+
+    @abstractmethod
+    def delete(self, key):
+        """
+        Removes the value stored under the given key.
+        :param str key: The key.
+        """
+
+    @abstractmethod
+    def clear(self):
+        """
+        Removes all values.
+        """
+
+
+class MemoryCache(Cache):
+    """
+    An in-process `Cache` that evicts the least recently used values
+    when it is full and the values older than their timeout.
+
+    :param int max_size: The maximum number of values stored.
+    :param int default_timeout: The number of seconds the values are kept by default.
+    """
+
+    def __init__(self, max_size=1024, default_timeout=300):
+        self.max_size = max_size
+        self.default_timeout = default_timeout
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._values.get(key)
+
+            if entry is None:
+                return None
+
+            expires, value = entry
+
+            if expires is not None and expires <= time.monotonic():
+                del self._values[key]
+                return None
+
+            self._values.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout=None):
+        if timeout is None:
+            timeout = self.default_timeout
+
+        expires = time.monotonic() + timeout if timeout else None
+
+        with self._lock:
+            self._values[key] = (expires, value)
+            self._values.move_to_end(key)
+
+            while len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._values.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
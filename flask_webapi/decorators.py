@@ -30,8 +30,11 @@ def route(url, endpoint=None, methods=None):
 allow_anonymous = filters.AllowAnonymous
 authenticate = filters.AuthenticateFilter
 authorize = filters.AuthorizeFilter
+cache = filters.CacheFilter
 compat = filters.CompatFilter
+compress = filters.CompressionFilter
 consume = filters.ConsumeFilter
+etag = filters.ETagFilter
 produce = filters.ProduceFilter
 param = filters.ParameterFilter
 result = filters.ObjectResultFilter
@@ -55,7 +55,7 @@ class APIException(Exception):
 
         if isinstance(message, dict):
             for f, messages in message.items():
-                f = field + '.' + f if field else f
+                f = '%s.%s' % (field, f) if field is not None else f
                 self._denormalize(errors, messages, f, message_key_name, field_key_name)
 
         elif isinstance(message, list):
@@ -68,7 +68,7 @@ class APIException(Exception):
             if kwargs:
                 data.update(kwargs)
 
-            if field:
+            if field is not None:
                 data.update({field_key_name: field})
 
             errors.append(data)
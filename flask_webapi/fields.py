@@ -2,9 +2,12 @@
 Provides a set of classes to serialize Python objects.
 """
 
+import array
 import copy
 import datetime
 import decimal
+import math
+import threading
 import uuid
 
 from collections import OrderedDict
@@ -13,6 +16,11 @@ from .exceptions import ValidationError
 from .utils import dateparse, formatting, html, missing, timezone
 from .validators import LengthValidator, RangeValidator
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 MISSING_ERROR_MESSAGE = 'ValidationError raised by `{class_name}`, but error key `{key}` does ' \
                         'not exist in the `error_messages` dictionary.'
@@ -66,6 +74,23 @@ class Field(object):
             root = root.parent
         return root
 
+    def __copy__(self):
+        """
+        Returns a shallow copy of this field to be bound to a new parent.
+        The validators and error messages are copied, so they
+        can be changed without affecting the original field.
+        """
+        field = self.__class__.__new__(self.__class__)
+        field.__dict__.update(self.__dict__)
+        field.validators = list(self.validators)
+        field.error_messages = dict(self.error_messages)
+
+        # `root` is a cached property and
+        # depends on the parent of the field.
+        field.__dict__.pop('root', None)
+
+        return field
+
     def bind(self, field_name, parent):
         self.field_name = field_name
         self.parent = parent
@@ -255,8 +280,17 @@ class DateTimeField(Field):
         When `self.default_timezone` is `None`, always return naive datetimes.
         When `self.default_timezone` is not `None`, always return aware datetimes.
         """
-        if self.default_timezone is not None and not timezone.is_aware(value):
+        if self.default_timezone is None:
+            return value
+
+        tzinfo = value.tzinfo
+
+        # fixed offsets are always aware,
+        # so `utcoffset` does not need to be called.
+        if tzinfo is None or (not isinstance(tzinfo, timezone.FixedOffset) and tzinfo is not timezone.utc and
+                              not timezone.is_aware(value)):
             return timezone.make_aware(value, self.default_timezone)
+
         return value
 
 
@@ -387,6 +421,11 @@ class DelimitedListField(Field):
         self.allow_empty = allow_empty
         self.delimiter = delimiter or self.delimiter
 
+    def __copy__(self):
+        field = super().__copy__()
+        field.child = copy.copy(self.child)
+        return field
+
     def _load(self, value):
         if not isinstance(value, str):
             self._fail('invalid')
@@ -524,6 +563,11 @@ class ListField(Field):
         self.child = child
         self.allow_empty = allow_empty
 
+    def __copy__(self):
+        field = super().__copy__()
+        field.child = copy.copy(self.child)
+        return field
+
     def get_value(self, dictionary):
         value = dictionary.get(self.load_from, missing)
 
@@ -545,13 +589,26 @@ class ListField(Field):
         if not self.allow_empty and len(value) == 0:
             self._fail('empty')
 
+        # primitive items are converted at once, the items are
+        # loaded one by one only to collect the errors.
+        batch_load = _BATCH_LOADS.get(self.child.__class__)
+
+        if batch_load is not None and not self.child.validators:
+            try:
+                return batch_load(self.child, value)
+            except (ValueError, TypeError, KeyError):
+                pass
+
         result = []
         errors = {}
+        fail_fast = getattr(self.root, 'fail_fast', False)
 
         for idx, item in enumerate(value):
             try:
                 result.append(self.child.load(item))
             except ValidationError as e:
+                if fail_fast:
+                    raise ValidationError({idx: e})
                 errors[idx] = e
 
         if errors:
@@ -566,6 +623,65 @@ class ListField(Field):
         return [self.child.dump(item) for item in value]
 
 
+class NumericArrayField(ListField):
+    """
+    A list of numbers loaded into a compact `array.array`,
+    or into a NumPy array if NumPy is installed and `use_numpy` is `True`.
+    :param str typecode: The type of the items as defined by the `array` module,
+                         e.g `d` for floats and `q` for integers.
+    :param bool use_numpy: `False` to always use `array.array`.
+    """
+    default_error_messages = {
+        'overflow': 'Value out of range.'
+    }
+
+    # the typecodes of the `array` module for numbers.
+    typecodes = 'bBhHiIlLqQfd'
+
+    def __init__(self, typecode='d', use_numpy=True, *args, **kwargs):
+        if typecode not in self.typecodes:
+            raise ValueError('typecode must be one of %s, not %r.' % (', '.join(self.typecodes), typecode))
+
+        child = FloatField() if typecode in ('f', 'd') else IntegerField()
+        super().__init__(child, *args, **kwargs)
+
+        self.typecode = typecode
+        self.use_numpy = use_numpy and numpy is not None
+
+    def _load(self, value):
+        if isinstance(value, array.array) or (numpy is not None and isinstance(value, numpy.ndarray)):
+            value = value.tolist()
+
+        items = super()._load(value)
+
+        # `array.array` checks the range of the items,
+        # NumPy may wrap the values that are out of range.
+        try:
+            values = array.array(self.typecode, items)
+        except OverflowError:
+            self._fail('overflow')
+
+        # floats too large for single precision become infinite.
+        if self.typecode == 'f' and any(math.isinf(a) and not math.isinf(b) for a, b in zip(values, items)):
+            self._fail('overflow')
+
+        items = values
+
+        if self.use_numpy:
+            return numpy.array(items, dtype=self.typecode)
+
+        return items
+
+    def _dump(self, value):
+        """
+        Arrays are converted at once, without going through the child field.
+        """
+        if isinstance(value, array.array) or (numpy is not None and isinstance(value, numpy.ndarray)):
+            return value.tolist()
+
+        return super()._dump(value)
+
+
 class StringField(Field):
     default_error_messages = {
         'blank': 'This field may not be blank.',
@@ -649,14 +765,36 @@ class SchemaMeta(type):
         return OrderedDict(fields)
 
 
+# guards the instances cached by `Schema.get_cached`.
+_schema_cache_lock = threading.Lock()
+
+
 class Schema(Field, metaclass=SchemaMeta):
     default_error_messages = {
         'invalid': 'Invalid data. Expected a dictionary, but got {datatype}.'
     }
 
-    def __init__(self, only=None, partial=False, *args, **kwargs):
+    # `True` to generate specialized functions to dump
+    # and load the data, `False` to use the fields one by one.
+    compiled = False
+
+    # `True` to stop loading at the first
+    # invalid field, `False` to report all of them.
+    fail_fast = False
+
+    # the maximum number of instances
+    # per schema class kept by `get_cached`.
+    max_cached_instances = 128
+
+    def __init__(self, only=None, partial=False, compiled=None, fail_fast=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        if compiled is not None:
+            self.compiled = compiled
+
+        if fail_fast is not None:
+            self.fail_fast = fail_fast
+
         only = only or ()
         if not isinstance(only, (list, tuple)):
             raise AssertionError('`only` has to be a list or tuple')
@@ -672,6 +810,52 @@ class Schema(Field, metaclass=SchemaMeta):
 
         self.refresh()
 
+    @classmethod
+    def get_cached(cls, only=None, partial=False, compiled=None, fail_fast=None):
+        """
+        Returns a shared instance of this schema for the given arguments,
+        creating it only the first time. Up to `max_cached_instances`
+        instances are kept per schema class, the least recently used are discarded.
+        The instance must not be changed as it is shared between requests.
+        :param only: The name of the fields to be used.
+        :param bool partial: `True` to ignore missing fields on load.
+        :param bool compiled: `True` to use compiled functions, `None` to use the class default.
+        :param bool fail_fast: `True` to stop at the first error, `None` to use the class default.
+        :return: The schema instance.
+        """
+        key = (frozenset(only) if only else None, partial, compiled, fail_fast)
+
+        with _schema_cache_lock:
+            instances = cls.__dict__.get('_cached_instances')
+
+            if instances is None:
+                instances = cls._cached_instances = OrderedDict()
+
+            schema = instances.get(key)
+
+            if schema is not None:
+                instances.move_to_end(key)
+                return schema
+
+        schema = cls(only=tuple(only) if only else None, partial=partial, compiled=compiled, fail_fast=fail_fast)
+
+        with _schema_cache_lock:
+            schema = instances.setdefault(key, schema)
+
+            while len(instances) > cls.max_cached_instances:
+                instances.popitem(last=False)
+
+        return schema
+
+    def restrict_only(self, names):
+        """
+        Returns the given names of fields limited to the ones selected by `only`,
+        a name restricted by dotted names in `only` keeps its restriction.
+        :param names: The name of the fields, dotted names select nested fields.
+        :return: A list with the name of the fields.
+        """
+        return _restrict_only(self.only, names)
+
     def loads(self, data):
         instance = [self.load(value) for value in data]
         return self.post_loads(instance, data)
@@ -681,6 +865,68 @@ class Schema(Field, metaclass=SchemaMeta):
         data = self.post_dumps(data, instances)
         return data
 
+    def dump_columns(self, instances):
+        """
+        Dumps the given instances into columns, a `dict` that maps
+        the name of each field to the list of its dumped values.
+        Missing values are dumped as `None` so all the columns have the same length.
+        `post_dump` and `post_dumps` are not called.
+        :param instances: An iterable of instances.
+        :return: A `dict` of lists.
+        """
+        if not isinstance(instances, (list, tuple)):
+            instances = list(instances)
+
+        return dict((field.dump_to, self._dump_column(field, instances)) for field in self._dump_fields)
+
+    def _dump_column(self, field, instances):
+        """
+        Dumps the values of the given field from all instances,
+        primitive fields are converted in one pass without going through `Field.dump`.
+        :param Field field: The bound field.
+        :param list instances: The instances.
+        :return: A list of dumped values.
+        """
+        field_class = field.__class__
+
+        if field_class.get_attribute is Field.get_attribute:
+            name = field.field_name
+            values = [instance.get(name, missing) if isinstance(instance, dict) else getattr(instance, name, missing)
+                      for instance in instances]
+        else:
+            values = [field.get_attribute(instance) for instance in instances]
+
+        convert = _COLUMN_CONVERSIONS.get(field_class)
+
+        if convert is not None and field.default is missing:
+            return [None if value is None or value is missing else convert(value) for value in values]
+
+        values = [field.dump(value) for value in values]
+        return [None if value is missing else value for value in values]
+
+    def iter_loads(self, data):
+        """
+        Loads the given items one by one as they are consumed.
+        `post_loads` is not called as the data is never materialized.
+        :param data: An iterable of items.
+        :return: A generator of loaded items.
+        """
+        for index, item in enumerate(data):
+            try:
+                yield self.load(item)
+            except ValidationError as e:
+                raise ValidationError({index: e})
+
+    def iter_dumps(self, instances):
+        """
+        Dumps the given instances one by one as they are consumed.
+        `post_dumps` is not called as the data is never materialized.
+        :param instances: An iterable of instances.
+        :return: A generator of dumped instances.
+        """
+        for instance in instances:
+            yield self.dump(instance)
+
     def post_load(self, data, original_data):
         return data
 
@@ -696,20 +942,50 @@ class Schema(Field, metaclass=SchemaMeta):
     def post_validate(self, data):
         pass
 
+    def __copy__(self):
+        """
+        Returns a copy of this schema with its own bound fields.
+        """
+        schema = super().__copy__()
+        schema.refresh()
+        return schema
+
     def refresh(self):
-        self.fields = copy.deepcopy(self._declared_fields)
+        # the declared fields are copied shallowly,
+        # only the state set by `bind` is specific to this schema.
+        self.fields = OrderedDict((field_name, copy.copy(field))
+                                  for field_name, field in self._declared_fields.items())
+
+        # dotted names such as `author.name` select the
+        # fields of the schema used by a `NestedField`.
+        nested_only = {}
 
         if self.only:
-            field_names = set(self.only)
+            field_names = set()
+
+            for name in self.only:
+                name, _, path = name.partition('.')
+                field_names.add(name)
+
+                if path:
+                    nested_only.setdefault(name, []).append(path)
         else:
             field_names = set(self.fields)
 
         self._load_fields = []
         self._dump_fields = []
 
+        # the compiled functions are bound
+        # to the fields the first time they are used.
+        self._compiled_load = None
+        self._compiled_dump = None
+
         for field_name, field in self.fields.items():
             field.bind(field_name, self)
 
+            if field_name in nested_only and field_name not in self.only and isinstance(field, NestedField):
+                field.restrict(nested_only[field_name])
+
             if field.field_name in field_names:
                 if field.load_only:
                     self._load_fields.append(field)
@@ -723,6 +999,11 @@ class Schema(Field, metaclass=SchemaMeta):
         if not isinstance(data, dict):
             self._fail('invalid', datatype=type(data).__name__)
 
+        if self.compiled:
+            if self._compiled_load is None:
+                self._compiled_load = self._compile('load', self._load_fields)
+            return self.post_load(self._compiled_load(data), data)
+
         result = dict()
         errors = dict()
 
@@ -733,6 +1014,8 @@ class Schema(Field, metaclass=SchemaMeta):
                 if value is not missing:
                     result[field.field_name] = value
             except ValidationError as err:
+                if self.fail_fast:
+                    raise ValidationError({field.field_name: err})
                 errors[field.field_name] = err
 
         if errors:
@@ -741,6 +1024,11 @@ class Schema(Field, metaclass=SchemaMeta):
         return self.post_load(result, data)
 
     def _dump(self, instance):
+        if self.compiled:
+            if self._compiled_dump is None:
+                self._compiled_dump = self._compile('dump', self._dump_fields)
+            return self.post_dump(self._compiled_dump(instance), instance)
+
         result = dict()
 
         for field in self._dump_fields:
@@ -775,3 +1063,372 @@ class Schema(Field, metaclass=SchemaMeta):
 
         if d:
             raise ValidationError(d)
+
+    def _compile(self, kind, fields):
+        """
+        Returns a function specialized to dump or load the given fields.
+        The source code is generated once per schema class and set of fields.
+        :param str kind: Either `dump` or `load`.
+        :param list fields: The bound fields.
+        :return: A function that receives the instance or the data.
+        """
+        cls = self.__class__
+        factories = cls.__dict__.get('_compiled_factories')
+
+        if factories is None:
+            factories = cls._compiled_factories = {}
+
+        key = (kind, self.fail_fast) + tuple(field.field_name for field in fields)
+        factory = factories.get(key)
+
+        if factory is None:
+            if kind == 'dump':
+                factory = _compile_dump(fields)
+            else:
+                factory = _compile_load(fields, self.fail_fast)
+            factories[key] = factory
+
+        return factory(*fields)
+
+
+class NestedField(Field):
+    """
+    A field that dumps and loads objects through another schema.
+    The schema is created once and shared by all the parents,
+    by default it uses compiled functions.
+    :param schema: The schema class or instance.
+    :param bool many: `True` if the value is a list of objects.
+    :param only: The fields of the schema to be used, dotted names select nested fields.
+    :param bool compiled: `False` to not use compiled functions, `None` to use the schema default.
+    """
+    default_error_messages = {
+        'invalid': 'Not a valid list.'
+    }
+
+    def __init__(self, schema, many=False, only=None, compiled=True, **kwargs):
+        super().__init__(**kwargs)
+
+        if isinstance(schema, Schema):
+            self.schema_class = schema.__class__
+            self.only = tuple(only or schema.only) or None
+        else:
+            self.schema_class = schema
+            self.only = tuple(only) if only else None
+
+        self.many = many
+        self.compiled = compiled
+        self._schemas = {}
+
+    def __copy__(self):
+        field = super().__copy__()
+        field._schemas = {}
+        return field
+
+    def restrict(self, only):
+        """
+        Restricts the fields of the schema to the given ones,
+        used by the parent schema when its `only` has dotted names.
+        :param list only: The name of the fields.
+        """
+        only = _restrict_only(self.only, only)
+
+        # no field has an empty name, so
+        # a schema with it dumps nothing.
+        self.only = tuple(only) or ('',)
+        self._schemas = {}
+
+    def get_schema(self, partial=False, fail_fast=False):
+        """
+        Gets the shared schema used by this field.
+        :param bool partial: `True` to ignore missing fields on load.
+        :param bool fail_fast: `True` to stop at the first error on load.
+        :return: The schema instance.
+        """
+        key = (partial, fail_fast)
+        schema = self._schemas.get(key)
+
+        if schema is None:
+            schema = self.schema_class.get_cached(self.only, partial, self.compiled, fail_fast or None)
+            self._schemas[key] = schema
+
+        return schema
+
+    def _load(self, value):
+        root = self.root
+        fail_fast = getattr(root, 'fail_fast', False)
+        schema = self.get_schema(getattr(root, 'partial', False), fail_fast)
+
+        if not self.many:
+            return schema.load(value)
+
+        if not isinstance(value, list):
+            self._fail('invalid')
+
+        result = []
+        errors = {}
+
+        for idx, item in enumerate(value):
+            try:
+                result.append(schema.load(item))
+            except ValidationError as e:
+                if fail_fast:
+                    raise ValidationError({idx: e})
+                errors[idx] = e
+
+        if errors:
+            raise ValidationError(errors)
+
+        return schema.post_loads(result, value)
+
+    def _dump(self, value):
+        schema = self.get_schema()
+
+        # `None` and missing are handled by `Field.dump`,
+        # so the schema is called without going through it.
+        if not self.many:
+            return schema._dump(value)
+
+        dump = schema._dump
+        data = [None if item is None else dump(item) for item in value]
+        return schema.post_dumps(data, value)
+
+
+# conversions inlined by the compiled functions,
+# `{field}` is replaced by the field variable.
+_DUMP_CONVERSIONS = {
+    BooleanField: 'value if value is True or value is False else {field}._dump(value)',
+    FloatField: 'float(value)',
+    IntegerField: 'int(value)',
+    StringField: 'str(value)',
+}
+
+_LOAD_CONVERSIONS = {
+    BooleanField: 'value if value is True or value is False else {field}._load(value)',
+    FloatField: 'value if type(value) is float else {field}._load(value)',
+    IntegerField: 'value if type(value) is int else {field}._load(value)',
+}
+
+# the functions used to convert a whole column by `Schema.dump_columns`.
+_COLUMN_CONVERSIONS = {
+    FloatField: float,
+    IntegerField: int,
+    StringField: str,
+}
+
+
+def _restrict_only(only, names):
+    """
+    Limits the given names of fields to the ones selected by `only`,
+    see `Schema.restrict_only`.
+    """
+    if not only:
+        return list(names)
+
+    whole_names = set()
+    nested_only = {}
+
+    for name in only:
+        name, _, path = name.partition('.')
+
+        if path:
+            nested_only.setdefault(name, []).append(path)
+        else:
+            whole_names.add(name)
+
+    restricted = OrderedDict()
+
+    for name in names:
+        head, _, path = name.partition('.')
+
+        if head in whole_names:
+            restricted[name] = None
+        elif head in nested_only:
+            # without a path the whole field is requested,
+            # so it keeps the restriction of `only`.
+            paths = _restrict_only(nested_only[head], [path]) if path else nested_only[head]
+
+            for path in paths:
+                restricted[head + '.' + path] = None
+
+    return list(restricted)
+
+
+def _batch_load_numbers(field, values, convert):
+    """
+    Converts a list of numbers in one pass,
+    strings are accepted only if none of them is too large.
+    """
+    if any(issubclass(t, str) for t in set(map(type, values))):
+        if any(len(value) > field.MAX_STRING_LENGTH for value in values if isinstance(value, str)):
+            raise ValueError()
+
+    return list(map(convert, values))
+
+
+def _batch_load_integers(field, values):
+    return _batch_load_numbers(field, values, int)
+
+
+def _batch_load_floats(field, values):
+    return _batch_load_numbers(field, values, float)
+
+
+def _batch_load_booleans(field, values):
+    lookup = dict.fromkeys(field.TRUE_VALUES, True)
+    lookup.update(dict.fromkeys(field.FALSE_VALUES, False))
+    return list(map(lookup.__getitem__, values))
+
+
+def _batch_load_strings(field, values):
+    if type(None) in set(map(type, values)):
+        raise ValueError()
+
+    result = list(map(str, values))
+
+    if field.trim_whitespace:
+        result = list(map(str.strip, result))
+
+    if not field.allow_blank and '' in result:
+        raise ValueError()
+
+    return result
+
+
+# the functions used by `ListField` to load all the items at once,
+# they raise `ValueError`, `TypeError` or `KeyError` if any item is not valid.
+_BATCH_LOADS = {
+    BooleanField: _batch_load_booleans,
+    FloatField: _batch_load_floats,
+    IntegerField: _batch_load_integers,
+    StringField: _batch_load_strings,
+}
+
+
+def _compile_dump(fields):
+    """
+    Generates a factory that binds the given fields to a function
+    that dumps an instance without going through `Field.dump`.
+    :param list fields: The bound fields.
+    :return: The factory function.
+    """
+    names = ['f%d' % i for i in range(len(fields))]
+
+    def make_body(get_attribute):
+        lines = []
+
+        for name, field in zip(names, fields):
+            field_class = field.__class__
+
+            if field_class.get_attribute is not Field.get_attribute:
+                lines.append('value = %s.get_attribute(instance)' % name)
+            else:
+                lines.append('value = ' + get_attribute % repr(field.field_name))
+
+            if field_class.dump is not Field.dump:
+                lines.append('value = %s.dump(value)' % name)
+                lines.append('if value is not missing:')
+                lines.append('    result[%r] = value' % field.dump_to)
+                continue
+
+            conversion = _DUMP_CONVERSIONS.get(field_class, '{field}._dump(value)').format(field=name)
+
+            if field.default is missing:
+                lines.append('if value is not missing:')
+                lines.append('    result[%r] = None if value is None else %s' % (field.dump_to, conversion))
+            else:
+                lines.append('if value is missing:')
+                lines.append('    result[%r] = %s.get_default()' % (field.dump_to, name))
+                lines.append('else:')
+                lines.append('    result[%r] = None if value is None else %s' % (field.dump_to, conversion))
+
+        return lines or ['pass']
+
+    source = ['def make(%s):' % ', '.join(names),
+              '    def dump(instance):',
+              '        result = {}',
+              '        if isinstance(instance, dict):']
+    source.extend('            ' + line for line in make_body('instance.get(%s, missing)'))
+    source.append('        else:')
+    source.extend('            ' + line for line in make_body('getattr(instance, %s, missing)'))
+    source.append('        return result')
+    source.append('    return dump')
+
+    return _exec_factory(source)
+
+
+def _compile_load(fields, fail_fast=False):
+    """
+    Generates a factory that binds the given fields to a function
+    that loads a `dict` without going through `Field.load`.
+    :param list fields: The bound fields.
+    :param bool fail_fast: `True` to raise the first error.
+    :return: The factory function.
+    """
+    names = ['f%d' % i for i in range(len(fields))]
+
+    source = ['def make(%s):' % ', '.join(names),
+              '    def load(data):',
+              '        result = {}',
+              '        errors = None',
+              '        is_html = is_html_input(data)']
+
+    lines = []
+
+    for name, field in zip(names, fields):
+        field_class = field.__class__
+
+        lines.append('try:')
+
+        if field_class.get_value in (Field.get_value, ListField.get_value, StringField.get_value):
+            lines.append('    if is_html:')
+            lines.append('        value = %s.get_value(data)' % name)
+            lines.append('    else:')
+            lines.append('        value = data.get(%r, missing)' % field.load_from)
+        else:
+            lines.append('    value = %s.get_value(data)' % name)
+
+        if field_class.load is not Field.load:
+            lines.append('    value = %s.load(value)' % name)
+        else:
+            conversion = _LOAD_CONVERSIONS.get(field_class, '{field}._load(value)').format(field=name)
+
+            lines.append('    if value is missing or value is None:')
+            lines.append('        value = %s.load(value)' % name)
+            lines.append('    else:')
+            lines.append('        value = ' + conversion)
+
+            if field_class in _LOAD_CONVERSIONS or field_class is StringField:
+                lines.append('        if %s.validators:' % name)
+                lines.append('            %s._validate(value)' % name)
+            else:
+                lines.append('        %s._validate(value)' % name)
+
+        lines.append('    if value is not missing:')
+        lines.append('        result[%r] = value' % field.field_name)
+        lines.append('except ValidationError as err:')
+
+        if fail_fast:
+            lines.append('    raise ValidationError({%r: err})' % field.field_name)
+        else:
+            lines.append('    if errors is None:')
+            lines.append('        errors = {}')
+            lines.append('    errors[%r] = err' % field.field_name)
+
+    source.extend('        ' + line for line in lines)
+    source.append('        if errors:')
+    source.append('            raise ValidationError(errors)')
+    source.append('        return result')
+    source.append('    return load')
+
+    return _exec_factory(source)
+
+
+def _exec_factory(source):
+    """
+    Executes the generated source code and returns the `make` function.
+    :param list source: The lines of the source code.
+    :return: The factory function.
+    """
+    namespace = {'missing': missing, 'is_html_input': html.is_html_input, 'ValidationError': ValidationError}
+    exec(compile('\n'.join(source), '<compiled schema>', 'exec'), namespace)
+    return namespace['make']
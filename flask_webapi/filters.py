@@ -3,11 +3,16 @@ Provides a set of filter classes used to inject code into actions.
 """
 
 import inspect
+import zlib
 
+from collections import OrderedDict
 from flask import request
+from .caches import MemoryCache
 from .exceptions import ValidationError, UnsupportedMediaType
 from .fields import Schema
 from .results import BadRequestResult, ForbiddenResult, UnauthorizedResult, UnsupportedMediaTypeResult
+from .utils import collections
+from .utils.mimetypes import MimeType
 
 
 class Filter:
@@ -21,6 +26,12 @@ class Filter:
     # `False` to use only the last filter.
     allow_multiple = True
 
+    # `True` if the sync methods that receive `next_filter` can be used
+    # on async actions, where `next_filter` returns an awaitable
+    # that they return instead of running code after it.
+    # `False` to allow only async methods on async actions.
+    async_compatible = False
+
     def __init__(self, order=-1):
         self.order = order
 
@@ -110,6 +121,22 @@ class ResultFilter(Filter):
         pass
 
 
+class _Continuation:
+    """
+    An awaitable that calls a function after the given awaitable,
+    used by sync filters to run code after the next filter of async actions.
+    :param awaitable: The awaitable returned by the next filter.
+    :param func: The function without arguments to be called.
+    """
+    def __init__(self, awaitable, func):
+        self.awaitable = awaitable
+        self.func = func
+
+    def __await__(self):
+        yield from self.awaitable.__await__()
+        self.func()
+
+
 ####################################################
 # Below are the implementation of the above filters.
 ####################################################
@@ -174,7 +201,7 @@ class AuthorizeFilter(AuthorizationFilter):
         """
         # if there is an `AllowAnonymous` filter
         # we don't apply authorization.
-        if [f for f in context.filters if isinstance(f, AllowAnonymous)]:
+        if [f for f in context.get_filters() if isinstance(f, AllowAnonymous)]:
             return
 
         for permission in self.permissions:
@@ -190,6 +217,8 @@ class AuthorizeFilter(AuthorizationFilter):
 class CompatFilter(ResourceFilter):
     """
     A filter that apply a decorator built for Flask.
+    The decorator calls the action synchronously,
+    so the filter cannot be used on async actions.
 
     >>> from flask.ext.cache import Cache
     >>> cache = Cache(...)
@@ -224,6 +253,370 @@ class CompatFilter(ResourceFilter):
         return context.response
 
 
+class CacheFilter(ResourceFilter):
+    """
+    A filter that caches the responses rendered by the action,
+    so that identical requests skip the action and the output formatter.
+
+    The responses are cached by endpoint, view arguments, query parameters
+    and the output mimetype negotiated for the request, plus the request headers
+    named by `vary_headers` and by the `Vary` header of the response.
+    Only successful responses to GET and HEAD requests are cached.
+
+    Requests with the `Authorization` or `Cookie` headers, or from an
+    authenticated user, are not cached unless the header is in `vary_headers`
+    or `key_func` is given, so a response is never served to another user.
+    Responses that set cookies or are marked as private are not cached either.
+
+    >>> @route('/users')
+    >>> @cache(timeout=60, query_params=['page'])
+    >>> def get_users():
+
+    >>> @route('/me')
+    >>> @cache(key_func=lambda context: request.user.id)
+    >>> def get_me():
+
+    :param int timeout: The number of seconds the responses are cached, `None` for the cache default.
+    :param list query_params: The query parameters that vary the response, `None` for all of them.
+    :param Cache cache: The storage of the responses, a `MemoryCache` by default.
+    :param list vary_headers: The request headers that vary the response.
+    :param key_func: A function called with the action context that returns
+                     a value added to the key, e.g. the id of the user.
+    :param int order: The order in which the filter is executed.
+    """
+
+    allow_multiple = False
+
+    async_compatible = True
+
+    cacheable_methods = ('GET', 'HEAD')
+
+    # the request headers that identify the user.
+    private_headers = ('Authorization', 'Cookie')
+
+    def __init__(self, timeout=None, query_params=None, cache=None, vary_headers=None, key_func=None, order=-1):
+        super().__init__(order)
+        self.timeout = timeout
+        self.query_params = query_params
+        self.cache = cache or MemoryCache()
+        self.vary_headers = [header.lower() for header in vary_headers or ()]
+        self.key_func = key_func
+
+    def on_resource_execution(self, context, next_filter):
+        if request.method not in self.cacheable_methods or self.is_private(context):
+            next_filter(context)
+            return
+
+        key = self.get_key(context)
+
+        if key is None:
+            next_filter(context)
+            return
+
+        cached = self._lookup(key)
+
+        if cached is not None:
+            status_code, headers, data = cached
+            context.response = context.app.response_class(data, status=status_code, headers=headers)
+            return
+
+        result = next_filter(context)
+
+        # in async actions the next filter has to be awaited
+        # before the response is available.
+        if inspect.isawaitable(result):
+            return _Continuation(result, lambda: self._store(context, key))
+
+        self._store(context, key)
+
+    def is_private(self, context):
+        """
+        Checks if the current request belongs to a user and its response
+        cannot be shared with other users.
+        :param ActionContext context: The action context.
+        :return: `True` if the response must not be cached.
+        """
+        if self.key_func is not None:
+            return False
+
+        if getattr(request, 'user', None):
+            return True
+
+        return any(header in request.headers and header.lower() not in self.vary_headers
+                   for header in self.private_headers)
+
+    def get_key(self, context):
+        """
+        Gets the key of the response for the current request.
+        :param ActionContext context: The action context.
+        :return: The key as `str` or `None` if the response cannot be cached.
+        """
+        formatter_pair = context.content_negotiator.select_output_formatter(context.get_output_formatters())
+
+        if formatter_pair is None:
+            return None
+
+        _, mimetype = formatter_pair
+
+        if self.query_params is None:
+            query = sorted(request.args.items(multi=True))
+        else:
+            query = [(name, request.args.getlist(name)) for name in self.query_params]
+
+        # the accept encoding is part of the key as
+        # the response may be compressed by `CompressionFilter`.
+        encoding = request.headers.get('Accept-Encoding', '')
+
+        key = '%s|%r|%r|%s|%s|%r' % (request.endpoint, sorted(context.kwargs.items()), query, mimetype, encoding,
+                                     self._get_header_values(self.vary_headers))
+
+        if self.key_func is not None:
+            key += '|%r' % (self.key_func(context),)
+
+        return key
+
+    def _get_header_values(self, headers):
+        """
+        Gets the values of the given request headers.
+        :param list headers: The name of the headers.
+        :return: A list of values.
+        """
+        return [request.headers.get(header, '') for header in headers]
+
+    def _lookup(self, key):
+        """
+        Gets the cached response for the current request.
+        :param str key: The key of the response.
+        :return: A tuple with status code, headers and body or `None` if it is not cached.
+        """
+        # the key stores the headers named by the `Vary` header of
+        # the response and the response itself when there are none.
+        cached = self.cache.get(key)
+
+        if cached is None:
+            return None
+
+        vary, response = cached
+
+        if vary:
+            response = self.cache.get('%s|%r' % (key, self._get_header_values(vary)))
+
+        return response
+
+    def _store(self, context, key):
+        """
+        Stores the response of the current request if it can be cached.
+        :param ActionContext context: The action context.
+        :param str key: The key of the response.
+        """
+        response = context.response
+
+        if response.status_code != 200 or response.is_streamed or 'Set-Cookie' in response.headers:
+            return
+
+        if response.cache_control.private or response.cache_control.no_store:
+            return
+
+        vary = tuple(response.vary)
+
+        if '*' in vary:
+            return
+
+        cached = (response.status_code, list(response.headers), response.get_data())
+
+        if vary:
+            self.cache.set('%s|%r' % (key, self._get_header_values(vary)), cached, self.timeout)
+            self.cache.set(key, (vary, None), self.timeout)
+        else:
+            self.cache.set(key, ((), cached), self.timeout)
+
+
+class ETagFilter(ResourceFilter):
+    """
+    A filter that sets a strong ETag on successful responses to GET and HEAD
+    requests and answers 304 Not Modified when the request's `If-None-Match` matches.
+
+    By default the ETag is a hash of the body produced by the output formatter.
+    When `etag_func` is given, it is called with the arguments of the action
+    before the action runs, so an unchanged resource skips the action and
+    the output formatter entirely.
+
+    >>> @route('/users/<int:id>')
+    >>> @etag(lambda id: get_user_version(id))
+    >>> def get_user(id):
+
+    :param etag_func: A function that returns the ETag of the resource, or `None` to hash the body.
+    :param int order: The order in which the filter is executed.
+    """
+
+    allow_multiple = False
+
+    async_compatible = True
+
+    def __init__(self, etag_func=None, order=-1):
+        super().__init__(order)
+        self.etag_func = etag_func
+
+    def on_resource_execution(self, context, next_filter):
+        if request.method not in ('GET', 'HEAD'):
+            next_filter(context)
+            return
+
+        etag = None
+
+        if self.etag_func:
+            etag = self.etag_func(*context.args, **context.kwargs)
+
+            if etag is not None and request.if_none_match.contains_weak(etag):
+                context.response = context.app.response_class(status=304)
+                context.response.set_etag(etag)
+                return
+
+        result = next_filter(context)
+
+        # in async actions the next filter has to be awaited
+        # before the response is available.
+        if inspect.isawaitable(result):
+            return _Continuation(result, lambda: self._set_etag(context, etag))
+
+        self._set_etag(context, etag)
+
+    def _set_etag(self, context, etag):
+        """
+        Sets the ETag of the response and turns it into 304 Not Modified if it matches.
+        :param ActionContext context: The action context.
+        :param str etag: The ETag returned by `etag_func` or `None` to hash the body.
+        """
+        response = context.response
+
+        if response.status_code != 200 or response.is_streamed:
+            return
+
+        if etag is None:
+            response.add_etag()
+        else:
+            response.set_etag(etag)
+
+        response.make_conditional(request.environ)
+
+
+class CompressionFilter(ResultFilter):
+    """
+    A filter that compresses the body written by the output formatter
+    with gzip or deflate, as negotiated from the `Accept-Encoding` header.
+    Streamed responses are compressed incrementally, chunk by chunk.
+
+    >>> api.filters.append(CompressionFilter(min_size=1024))
+
+    :param int min_size: The minimum size in bytes of the body to be compressed,
+                         streamed responses are always compressed.
+    :param int level: The compression level, from 1 (fastest) to 9 (smallest).
+    :param int order: The order in which the filter is executed.
+    """
+
+    allow_multiple = False
+
+    async_compatible = True
+
+    # the encodings supported, ordered by preference
+    # with the `wbits` argument used by `zlib`.
+    encodings = OrderedDict([('gzip', 16 + zlib.MAX_WBITS), ('deflate', zlib.MAX_WBITS)])
+
+    # media types that are compressed already.
+    compressed_mimetypes = ('image/*', 'video/*', 'audio/*', 'application/zip', 'application/gzip',
+                            'application/x-gzip', 'application/x-bzip2', 'application/x-7z-compressed',
+                            'application/pdf')
+
+    def __init__(self, min_size=500, level=6, order=-1):
+        super().__init__(order)
+        self.min_size = min_size
+        self.level = level
+
+    def on_result_execution(self, context, next_filter):
+        result = next_filter(context)
+
+        # in async actions the next filter has to be awaited
+        # before the response is available.
+        if inspect.isawaitable(result):
+            return _Continuation(result, lambda: self._compress(context))
+
+        self._compress(context)
+
+    def _compress(self, context):
+        """
+        Compresses the response body if the client accepts it.
+        :param ActionContext context: The action context.
+        """
+        response = context.response
+
+        if not self._is_compressible(response):
+            return
+
+        encoding = request.accept_encodings.best_match(self.encodings)
+
+        if encoding is None:
+            return
+
+        wbits = self.encodings[encoding]
+
+        if response.is_streamed:
+            response.response = self._iter_compress(response.response, response.iter_encoded(), wbits)
+            response.headers.pop('Content-Length', None)
+        else:
+            data = response.get_data()
+
+            if len(data) < self.min_size:
+                return
+
+            compressor = zlib.compressobj(self.level, zlib.DEFLATED, wbits)
+            response.set_data(compressor.compress(data) + compressor.flush())
+
+        response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+
+    def _is_compressible(self, response):
+        """
+        Checks whether the response has a body that is worth compressing.
+        :param response: The flask response instance.
+        :return: True if the response can be compressed.
+        """
+        if response.status_code < 200 or response.status_code in (204, 304):
+            return False
+
+        if 'Content-Encoding' in response.headers or response.direct_passthrough:
+            return False
+
+        mimetype = MimeType.parse(response.mimetype or '')
+
+        for compressed_mimetype in self.compressed_mimetypes:
+            if mimetype.match(MimeType.parse(compressed_mimetype)):
+                return False
+
+        return True
+
+    def _iter_compress(self, iterable, chunks, wbits):
+        """
+        Compresses the given chunks incrementally.
+        :param iterable: The original iterable of the response, closed at the end.
+        :param chunks: An iterable of bytes.
+        :param int wbits: The `wbits` argument of the encoding.
+        :return: A generator of compressed bytes.
+        """
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, wbits)
+
+        try:
+            for chunk in chunks:
+                data = compressor.compress(chunk)
+
+                if data:
+                    yield data
+
+            yield compressor.flush()
+        finally:
+            if hasattr(iterable, 'close'):
+                iterable.close()
+
+
 class ConsumeFilter(ResourceFilter):
     """
     A filter that specifies the supported request content types
@@ -233,13 +626,15 @@ class ConsumeFilter(ResourceFilter):
 
     allow_multiple = False
 
+    async_compatible = True
+
     def __init__(self, content_type, order=-1):
         super().__init__(order)
         self.content_type = content_type
 
     def on_resource_execution(self, context, next_filter):
         request.environ['CONTENT_TYPE'] = self.content_type
-        next_filter(context)
+        return next_filter(context)
 
 
 class ProduceFilter(ResultFilter):
@@ -251,13 +646,15 @@ class ProduceFilter(ResultFilter):
 
     allow_multiple = False
 
+    async_compatible = True
+
     def __init__(self, *content_types, order=-1):
         super().__init__(order)
         self.content_type = ';'.join(content_types)
 
     def on_result_execution(self, context, next_filter):
         request.environ['HTTP_ACCEPT'] = self.content_type
-        next_filter(context)
+        return next_filter(context)
 
 
 class ParameterFilter(ActionFilter):
@@ -267,6 +664,9 @@ class ParameterFilter(ActionFilter):
     :param Field field: The field used to parse the argument.
     :param str location: The location from where to retrieve the value.
     """
+
+    async_compatible = True
+
     def __init__(self, name, field, location=None, order=-1):
         super().__init__(order)
 
@@ -291,7 +691,10 @@ class ParameterFilter(ActionFilter):
             context.result = BadRequestResult(str(e))
         else:
             try:
-                result = self.field.load(data)
+                if self.is_schema and collections.is_iterator(data):
+                    result = self._iter_load(data)
+                else:
+                    result = self.field.load(data)
 
                 if self.is_schema:
                     context.kwargs[self.name] = result
@@ -304,7 +707,18 @@ class ParameterFilter(ActionFilter):
                 if errors:
                     raise ValidationError(errors)
 
-        next_filter(context)
+        return next_filter(context)
+
+    def _iter_load(self, data):
+        """
+        Loads the items produced lazily by an input formatter as the action consumes them.
+        :param data: An iterator of items.
+        :return: A generator of loaded items.
+        """
+        try:
+            yield from self.field.iter_loads(data)
+        except ValueError as e:
+            raise ValidationError(str(e))
 
     def _get_arguments(self, context):
         """
@@ -316,7 +730,7 @@ class ParameterFilter(ActionFilter):
         else:
             location = self.location
 
-        provider = context.value_providers.get(location)
+        provider = context.get_value_providers().get(location)
 
         if provider is None:
             raise Exception('Value provider for location "%s" not found.' % location)
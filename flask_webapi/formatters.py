@@ -2,27 +2,134 @@
 Provides a set of formatters to read and write content from/to the request/response body.
 """
 
+import csv
+import io
+import itertools
+import json as std_json
 import pickle
 
 from abc import ABCMeta, abstractmethod
+from datetime import date, datetime, time
+from decimal import Decimal
 from flask import json
+from uuid import UUID
+from .exceptions import ValidationError
+from .utils import collections, msgpack as pure_msgpack
 from .utils.mimetypes import MimeType
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def get_default_input_formatters():
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def get_default_input_formatters(json_backend=None):
     """
     Gets all instances of input formatters.
+    :param JsonBackend json_backend: The backend used by the JSON formatter.
     :return: A list of input formatters.
     """
-    return [JsonInputFormatter(), FormInputFormatter()]
+    return [JsonInputFormatter(json_backend), FormInputFormatter()]
 
 
-def get_default_output_formatters():
+def get_default_output_formatters(json_backend=None):
     """
     Gets all instances of output formatters.
+    :param JsonBackend json_backend: The backend used by the JSON formatter.
     :return: A list of output formatters.
     """
-    return [JsonOutputFormatter()]
+    return [JsonOutputFormatter(json_backend)]
+
+
+class JsonBackend(metaclass=ABCMeta):
+    """
+    A base class from which all JSON backend classes should inherit.
+    """
+
+    @abstractmethod
+    def dumps(self, data, indent=None, encoding='utf-8'):
+        """
+        Encodes the given data into JSON.
+        :param data: The data to be encoded.
+        :param int indent: The indent, `None` for the compact representation.
+        :param str encoding: The encoding of the output.
+        :return: The JSON as `bytes`.
+        """
+
+    @abstractmethod
+    def loads(self, data, encoding='utf-8'):
+        """
+        Decodes the given JSON.
+        :param bytes data: The JSON to be decoded.
+        :param str encoding: The encoding of the input.
+        :return: The data decoded.
+        """
+
+
+class FlaskJsonBackend(JsonBackend):
+    """
+    A `JsonBackend` that uses `flask.json`, honoring the JSON encoder
+    and decoder set on the Flask application.
+    """
+
+    def dumps(self, data, indent=None, encoding='utf-8'):
+        return json.dumps(data, indent=indent).encode(encoding)
+
+    def loads(self, data, encoding='utf-8'):
+        return json.loads(data, encoding=encoding)
+
+
+class StdlibJsonBackend(JsonBackend):
+    """
+    A `JsonBackend` that uses the standard `json` module.
+    :param encoder_class: A custom `json.JSONEncoder` class.
+    :param decoder_class: A custom `json.JSONDecoder` class.
+    """
+
+    def __init__(self, encoder_class=None, decoder_class=None):
+        self.encoder_class = encoder_class
+        self.decoder_class = decoder_class
+
+    def dumps(self, data, indent=None, encoding='utf-8'):
+        return std_json.dumps(data, indent=indent, cls=self.encoder_class).encode(encoding)
+
+    def loads(self, data, encoding='utf-8'):
+        return std_json.loads(data.decode(encoding), cls=self.decoder_class)
+
+
+class OrjsonBackend(JsonBackend):
+    """
+    A `JsonBackend` that uses the C-accelerated `orjson` library.
+    As `orjson` only supports an indent of 2 spaces, any indent is encoded with 2 spaces.
+    :param default: A function called for objects that `orjson` cannot encode.
+    """
+
+    def __init__(self, default=None):
+        if orjson is None:
+            raise ImportError('OrjsonBackend requires the orjson library.')
+
+        self.default = default
+
+    def dumps(self, data, indent=None, encoding='utf-8'):
+        option = orjson.OPT_INDENT_2 if indent else 0
+        data = orjson.dumps(data, default=self.default, option=option)
+
+        # orjson always encodes to utf-8.
+        if encoding.lower().replace('-', '') != 'utf8':
+            data = data.decode('utf-8').encode(encoding)
+
+        return data
+
+    def loads(self, data, encoding='utf-8'):
+        if encoding.lower().replace('-', '') != 'utf8':
+            data = data.decode(encoding)
+
+        return orjson.loads(data)
 
 
 class InputFormatter(metaclass=ABCMeta):
@@ -49,6 +156,10 @@ class OutputFormatter(metaclass=ABCMeta):
 
     mimetype = None
 
+    # `True` if `write` and `write_stream` receive
+    # the schema of the result as the `schema` argument.
+    schema_aware = False
+
     @abstractmethod
     def write(self, response, data, mimetype=None):
         """
@@ -58,6 +169,17 @@ class OutputFormatter(metaclass=ABCMeta):
         :param MimeType mimetype: The content type.
         """
 
+    def write_stream(self, response, items, mimetype=None):
+        """
+        Writes the given items into response body as a collection.
+        Subclasses can override it to encode the items incrementally,
+        by default the items are materialized and passed to `write`.
+        :param response: The flask response instance.
+        :param items: An iterable of items to be written into body.
+        :param MimeType mimetype: The content type.
+        """
+        self.write(response, list(items), mimetype)
+
 
 class FormInputFormatter(InputFormatter):
     """
@@ -79,10 +201,14 @@ class FormInputFormatter(InputFormatter):
 class JsonInputFormatter(InputFormatter):
     """
     An `InputFormatter` for JSON content.
+    :param JsonBackend backend: The backend used to decode JSON, `flask.json` by default.
     """
 
     mimetype = MimeType.parse('application/json')
 
+    def __init__(self, backend=None):
+        self.backend = backend or FlaskJsonBackend()
+
     def read(self, request, mimetype=None):
         """
         Reads a `dict` object from the request body.
@@ -94,16 +220,23 @@ class JsonInputFormatter(InputFormatter):
             mimetype = self.mimetype
 
         encoding = mimetype.params.get('charset', 'utf-8')
-        return json.loads(request.get_data(), encoding=encoding)
+        return self.backend.loads(request.get_data(), encoding=encoding)
 
 
 class JsonOutputFormatter(OutputFormatter):
     """
     An `OutputFormatter` for JSON content.
+    :param JsonBackend backend: The backend used to encode JSON, `flask.json` by default.
     """
 
     mimetype = MimeType.parse('application/json')
 
+    # the minimum size in bytes of each chunk written by `write_stream`.
+    chunk_size = 8192
+
+    def __init__(self, backend=None):
+        self.backend = backend or FlaskJsonBackend()
+
     def write(self, response, data, mimetype=None):
         """
         Writes the given data into response body.
@@ -116,9 +249,53 @@ class JsonOutputFormatter(OutputFormatter):
 
         indent = self.get_indent(mimetype)
         encoding = mimetype.params.get('charset', 'utf-8')
-        response.set_data(json.dumps(data, indent=indent).encode(encoding))
+        response.set_data(self.backend.dumps(data, indent=indent, encoding=encoding))
+        response.content_type = str(mimetype)
+
+    def write_stream(self, response, items, mimetype=None):
+        """
+        Writes the given items into response body as a JSON array
+        encoded incrementally while the response is sent.
+        :param response: The flask response instance.
+        :param items: An iterable of items to be written into body.
+        :param MimeType mimetype: The content type.
+        """
+        if not mimetype:
+            mimetype = self.mimetype
+
+        indent = self.get_indent(mimetype)
+        encoding = mimetype.params.get('charset', 'utf-8')
+        response.response = self._iter_encode(items, indent, encoding)
         response.content_type = str(mimetype)
 
+    def _iter_encode(self, items, indent, encoding):
+        """
+        Encodes the items as a JSON array, yielding chunks of at least `chunk_size` bytes.
+        :param items: An iterable of items.
+        :param int indent: The indent used to encode each item.
+        :param str encoding: The encoding of the chunks.
+        :return: A generator of bytes.
+        """
+        dumps = self.backend.dumps
+        chunk = [b'[']
+        size = 1
+        separator = b''
+
+        for item in items:
+            data = separator + dumps(item, indent=indent, encoding=encoding)
+            separator = b','
+
+            chunk.append(data)
+            size += len(data)
+
+            if size >= self.chunk_size:
+                yield b''.join(chunk)
+                chunk = []
+                size = 0
+
+        chunk.append(b']')
+        yield b''.join(chunk)
+
     def get_indent(self, mimetype):
         """
         Gets the indent parameter from the mimetype.
@@ -136,6 +313,224 @@ class JsonOutputFormatter(OutputFormatter):
             return None
 
 
+class NdjsonInputFormatter(InputFormatter):
+    """
+    An `InputFormatter` for newline delimited JSON content.
+    The request stream is read line by line and the items are decoded
+    lazily, so the body is never fully loaded into memory.
+    :param JsonBackend backend: The backend used to decode JSON, `flask.json` by default.
+    """
+
+    mimetype = MimeType.parse('application/x-ndjson')
+
+    def __init__(self, backend=None):
+        self.backend = backend or FlaskJsonBackend()
+
+    def read(self, request, mimetype=None):
+        """
+        Reads the items from the request body.
+        :param request: The request containing the data.
+        :param MimeType mimetype: The mimetype chose to read the data.
+        :return: A generator of `dict` instances.
+        """
+        if not mimetype:
+            mimetype = self.mimetype
+
+        encoding = mimetype.params.get('charset', 'utf-8')
+        return self._iter_decode(request.stream, encoding)
+
+    def _iter_decode(self, stream, encoding):
+        """
+        Decodes each non-empty line of the given stream.
+        Raises `ValidationError` keyed by the index of the item if a line is not valid JSON,
+        the index is the same used to report the items that fail validation.
+        :param stream: The stream of lines.
+        :param str encoding: The encoding of the lines.
+        :return: A generator of decoded items.
+        """
+        loads = self.backend.loads
+        index = 0
+
+        for line in stream:
+            line = line.strip()
+
+            if not line:
+                continue
+
+            try:
+                item = loads(line, encoding=encoding)
+            except ValueError as e:
+                raise ValidationError({index: 'Invalid JSON: %s' % e})
+
+            yield item
+            index += 1
+
+
+class NdjsonOutputFormatter(OutputFormatter):
+    """
+    An `OutputFormatter` for newline delimited JSON content,
+    each item of a collection is written as one line.
+    :param JsonBackend backend: The backend used to encode JSON, `flask.json` by default.
+    """
+
+    mimetype = MimeType.parse('application/x-ndjson')
+
+    # the minimum size in bytes of the chunks yielded by a streamed response.
+    chunk_size = 8192
+
+    def __init__(self, backend=None):
+        self.backend = backend or FlaskJsonBackend()
+
+    def write(self, response, data, mimetype=None):
+        """
+        Writes the given data into response body.
+        :param response: The flask response instance.
+        :param data: The data to be written into body.
+        :param MimeType mimetype: The content type.
+        """
+        if not mimetype:
+            mimetype = self.mimetype
+
+        if not collections.is_collection(data):
+            data = [data]
+
+        encoding = mimetype.params.get('charset', 'utf-8')
+        response.set_data(b''.join(self._iter_encode(data, encoding)))
+        response.content_type = str(mimetype)
+
+    def write_stream(self, response, items, mimetype=None):
+        """
+        Writes the given items into response body, one line per item,
+        encoded incrementally while the response is sent.
+        :param response: The flask response instance.
+        :param items: An iterable of items to be written into body.
+        :param MimeType mimetype: The content type.
+        """
+        if not mimetype:
+            mimetype = self.mimetype
+
+        encoding = mimetype.params.get('charset', 'utf-8')
+        response.response = self._iter_encode(items, encoding)
+        response.content_type = str(mimetype)
+
+    def _iter_encode(self, items, encoding):
+        """
+        Encodes the items as lines, yielding chunks of at least `chunk_size` bytes.
+        :param items: An iterable of items.
+        :param str encoding: The encoding of the chunks.
+        :return: A generator of bytes.
+        """
+        dumps = self.backend.dumps
+        newline = '\n'.encode(encoding)
+        chunk = []
+        size = 0
+
+        for item in items:
+            data = dumps(item, encoding=encoding) + newline
+
+            chunk.append(data)
+            size += len(data)
+
+            if size >= self.chunk_size:
+                yield b''.join(chunk)
+                chunk = []
+                size = 0
+
+        if chunk:
+            yield b''.join(chunk)
+
+
+class CsvOutputFormatter(OutputFormatter):
+    """
+    An `OutputFormatter` for CSV content, each item is written as a row.
+    The columns are the fields dumped by the result schema in their declared order,
+    without schema they are the keys of the first item.
+    The rows are encoded incrementally while the response is sent.
+    """
+
+    mimetype = MimeType.parse('text/csv')
+
+    schema_aware = True
+
+    # the minimum size in bytes of the chunks yielded by the response.
+    chunk_size = 8192
+
+    def write(self, response, data, mimetype=None, schema=None):
+        """
+        Writes the given data into response body.
+        :param response: The flask response instance.
+        :param data: The data to be written into body.
+        :param MimeType mimetype: The content type.
+        :param Schema schema: The schema used to dump the data.
+        """
+        if not collections.is_collection(data):
+            data = [data]
+
+        self.write_stream(response, data, mimetype, schema)
+
+    def write_stream(self, response, items, mimetype=None, schema=None):
+        """
+        Writes the given items into response body, one row per item.
+        :param response: The flask response instance.
+        :param items: An iterable of items to be written into body.
+        :param MimeType mimetype: The content type.
+        :param Schema schema: The schema used to dump the items.
+        """
+        if not mimetype:
+            mimetype = self.mimetype
+
+        items = iter(items)
+
+        if schema is None:
+            first_item = next(items, None)
+
+            if first_item is None:
+                columns = []
+            else:
+                columns = list(first_item)
+                items = itertools.chain([first_item], items)
+        else:
+            columns = self.get_columns(schema)
+
+        encoding = mimetype.params.get('charset', 'utf-8')
+        response.response = self._iter_encode(items, columns, encoding)
+        response.content_type = str(mimetype)
+
+    def get_columns(self, schema):
+        """
+        Gets the columns from the fields dumped by the given schema.
+        :param Schema schema: The schema.
+        :return: A list with the name of the columns.
+        """
+        return [field.dump_to for field in schema._dump_fields]
+
+    def _iter_encode(self, items, columns, encoding):
+        """
+        Encodes the header and the items as rows, yielding chunks of at least `chunk_size` bytes.
+        :param items: An iterable of `dict` instances.
+        :param list columns: The columns of the rows.
+        :param str encoding: The encoding of the chunks.
+        :return: A generator of bytes.
+        """
+        if not columns:
+            return
+
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, columns, extrasaction='ignore')
+        writer.writeheader()
+
+        for item in items:
+            writer.writerow(item)
+
+            if buffer.tell() >= self.chunk_size:
+                yield buffer.getvalue().encode(encoding)
+                buffer.seek(0)
+                buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue().encode(encoding)
+
+
 class PickleInputFormatter(InputFormatter):
     """
     An `InputFormatter` for JSON content.
@@ -176,3 +571,74 @@ class PickleOutputFormatter(OutputFormatter):
 
         response.set_data(pickle.dumps(data))
         response.content_type = str(mimetype)
+
+
+class MessagePackInputFormatter(InputFormatter):
+    """
+    An `InputFormatter` for MessagePack content.
+    Uses the `msgpack` library if it is installed, otherwise a pure-Python decoder.
+    """
+
+    mimetype = MimeType.parse('application/msgpack')
+
+    def read(self, request, mimetype=None):
+        """
+        Reads a `dict` object from the request body.
+        :param request: The request containing the data.
+        :param MimeType mimetype: The mimetype chose to read the data.
+        :return: A `dict` instance.
+        """
+        data = request.get_data()
+
+        if msgpack is None:
+            return pure_msgpack.unpackb(data)
+
+        try:
+            return msgpack.unpackb(data, raw=False)
+        except Exception as e:
+            raise ValueError('Invalid MessagePack data: %s' % e)
+
+
+class MessagePackOutputFormatter(OutputFormatter):
+    """
+    An `OutputFormatter` for MessagePack content.
+    Uses the `msgpack` library if it is installed, otherwise a pure-Python encoder.
+
+    Text is encoded as the `str` type and bytes as the `bin` type,
+    dates, times, decimals and uuids that are not dumped by a schema
+    are encoded as strings, the same way the schema fields dump them.
+    """
+
+    mimetype = MimeType.parse('application/msgpack')
+
+    def write(self, response, data, mimetype=None):
+        """
+        Writes the given data into response body.
+        :param response: The flask response instance.
+        :param data: The data to be written into body.
+        :param MimeType mimetype: The content type.
+        """
+        if not mimetype:
+            mimetype = self.mimetype
+
+        if msgpack is None:
+            data = pure_msgpack.packb(data, default=self.default)
+        else:
+            data = msgpack.packb(data, default=self.default, use_bin_type=True)
+
+        response.set_data(data)
+        response.content_type = str(mimetype)
+
+    def default(self, obj):
+        """
+        Converts an object that MessagePack cannot encode.
+        :param obj: The object to be converted.
+        :return: An object that can be encoded.
+        """
+        if isinstance(obj, (datetime, date, time)):
+            return obj.isoformat()
+
+        if isinstance(obj, (Decimal, UUID)):
+            return str(obj)
+
+        raise TypeError('Object of type %s is not MessagePack serializable' % type(obj).__name__)
@@ -1,7 +1,8 @@
+import asyncio
 import traceback
 
-from flask import current_app, request
-from flask_webapi.utils.mimetypes import MimeType
+
+from flask import current_app, request, stream_with_context
 from werkzeug.exceptions import HTTPException
 from . import filters, results, status
 from .exceptions import APIException
@@ -13,31 +14,174 @@ class ActionContext:
     Represents a func in the View that should be
     treated as a Flask view.
 
+    The filters, formatters and value providers are shared with
+    the `WebAPI` and copied only when they are accessed through
+    the attributes of this class, so they can be changed for a
+    single request. The response is created on first access.
+    The filters added during the request are executed from
+    the next stage of the pipeline on.
+
     :param WebAPI api: The Flask WebAPI instance.
     :param ActionDescriptor descriptor: The action descriptor.
     :param tuple args: The list of arguments provided by Flask.
     :param dict kwargs: The dict of arguments provided by Flask.
     """
 
+    __slots__ = ('api', 'app', 'descriptor', 'content_negotiator', 'object_result_factory',
+                 'object_result_executor', 'args', 'kwargs', 'result', 'exception', 'exception_handled',
+                 '_filters', '_input_formatters', '_output_formatters', '_value_providers', '_response',
+                 '_memoized', '_pipeline')
+
     def __init__(self, api, descriptor, args, kwargs):
         self.api = api
         self.app = api.app
         self.descriptor = descriptor
 
+        self.content_negotiator = api.content_negotiator
         self.object_result_factory = api.object_result_factory
         self.object_result_executor = api.object_result_executor
 
-        self.filters = list(descriptor.filters)
-        self.input_formatters = list(api.input_formatters)
-        self.output_formatters = list(api.output_formatters)
-        self.value_providers = dict(api.value_providers)
+        self._filters = None
+        self._input_formatters = None
+        self._output_formatters = None
+        self._value_providers = None
+        self._response = None
+        self._memoized = None
+        self._pipeline = None
 
         self.args = args
         self.kwargs = kwargs
         self.result = None
         self.exception = None
         self.exception_handled = False
-        self.response = self.app.response_class()
+
+    @property
+    def filters(self):
+        """
+        The filters of this request.
+        """
+        if self._filters is None:
+            self._filters = list(self.descriptor.filters)
+        return self._filters
+
+    @filters.setter
+    def filters(self, value):
+        self._filters = value
+
+    @property
+    def input_formatters(self):
+        """
+        The input formatters of this request.
+        """
+        if self._input_formatters is None:
+            self._input_formatters = list(self.api.input_formatters)
+        return self._input_formatters
+
+    @input_formatters.setter
+    def input_formatters(self, value):
+        self._input_formatters = value
+
+    @property
+    def output_formatters(self):
+        """
+        The output formatters of this request.
+        """
+        if self._output_formatters is None:
+            self._output_formatters = list(self.api.output_formatters)
+        return self._output_formatters
+
+    @output_formatters.setter
+    def output_formatters(self, value):
+        self._output_formatters = value
+
+    @property
+    def value_providers(self):
+        """
+        The value providers of this request.
+        """
+        if self._value_providers is None:
+            self._value_providers = dict(self.api.value_providers)
+        return self._value_providers
+
+    @value_providers.setter
+    def value_providers(self, value):
+        self._value_providers = value
+
+    @property
+    def response(self):
+        """
+        The response of this request.
+        """
+        if self._response is None:
+            self._response = self.app.response_class()
+        return self._response
+
+    @response.setter
+    def response(self, value):
+        self._response = value
+
+    def memoize(self, key, factory):
+        """
+        Returns the value stored under the given key for this request,
+        calling `factory` to create it the first time.
+        :param key: The key of the value, e.g the value provider.
+        :param factory: A function without arguments that creates the value.
+        :return: The value.
+        """
+        if self._memoized is None:
+            self._memoized = {}
+        elif key in self._memoized:
+            return self._memoized[key]
+
+        value = self._memoized[key] = factory()
+        return value
+
+    def get_filters(self):
+        """
+        Returns the filters without copying them, the list must not be changed.
+        :return: A list of filters.
+        """
+        return self.descriptor.filters if self._filters is None else self._filters
+
+    def get_pipeline(self):
+        """
+        Returns the filter pipeline of this request, the one of the action
+        unless the filters were changed for this request.
+        :return: A `FilterPipeline`.
+        """
+        pipeline = self._pipeline or self.descriptor.pipeline
+
+        if self._filters is None or self._filters == pipeline.filters:
+            return pipeline
+
+        if self.descriptor.is_async:
+            executor = self.api.async_action_executor
+        else:
+            executor = self.api.action_executor
+
+        self._pipeline = executor.create_pipeline(self._filters)
+        return self._pipeline
+
+    def get_input_formatters(self):
+        """
+        Returns the input formatters without copying them, the list must not be changed.
+        :return: A list of input formatters.
+        """
+        return self.api.input_formatters if self._input_formatters is None else self._input_formatters
+
+    def get_output_formatters(self):
+        """
+        Returns the output formatters without copying them, the list must not be changed.
+        :return: A list of output formatters.
+        """
+        return self.api.output_formatters if self._output_formatters is None else self._output_formatters
+
+    def get_value_providers(self):
+        """
+        Returns the value providers without copying them, the dict must not be changed.
+        :return: A dict of value providers.
+        """
+        return self.api.value_providers if self._value_providers is None else self._value_providers
 
 
 class ActionDescriptor:
@@ -47,7 +191,9 @@ class ActionDescriptor:
     def __init__(self):
         self.func = None
         self.view_class = None
+        self.is_async = False
         self.filters = []
+        self.pipeline = None
 
 
 class ActionDescriptorBuilder:
@@ -64,10 +210,12 @@ class ActionDescriptorBuilder:
         :param WebAPI api: The Flask WebAPI.
         :return: The instance of `ActionDescriptor`.
         """
+        descriptor = ActionDescriptor()
+        descriptor.is_async = asyncio.iscoroutinefunction(func)
+
         if not reflect.has_self_parameter(func):
             func = reflect.func_to_method(func)
 
-        descriptor = ActionDescriptor()
         descriptor.func = func
         descriptor.view_class = view_class
 
@@ -75,6 +223,13 @@ class ActionDescriptorBuilder:
                                                getattr(view_class, 'filters', []),
                                                api.filters)
 
+        if descriptor.is_async:
+            if api.async_action_executor is None:
+                raise RuntimeError('Async actions require Python 3.5 or later.')
+            descriptor.pipeline = api.async_action_executor.create_pipeline(descriptor.filters)
+        else:
+            descriptor.pipeline = api.action_executor.create_pipeline(descriptor.filters)
+
         return descriptor
 
     def _get_filters(self, action_filters, view_filters, api_filters):
@@ -96,185 +251,266 @@ class ActionDescriptorBuilder:
         return filter_matched
 
 
-class ActionExecutor:
+class FilterPipeline:
     """
-    Responsible to execute an action and its filters.
+    The filters of an action split by stage and chained together.
+
+    It is built once per action, so that every request only
+    walks through the filters that apply to each stage.
+
+    :param list all_filters: The filters ordered by order of execution.
+    :param ActionExecutor executor: The executor that runs the action.
+    :raises RuntimeError: If an async filter is used on a sync action.
     """
 
-    def execute(self, context):
-        """
-        Executes an action with all its filters.
-        :param context: The action context.
-        :return: A `flask.Response` instance.
-        """
+    # the method called by the pipeline for each type of filter.
+    filter_methods = ((filters.AuthenticationFilter, 'on_authentication'),
+                      (filters.AuthorizationFilter, 'on_authorization'),
+                      (filters.ResourceFilter, 'on_resource_execution'),
+                      (filters.ActionFilter, 'on_action_execution'),
+                      (filters.ResultFilter, 'on_result_execution'),
+                      (filters.ExceptionFilter, 'on_exception'))
 
-        try:
-            context.cursor = _FilterCursor(context.filters)
-            self._execute_authentication_filters(context)
+    def __init__(self, all_filters, executor):
+        self._check_filters(all_filters)
 
-            context.cursor.reset()
-            self._execute_authorization_filters(context)
+        self.filters = list(all_filters)
+        self.authentication_filters = self._get_filters(all_filters, filters.AuthenticationFilter)
+        self.authorization_filters = self._get_filters(all_filters, filters.AuthorizationFilter)
+        self.resource_filters = self._get_filters(all_filters, filters.ResourceFilter)
+        self.action_filters = self._get_filters(all_filters, filters.ActionFilter)
+        self.result_filters = self._get_filters(all_filters, filters.ResultFilter)
 
-            context.cursor.reset()
-            self._execute_resource_filters(context)
-        except Exception as e:
-            context.exception = e
-            self._handle_exception(context)
+        # exception filters are executed from the innermost to the outermost.
+        self.exception_filters = tuple(reversed(self._get_filters(all_filters, filters.ExceptionFilter)))
 
-    def _handle_exception(self, context):
+        object_result_filters = self._get_filters(all_filters, filters.ObjectResultFilter)
+        self.object_result_filter = object_result_filters[0] if object_result_filters else None
+
+        self.executor = executor
+
+        self.resource_chain = self._chain(self.resource_filters, self._link_resource_filter,
+                                          self._execute_inner_stages)
+        self.action_chain = self._chain(self.action_filters, self._link_action_filter,
+                                        executor._execute_action)
+        self.result_chain = self._chain(self.result_filters, self._link_result_filter,
+                                        self._execute_result)
+
+    def _check_filters(self, all_filters):
         """
-        Handles any unhandled error that occurs
-        and creates a proper response for it.
-        :param ActionContext context: The action context.
+        Checks that the filters can be used on sync actions,
+        the coroutines of async methods would never be awaited.
+        :param list all_filters: The filters ordered by order of execution.
         """
-        if isinstance(context.exception, APIException):
-            message = context.exception
-        elif isinstance(context.exception, HTTPException):
-            message = APIException(context.exception.description)
-            message.status_code = context.exception.code
-        else:
-            debug = current_app.config.get('DEBUG')
-            message = APIException(traceback.format_exc()) if debug else APIException()
-            context.app.logger.error(traceback.format_exc())
+        for filter in all_filters:
+            for filter_type, method_name in self.filter_methods:
+                if isinstance(filter, filter_type) and asyncio.iscoroutinefunction(getattr(filter, method_name)):
+                    raise RuntimeError('%s cannot be used on sync actions, as `%s` is declared with `async def`.'
+                                       % (type(filter).__name__, method_name))
 
-        result = results.ObjectResult({'errors': message.denormalize()}, status_code=message.status_code)
-        result.execute(context)
+    def _get_filters(self, all_filters, filter_type):
+        """
+        Gets the filters of the given type keeping the order of execution.
+        :param list all_filters: The filters ordered by order of execution.
+        :param filter_type: The type of filter.
+        :return: A tuple of filters.
+        """
+        return tuple(f for f in all_filters if isinstance(f, filter_type))
 
-    def _execute_authentication_filters(self, context):
+    def _chain(self, stage_filters, link, last):
         """
-        Executes all authentication filters for the given action.
-        :param context: The action context.
+        Chains the given filters so that each one receives the next one as `next_filter`.
+        :param tuple stage_filters: The filters ordered by order of execution.
+        :param link: The function that wraps a filter into a callable.
+        :param last: The callable invoked after the last filter.
+        :return: The callable that starts the chain.
         """
-        if context.result is not None:
-            self._execute_action_result(context)
-            return
+        next_filter = last
 
-        cursor = context.cursor
+        for filter in reversed(stage_filters):
+            next_filter = link(filter, next_filter)
 
-        filter = cursor.get_next(filters.AuthenticationFilter)
+        return next_filter
 
-        if filter:
-            filter.on_authentication(context)
-            self._execute_authentication_filters(context)
+    def _link_resource_filter(self, filter, next_filter):
+        executor = self.executor
 
-    def _execute_authorization_filters(self, context):
-        """
-        Executes all authorization filters for the given action.
-        :param context: The action context.
-        """
-        if context.result is not None:
-            self._execute_action_result(context)
-            return
+        def invoke(context):
+            if context.result is not None:
+                executor._execute_action_result(context)
+                return
+
+            filter.on_resource_execution(context, next_filter)
+
+        return invoke
+
+    def _link_action_filter(self, filter, next_filter):
+        def invoke(context):
+            if context.result is not None:
+                return
+
+            filter.on_action_execution(context, next_filter)
 
-        cursor = context.cursor
+        return invoke
 
-        filter = cursor.get_next(filters.AuthorizationFilter)
+    def _link_result_filter(self, filter, next_filter):
+        def invoke(context):
+            if context.result is None:
+                return
 
-        if filter:
-            filter.on_authorization(context)
-            self._execute_authorization_filters(context)
+            filter.on_result_execution(context, next_filter)
 
-    def _execute_resource_filters(self, context):
+        return invoke
+
+    def _execute_inner_stages(self, context):
         """
-        Executes all resource filters for the given action.
-        :param context: The action context.
+        Executes the action filters, the exception filters and the result filters.
+        :param ActionContext context: The action context.
         """
         if context.result is not None:
-            self._execute_action_result(context)
+            self.executor._execute_action_result(context)
             return
 
-        cursor = context.cursor
-
-        filter = cursor.get_next(filters.ResourceFilter)
+        pipeline = context.get_pipeline()
 
-        if filter:
-            filter.on_resource_execution(context, self._execute_resource_filters)
-        else:
-            cursor.reset()
-
-            # >> ExceptionFilters >> ActionFilters >> Action
-            self._execute_exception_filters(context)
+        try:
+            pipeline.action_chain(context)
+        except Exception as e:
+            context.exception = e
 
+        for filter in pipeline.exception_filters:
             if context.exception and not context.exception_handled:
-                raise context.exception
+                filter.on_exception(context)
 
-            cursor.reset()
-            self._execute_result_filters(context)
+        if context.exception and not context.exception_handled:
+            raise context.exception
 
-    def _execute_exception_filters(self, context):
+        pipeline.result_chain(context)
+
+    def _execute_result(self, context):
         """
-        Executes all exception filters for the given action.
-        :param context: The action context.
+        Executes the action result once all result filters have been called.
+        :param ActionContext context: The action context.
         """
         if context.result is not None:
-            return
-
-        cursor = context.cursor
-
-        filter = cursor.get_next(filters.ExceptionFilter)
+            self.executor._execute_action_result(context)
 
-        if filter:
-            self._execute_exception_filters(context)
 
-            if context.exception and not context.exception_handled:
-                filter.on_exception(context)
-        else:
-            cursor.reset()
+class ActionExecutor:
+    """
+    Responsible to execute an action and its filters.
+    """
 
-            try:
-                self._execute_action_filters(context)
-            except Exception as e:
-                context.exception = e
+    def create_pipeline(self, filters):
+        """
+        Creates the filter pipeline executed by this executor.
+        :param list filters: The filters ordered by order of execution.
+        :return: A `FilterPipeline`.
+        """
+        return FilterPipeline(filters, self)
 
-    def _execute_action_filters(self, context):
+    def execute(self, context):
         """
-        Executes all action filters for the given action.
+        Executes an action with all its filters.
         :param context: The action context.
+        :return: A `flask.Response` instance.
         """
-        if context.result is not None:
-            return
+        try:
+            for filter in self._iter_filters(context, 'authentication_filters'):
+                filter.on_authentication(context)
+
+                if context.result is not None:
+                    self._execute_action_result(context)
+                    return
+
+            for filter in self._iter_filters(context, 'authorization_filters'):
+                filter.on_authorization(context)
+
+                if context.result is not None:
+                    self._execute_action_result(context)
+                    return
+
+            context.get_pipeline().resource_chain(context)
+        except Exception as e:
+            context.exception = e
+            self._handle_exception(context)
 
-        cursor = context.cursor
+    def _iter_filters(self, context, stage):
+        """
+        Iterates over the filters of the given stage, including
+        the ones added to the request by the previous filters.
+        :param ActionContext context: The action context.
+        :param str stage: The name of the attribute of `FilterPipeline` with the filters.
+        :return: A generator of filters.
+        """
+        index = 0
+        stage_filters = getattr(context.get_pipeline(), stage)
 
-        filter = cursor.get_next(filters.ActionFilter)
+        while index < len(stage_filters):
+            yield stage_filters[index]
+            index += 1
+            stage_filters = getattr(context.get_pipeline(), stage)
 
-        if filter:
-            filter.on_action_execution(context, self._execute_action_filters)
+    def _handle_exception(self, context):
+        """
+        Handles any unhandled error that occurs
+        and creates a proper response for it.
+        :param ActionContext context: The action context.
+        """
+        if isinstance(context.exception, APIException):
+            message = context.exception
+        elif isinstance(context.exception, HTTPException):
+            message = APIException(context.exception.description)
+            message.status_code = context.exception.code
         else:
-            descriptor = context.descriptor
-            view = descriptor.view_class()
-            result = descriptor.func(view, *context.args, **context.kwargs)
-
-            if isinstance(result, context.app.response_class):
-                context.response = result
-            elif isinstance(result, results.ActionResult):
-                context.result = result
-            else:
-                object_result_factory = context.object_result_factory
-                context.result = object_result_factory.create(result, context)
+            debug = current_app.config.get('DEBUG')
+            message = APIException(traceback.format_exc()) if debug else APIException()
+            context.app.logger.error(traceback.format_exc())
+
+        result = results.ObjectResult({'errors': message.denormalize()}, status_code=message.status_code)
+        result.execute(context)
 
-    def _execute_result_filters(self, context):
+    def _execute_action(self, context):
         """
-        Executes all result filters for the given action.
+        Executes the action once all action filters have been called.
         :param context: The action context.
         """
-        if context.result is None:
+        if context.result is not None:
             return
 
-        cursor = context.cursor
+        descriptor = context.descriptor
+        view = descriptor.view_class()
+        result = descriptor.func(view, *context.args, **context.kwargs)
 
-        filter = cursor.get_next(filters.ResultFilter)
+        self._set_action_result(context, result)
 
-        if filter:
-            filter.on_result_execution(context, self._execute_result_filters)
+    def _set_action_result(self, context, result):
+        """
+        Sets the value returned by the action into the context.
+        :param context: The action context.
+        :param result: The value returned by the action.
+        """
+        if isinstance(result, context.app.response_class):
+            context.response = result
+        elif isinstance(result, results.ActionResult):
+            context.result = result
         else:
-            self._execute_action_result(context)
+            object_result_factory = context.object_result_factory
+            context.result = object_result_factory.create(result, context)
 
     def _execute_action_result(self, context):
         context.result.execute(context)
 
 
 class ObjectResultExecutor:
+    """
+    Writes an `ObjectResult` into the response.
+    :param str fields_param: The name of the query parameter with the comma separated
+                             list of fields to be dumped, `None` to always dump all the fields.
+    """
+    def __init__(self, fields_param='fields'):
+        self.fields_param = fields_param
+
     def execute(self, context, result):
         value = result.value
 
@@ -286,56 +522,87 @@ class ObjectResultExecutor:
         if value is None:
             return
 
-        if result.schema:
-            if collections.is_collection(value):
-                value = result.schema.dumps(value)
+        # values produced lazily are streamed,
+        # so that they are never fully materialized.
+        stream = collections.is_iterator(value)
+
+        schema = result.schema
+
+        if schema:
+            schema = self._get_schema(schema)
+
+            if stream:
+                value = schema.iter_dumps(value)
+            elif collections.is_collection(value):
+                value = schema.dumps(value)
             else:
-                value = result.schema.dump(value)
+                value = schema.dump(value)
 
         formatter_pair = self._select_output_formatter(context)
 
         if formatter_pair is None:
             context.response.status_code = status.HTTP_406_NOT_ACCEPTABLE
+            return
+
+        formatter, mimetype = formatter_pair
+        kwargs = {'schema': schema} if formatter.schema_aware else {}
+
+        if stream:
+            formatter.write_stream(context.response, stream_with_context(value), mimetype, **kwargs)
         else:
-            formatter, mimetype = formatter_pair
-            formatter.write(context.response, value, mimetype)
+            formatter.write(context.response, value, mimetype, **kwargs)
 
-    def _select_output_formatter(self, context, force=False):
+    def get_requested_fields(self):
         """
-        Selects the appropriated formatter that matches to the request accept header.
-        :param context: The action context.
-        :param force: If set to `True` selects the first formatter when the appropriated is not found.
-        :return: A tuple with renderer and the mimetype.
+        Gets the fields requested by the client through the `fields_param` query parameter.
+        :return: A `frozenset` with the name of the fields or `None` if all the fields are requested.
+        """
+        if not self.fields_param:
+            return None
+
+        value = request.args.get(self.fields_param)
+
+        if not value:
+            return None
+
+        return frozenset(name.strip() for name in value.split(',') if name.strip()) or None
+
+    def _get_schema(self, schema):
         """
-        formatters = context.output_formatters
+        Gets the schema restricted to the fields requested by the client,
+        the restricted schemas are shared between requests.
+        :param Schema schema: The schema of the result.
+        :return: The schema to be used.
+        """
+        requested_fields = self.get_requested_fields()
 
-        for mimetype in self._get_accept_list():
-            accept_mimetype = MimeType.parse(mimetype)
-            for formatter in formatters:
-                if accept_mimetype.match(formatter.mimetype):
-                    return formatter, formatter.mimetype.replace(params=accept_mimetype.params)
+        if requested_fields is None:
+            return schema
 
-        if force:
-            return formatters[0], formatters[0].mimetype
+        # dotted names select the fields of nested schemas.
+        # the names are limited to the ones selected by the schema,
+        # so the client cannot widen it.
+        field_names = set(field.field_name for field in schema._dump_fields)
+        only = [name for name in schema.restrict_only(requested_fields) if name.partition('.')[0] in field_names]
 
-        return None
+        # no field has an empty name, so
+        # a schema with it dumps nothing.
+        return schema.__class__.get_cached(only=only or ('',), partial=schema.partial,
+                                           compiled=schema.compiled, fail_fast=schema.fail_fast)
 
-    def _get_accept_list(self):
+    def _select_output_formatter(self, context, force=False):
         """
-        Given the incoming request, return a list of accepted media type strings.
+        Selects the appropriated formatter that matches to the request accept header.
+        :param context: The action context.
+        :param force: If set to `True` selects the first formatter when the appropriated is not found.
+        :return: A tuple with renderer and the mimetype.
         """
-        header = request.environ.get('HTTP_ACCEPT') or '*/*'
-        return [token.strip() for token in header.split(',')]
+        return context.content_negotiator.select_output_formatter(context.get_output_formatters(), force)
 
 
 class ObjectResultFactory:
     def create(self, value, context):
-        object_result_filter = None
-
-        for f in context.filters:
-            if isinstance(f, filters.ObjectResultFilter):
-                object_result_filter = f
-                break
+        object_result_filter = context.get_pipeline().object_result_filter
 
         schema = None
         status_code = None
@@ -346,25 +613,3 @@ class ObjectResultFactory:
 
         return results.ObjectResult(value, schema=schema, status_code=status_code)
 
-
-class _FilterCursor:
-    """
-    Internal class to move across the filters.
-    """
-    def __init__(self, filters):
-        self._index = 0
-        self._filters = filters
-
-    def get_next(self, filter_type):
-        while self._index < len(self._filters):
-            filter = self._filters[self._index]
-
-            self._index += 1
-
-            if isinstance(filter, filter_type):
-                return filter
-
-        return None
-
-    def reset(self):
-        self._index = 0
@@ -0,0 +1,174 @@
+"""
+Provides a set of classes to select the formatters based on the request headers.
+"""
+
+from abc import ABCMeta, abstractmethod
+from flask import request
+from functools import lru_cache
+from .utils.mimetypes import MimeType
+
+
+class ContentNegotiator(metaclass=ABCMeta):
+    """
+    A base class from which all content negotiator classes should inherit.
+    """
+
+    @abstractmethod
+    def select_input_formatter(self, formatters):
+        """
+        Selects the appropriated formatter that matches with the request content type.
+        :param list formatters: The list of input formatters.
+        :return: A tuple with the formatter and the mimetype or `None`.
+        """
+
+    @abstractmethod
+    def select_output_formatter(self, formatters, force=False):
+        """
+        Selects the appropriated formatter that matches to the request accept header.
+        :param list formatters: The list of output formatters.
+        :param force: If set to `True` selects the first formatter when the appropriated is not found.
+        :return: A tuple with the formatter and the mimetype or `None`.
+        """
+
+
+class DefaultContentNegotiator(ContentNegotiator):
+    """
+    Selects the formatters honoring the quality and the specificity
+    of the media ranges in the accept header. The quality of a formatter
+    is the one of the most specific media range that matches it, so a
+    quality of zero excludes it even if a wildcard accepts it.
+
+    The formatters are looked up in an index by main type and sub type,
+    and the most recent results are cached by header and formatters.
+
+    :param int cache_size: The maximum number of results cached.
+    """
+
+    def __init__(self, cache_size=128):
+        self._negotiate_input = lru_cache(maxsize=cache_size)(self._negotiate_input)
+        self._negotiate_output = lru_cache(maxsize=cache_size)(self._negotiate_output)
+        self._get_index = lru_cache(maxsize=cache_size)(self._get_index)
+
+    def select_input_formatter(self, formatters):
+        """
+        Selects the appropriated formatter that matches with the request content type.
+        :param list formatters: The list of input formatters.
+        :return: A tuple with the formatter and the mimetype or `None`.
+        """
+        return self._negotiate_input(request.content_type or '', tuple(formatters))
+
+    def select_output_formatter(self, formatters, force=False):
+        """
+        Selects the appropriated formatter that matches to the request accept header.
+        :param list formatters: The list of output formatters.
+        :param force: If set to `True` selects the first formatter when the appropriated is not found.
+        :return: A tuple with the formatter and the mimetype or `None`.
+        """
+        header = request.environ.get('HTTP_ACCEPT') or '*/*'
+        return self._negotiate_output(header, tuple(formatters), force)
+
+    def parse_accept(self, header):
+        """
+        Parses the accept header and sorts the media ranges by
+        quality and specificity, the order of the header breaks ties.
+        Media ranges with quality zero are not acceptable and are discarded.
+        :param str header: The accept header.
+        :return: A list of `MimeType` without the quality parameter.
+        """
+        entries = [entry for entry in self._parse_ranges(header) if entry[0] < 0]
+        entries.sort(key=lambda entry: entry[:3])
+
+        return [entry[3] for entry in entries]
+
+    def _parse_ranges(self, header):
+        """
+        Parses the media ranges of the accept header, including the ones with quality zero.
+        :param str header: The accept header.
+        :return: A list of tuples with the negative quality, the negative specificity,
+                 the position in the header and the `MimeType` without the quality parameter.
+        """
+        entries = []
+
+        for index, token in enumerate(header.split(',')):
+            mimetype = MimeType.parse(token.strip())
+            params = dict(mimetype.params)
+
+            try:
+                quality = float(params.pop('q', 1))
+            except ValueError:
+                quality = 1.0
+
+            if mimetype.main_type == '*':
+                specificity = 0
+            elif mimetype.sub_type == '*':
+                specificity = 1
+            else:
+                specificity = 2 + bool(params)
+
+            entries.append((-max(quality, 0.0), -specificity, index, mimetype.replace(params=params)))
+
+        return entries
+
+    def _negotiate_input(self, content_type, formatters):
+        mimetype = MimeType.parse(content_type)
+
+        formatter = self._get_index(formatters).get((mimetype.main_type, mimetype.sub_type))
+
+        if formatter is None:
+            return None
+
+        return formatter, mimetype
+
+    def _negotiate_output(self, header, formatters, force):
+        # the most specific media ranges come first, the order
+        # of the header breaks ties between them.
+        ranges = sorted(self._parse_ranges(header), key=lambda entry: (entry[1], entry[2]))
+        best = None
+
+        for position, formatter in enumerate(formatters):
+            main_type = formatter.mimetype.main_type
+            sub_type = formatter.mimetype.sub_type
+
+            for entry in ranges:
+                accept_mimetype = entry[3]
+
+                if accept_mimetype.main_type not in ('*', main_type) or accept_mimetype.sub_type not in ('*', sub_type):
+                    continue
+
+                # a quality of zero excludes the formatter.
+                if entry[0] < 0:
+                    candidate = (entry[:3], position, formatter, accept_mimetype)
+
+                    if best is None or candidate[:2] < best[:2]:
+                        best = candidate
+
+                break
+
+        if best is not None:
+            formatter, accept_mimetype = best[2:]
+            return formatter, formatter.mimetype.replace(params=accept_mimetype.params)
+
+        if force and formatters:
+            return formatters[0], formatters[0].mimetype
+
+        return None
+
+    def _get_index(self, formatters):
+        """
+        Builds a dict to look up the first formatter that matches
+        to a `(main_type, sub_type)` pair, including wildcards.
+        :param tuple formatters: The formatters.
+        :return: A `dict`.
+        """
+        index = {}
+
+        for formatter in formatters:
+            main_type = formatter.mimetype.main_type
+            sub_type = formatter.mimetype.sub_type
+
+            index.setdefault((main_type, sub_type), formatter)
+            index.setdefault((main_type, '*'), formatter)
+            index.setdefault(('*', sub_type), formatter)
+            index.setdefault(('*', '*'), formatter)
+
+        return index
@@ -1,6 +1,6 @@
 import inspect
 
-from collections import Iterable, Mapping
+from collections import Iterable, Iterator, Mapping
 
 
 def is_generator(obj):
@@ -10,6 +10,13 @@ def is_generator(obj):
     return inspect.isgeneratorfunction(obj) or inspect.isgenerator(obj)
 
 
+def is_iterator(obj):
+    """
+    Return True if ``obj`` is an iterator or a generator, e.g values produced lazily.
+    """
+    return isinstance(obj, Iterator) or is_generator(obj)
+
+
 def is_iterable_but_not_string(obj):
     """
     Return True if ``obj`` is an iterable object that isn't a string.
@@ -22,6 +22,13 @@ def parse_date(value):
     Raises ValueError if the input is well formatted but not a valid date.
     Returns None if the input isn't well formatted.
     """
+    # fast path for the canonical form YYYY-MM-DD.
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        year, month, day = value[0:4], value[5:7], value[8:10]
+
+        if year.isdecimal() and month.isdecimal() and day.isdecimal():
+            return datetime.date(int(year), int(month), int(day))
+
     match = date_re.match(value)
     if match:
         kw = {k: int(v) for k, v in match.groupdict().items()}
@@ -35,6 +42,10 @@ def parse_datetime(value):
     Raises ValueError if the input is well formatted but not a valid datetime.
     Returns None if the input isn't well formatted.
     """
+    parsed = _parse_canonical_datetime(value)
+    if parsed is not None:
+        return parsed
+
     match = datetime_re.match(value)
     if match:
         kw = match.groupdict()
@@ -52,3 +63,52 @@ def parse_datetime(value):
         kw = {k: int(v) for k, v in kw.items() if v is not None}
         kw['tzinfo'] = tzinfo
         return datetime.datetime(**kw)
+
+
+def _parse_canonical_datetime(value):
+    """Parses the canonical form YYYY-MM-DDTHH:MM:SS[.ffffff][Z|+HH:MM] by slicing.
+    Raises ValueError if the input is well formatted but not a valid datetime.
+    Returns None if the input isn't in the canonical form.
+    """
+    length = len(value)
+
+    if (length < 19 or value[4] != '-' or value[7] != '-' or value[10] not in ('T', ' ') or
+            value[13] != ':' or value[16] != ':'):
+        return None
+
+    year, month, day = value[0:4], value[5:7], value[8:10]
+    hour, minute, second = value[11:13], value[14:16], value[17:19]
+
+    if not (year + month + day + hour + minute + second).isdecimal():
+        return None
+
+    if value[-1] == 'Z':
+        tzinfo = utc
+        end = length - 1
+    elif length >= 25 and value[-6] in ('+', '-') and value[-3] == ':':
+        hours, minutes = value[-5:-3], value[-2:]
+
+        if not (hours.isdecimal() and minutes.isdecimal()):
+            return None
+
+        offset = 60 * int(hours) + int(minutes)
+        if value[-6] == '-':
+            offset = -offset
+        tzinfo = get_fixed_timezone(offset)
+        end = length - 6
+    else:
+        tzinfo = None
+        end = length
+
+    if end == 19:
+        microsecond = 0
+    else:
+        fraction = value[20:end]
+
+        if value[19] != '.' or not 1 <= len(fraction) <= 12 or not fraction.isdecimal():
+            return None
+
+        microsecond = int(fraction[:6].ljust(6, '0'))
+
+    return datetime.datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                             microsecond, tzinfo)
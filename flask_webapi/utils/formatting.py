@@ -14,6 +14,7 @@ def format_error_message(message, **kwargs):
     if isinstance(message, str):
         message = message.format(**kwargs)
     elif isinstance(message, dict):
-        for key, value in message.items():
-            message[key] = format_error_message(value, **kwargs)
+        # a new dict is returned because the error messages
+        # may be shared between copies of the same field.
+        message = {key: format_error_message(value, **kwargs) for key, value in message.items()}
     return message
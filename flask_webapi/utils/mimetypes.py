@@ -2,12 +2,18 @@
 Handling of mime types, as found in HTTP Content-Type and Accept headers.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
 
 class MimeType:
     """
     Represents a mimetype.
+    Instances are immutable and hashable, so they can be cached and shared.
     """
 
+    __slots__ = ('main_type', 'sub_type', 'params', '_hash')
+
     def __init__(self, main_type, sub_type, params=None):
         """
         Initializes a new instance of MimeType.
@@ -16,9 +22,35 @@ class MimeType:
         :param str sub_type: The second part of the mimetype after the slash.
         :param dict params: The parameters of the mimetype.
         """
-        self.main_type = main_type
-        self.sub_type = sub_type
-        self.params = params
+        params = dict(params or {})
+
+        object.__setattr__(self, 'main_type', main_type)
+        object.__setattr__(self, 'sub_type', sub_type)
+        object.__setattr__(self, 'params', MappingProxyType(params))
+        object.__setattr__(self, '_hash', hash((main_type, sub_type, frozenset(params.items()))))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('MimeType is immutable, use `replace` instead.')
+
+    def __delattr__(self, name):
+        raise AttributeError('MimeType is immutable, use `replace` instead.')
+
+    def __copy__(self):
+        # immutable, so there is no need to copy it.
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return MimeType, (self.main_type, self.sub_type, dict(self.params))
+
+    def __hash__(self):
+        """
+        Returns the hash of the main type, sub type and parameters.
+        :return: An int.
+        """
+        return self._hash
 
     def __eq__(self, other):
         """
@@ -33,6 +65,9 @@ class MimeType:
                self.sub_type == other.sub_type and \
                self.params == other.params
 
+    def __repr__(self):
+        return '<MimeType %s>' % self
+
     def __str__(self):
         """
         Returns the string representation.
@@ -47,24 +82,13 @@ class MimeType:
     def parse(cls, mimetype):
         """
         Extracts the full type and parameters from the given MimeType.
+        The most recent results are cached, as the same headers are
+        received over and over.
 
         :param str mimetype: The mimetype to be parsed.
         :return: Returns a tuple with full type and parameters.
         """
-        plist = mimetype.split(';')
-
-        main_type, _, sub_type = plist.pop(0).lower().strip().partition('/')
-        params = {}
-
-        for p in plist:
-            kv = p.split('=')
-            if len(kv) != 2:
-                continue
-            v = kv[1].strip()
-            if v:
-                params[kv[0].strip()] = v
-
-        return MimeType(main_type, sub_type, params)
+        return _parse(mimetype)
 
     def match(self, other):
         """
@@ -99,3 +123,26 @@ class MimeType:
             params = self.params
 
         return MimeType(main_type, sub_type, params)
+
+
+@lru_cache(maxsize=256)
+def _parse(mimetype):
+    """
+    Parses the given mimetype, see `MimeType.parse`.
+    :param str mimetype: The mimetype to be parsed.
+    :return: A `MimeType`.
+    """
+    plist = mimetype.split(';')
+
+    main_type, _, sub_type = plist.pop(0).lower().strip().partition('/')
+    params = {}
+
+    for p in plist:
+        kv = p.split('=')
+        if len(kv) != 2:
+            continue
+        v = kv[1].strip()
+        if v:
+            params[kv[0].strip()] = v
+
+    return MimeType(main_type, sub_type, params)
@@ -0,0 +1,242 @@
+"""
+A pure-Python implementation of the MessagePack format,
+used when the `msgpack` library is not installed.
+
+Only the types of the specification that map to Python types are
+supported: nil, bool, int, float, str, bin, array and map.
+"""
+
+import struct
+
+from collections import Mapping
+
+
+# the maximum nesting of arrays and maps decoded,
+# deeper data would exceed the recursion limit.
+MAX_DEPTH = 256
+
+
+def packb(obj, default=None):
+    """
+    Encodes the given object into MessagePack.
+    :param obj: The object to be encoded.
+    :param default: A function called for objects that cannot be encoded,
+                    it returns an object that can be encoded.
+    :return: The encoded `bytes`.
+    """
+    buffer = bytearray()
+    _pack(obj, buffer, default)
+    return bytes(buffer)
+
+
+def unpackb(data):
+    """
+    Decodes the given MessagePack data.
+    Raises ValueError if the data is malformed or nested deeper than `MAX_DEPTH`.
+    :param bytes data: The data to be decoded.
+    :return: The decoded object.
+    """
+    try:
+        obj, offset = _unpack(data, 0, 0)
+    except (IndexError, struct.error, TypeError, UnicodeDecodeError) as e:
+        raise ValueError('Invalid MessagePack data: %s' % e)
+
+    if offset != len(data):
+        raise ValueError('Invalid MessagePack data: extra data.')
+
+    return obj
+
+
+def _pack(obj, buffer, default):
+    if obj is None:
+        buffer.append(0xc0)
+
+    elif obj is True:
+        buffer.append(0xc3)
+
+    elif obj is False:
+        buffer.append(0xc2)
+
+    elif isinstance(obj, int):
+        _pack_int(obj, buffer)
+
+    elif isinstance(obj, float):
+        buffer.extend(struct.pack('>Bd', 0xcb, obj))
+
+    elif isinstance(obj, str):
+        data = obj.encode('utf-8')
+        _pack_header(len(data), buffer, 0xa0, 32, 0xd9, 0xda, 0xdb)
+        buffer.extend(data)
+
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        data = bytes(obj)
+        _pack_header(len(data), buffer, None, 0, 0xc4, 0xc5, 0xc6)
+        buffer.extend(data)
+
+    elif isinstance(obj, (list, tuple)):
+        _pack_header(len(obj), buffer, 0x90, 16, None, 0xdc, 0xdd)
+        for item in obj:
+            _pack(item, buffer, default)
+
+    elif isinstance(obj, Mapping):
+        _pack_header(len(obj), buffer, 0x80, 16, None, 0xde, 0xdf)
+        for key, value in obj.items():
+            _pack(key, buffer, default)
+            _pack(value, buffer, default)
+
+    elif default is not None:
+        _pack(default(obj), buffer, None)
+
+    else:
+        raise TypeError('Object of type %s is not MessagePack serializable' % type(obj).__name__)
+
+
+def _pack_int(obj, buffer):
+    if 0 <= obj < 0x80:
+        buffer.append(obj)
+    elif -32 <= obj < 0:
+        buffer.append(obj & 0xff)
+    elif obj >= 0:
+        if obj <= 0xff:
+            buffer.extend(struct.pack('>BB', 0xcc, obj))
+        elif obj <= 0xffff:
+            buffer.extend(struct.pack('>BH', 0xcd, obj))
+        elif obj <= 0xffffffff:
+            buffer.extend(struct.pack('>BI', 0xce, obj))
+        elif obj <= 0xffffffffffffffff:
+            buffer.extend(struct.pack('>BQ', 0xcf, obj))
+        else:
+            raise OverflowError('Integer too large for MessagePack')
+    else:
+        if obj >= -0x80:
+            buffer.extend(struct.pack('>Bb', 0xd0, obj))
+        elif obj >= -0x8000:
+            buffer.extend(struct.pack('>Bh', 0xd1, obj))
+        elif obj >= -0x80000000:
+            buffer.extend(struct.pack('>Bi', 0xd2, obj))
+        elif obj >= -0x8000000000000000:
+            buffer.extend(struct.pack('>Bq', 0xd3, obj))
+        else:
+            raise OverflowError('Integer too small for MessagePack')
+
+
+def _pack_header(length, buffer, fix_code, fix_limit, code8, code16, code32):
+    if length < fix_limit:
+        buffer.append(fix_code | length)
+    elif code8 is not None and length <= 0xff:
+        buffer.extend(struct.pack('>BB', code8, length))
+    elif length <= 0xffff:
+        buffer.extend(struct.pack('>BH', code16, length))
+    elif length <= 0xffffffff:
+        buffer.extend(struct.pack('>BI', code32, length))
+    else:
+        raise ValueError('Object too large for MessagePack')
+
+
+# the struct formats of the types with a fixed size
+# indexed by the first byte.
+_FIXED_FORMATS = {
+    0xca: '>f', 0xcb: '>d',
+    0xcc: '>B', 0xcd: '>H', 0xce: '>I', 0xcf: '>Q',
+    0xd0: '>b', 0xd1: '>h', 0xd2: '>i', 0xd3: '>q',
+}
+
+# the struct formats of the length of
+# the types with a variable size.
+_STR_FORMATS = {0xd9: '>B', 0xda: '>H', 0xdb: '>I'}
+_BIN_FORMATS = {0xc4: '>B', 0xc5: '>H', 0xc6: '>I'}
+_ARRAY_FORMATS = {0xdc: '>H', 0xdd: '>I'}
+_MAP_FORMATS = {0xde: '>H', 0xdf: '>I'}
+
+
+def _unpack(data, offset, depth):
+    code = data[offset]
+    offset += 1
+
+    if code <= 0x7f:
+        return code, offset
+
+    if code >= 0xe0:
+        return code - 0x100, offset
+
+    if 0xa0 <= code <= 0xbf:
+        return _unpack_str(data, offset, code & 0x1f)
+
+    if 0x90 <= code <= 0x9f:
+        return _unpack_array(data, offset, code & 0x0f, depth)
+
+    if 0x80 <= code <= 0x8f:
+        return _unpack_map(data, offset, code & 0x0f, depth)
+
+    if code == 0xc0:
+        return None, offset
+
+    if code == 0xc2:
+        return False, offset
+
+    if code == 0xc3:
+        return True, offset
+
+    if code in _FIXED_FORMATS:
+        fmt = _FIXED_FORMATS[code]
+        return struct.unpack_from(fmt, data, offset)[0], offset + struct.calcsize(fmt)
+
+    if code in _STR_FORMATS:
+        length, offset = _unpack_length(data, offset, _STR_FORMATS[code])
+        return _unpack_str(data, offset, length)
+
+    if code in _BIN_FORMATS:
+        length, offset = _unpack_length(data, offset, _BIN_FORMATS[code])
+        return bytes(_slice(data, offset, length)), offset + length
+
+    if code in _ARRAY_FORMATS:
+        length, offset = _unpack_length(data, offset, _ARRAY_FORMATS[code])
+        return _unpack_array(data, offset, length, depth)
+
+    if code in _MAP_FORMATS:
+        length, offset = _unpack_length(data, offset, _MAP_FORMATS[code])
+        return _unpack_map(data, offset, length, depth)
+
+    raise ValueError('Unsupported MessagePack type 0x%02x.' % code)
+
+
+def _unpack_length(data, offset, fmt):
+    return struct.unpack_from(fmt, data, offset)[0], offset + struct.calcsize(fmt)
+
+
+def _slice(data, offset, length):
+    if offset + length > len(data):
+        raise ValueError('Invalid MessagePack data: truncated data.')
+    return data[offset:offset + length]
+
+
+def _unpack_str(data, offset, length):
+    return bytes(_slice(data, offset, length)).decode('utf-8'), offset + length
+
+
+def _check_depth(depth):
+    if depth >= MAX_DEPTH:
+        raise ValueError('Invalid MessagePack data: nested deeper than %d levels.' % MAX_DEPTH)
+
+
+def _unpack_array(data, offset, length, depth):
+    _check_depth(depth)
+    result = []
+
+    for _ in range(length):
+        item, offset = _unpack(data, offset, depth + 1)
+        result.append(item)
+
+    return result, offset
+
+
+def _unpack_map(data, offset, length, depth):
+    _check_depth(depth)
+    result = {}
+
+    for _ in range(length):
+        key, offset = _unpack(data, offset, depth + 1)
+        value, offset = _unpack(data, offset, depth + 1)
+        result[key] = value
+
+    return result, offset
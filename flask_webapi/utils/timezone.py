@@ -48,6 +48,24 @@ class FixedOffset(tzinfo):
         if name is not None:
             self.__name = name
 
+    def __eq__(self, other):
+        if not isinstance(other, FixedOffset):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return '<FixedOffset %s>' % getattr(self, '_FixedOffset__name', None)
+
+    def _key(self):
+        return getattr(self, '_FixedOffset__offset', None), getattr(self, '_FixedOffset__name', None)
+
     def utcoffset(self, dt):
         return self.__offset
 
@@ -61,16 +79,35 @@ class FixedOffset(tzinfo):
 utc = pytz.utc if pytz else UTC()
 
 
+# the instances of `FixedOffset` created by
+# `get_fixed_timezone` indexed by the offset in minutes.
+_fixed_timezones = {}
+
+
 def get_fixed_timezone(offset):
     """
     Returns a tzinfo instance with a fixed offset from UTC.
+    The instances are cached, so the same instance is returned for the same offset.
     """
     if isinstance(offset, timedelta):
-        offset = offset.seconds // 60
+        offset = int(offset.total_seconds()) // 60
+
+    try:
+        return _fixed_timezones[offset]
+    except KeyError:
+        pass
+
     sign = '-' if offset < 0 else '+'
     hhmm = '%02d%02d' % divmod(abs(offset), 60)
     name = sign + hhmm
-    return FixedOffset(offset, name)
+    fixed_timezone = FixedOffset(offset, name)
+
+    # valid offsets are less than one day,
+    # so the number of instances is bounded.
+    if abs(offset) < 24 * 60:
+        fixed_timezone = _fixed_timezones.setdefault(offset, fixed_timezone)
+
+    return fixed_timezone
 
 
 def is_aware(value):
@@ -5,7 +5,6 @@ Provides a set of classes to deal with input data.
 from abc import ABCMeta, abstractmethod
 from flask import request
 from .exceptions import UnsupportedMediaType
-from .utils.mimetypes import MimeType
 
 
 def get_default_providers():
@@ -36,6 +35,7 @@ class ValueProvider(metaclass=ABCMeta):
 class QueryStringProvider(ValueProvider):
     """
     Provides arguments from the request query string.
+    `request.args` is parsed only once per request by werkzeug.
     """
     def get_data(self, context):
         return request.args
@@ -44,6 +44,7 @@ class QueryStringProvider(ValueProvider):
 class FormDataProvider(ValueProvider):
     """
     Provides arguments from the request form.
+    `request.form` is parsed only once per request by werkzeug.
     """
     def get_data(self, context):
         return request.form
@@ -54,7 +55,7 @@ class HeadersProvider(ValueProvider):
     Provides arguments from the request headers.
     """
     def get_data(self, context):
-        return dict(request.headers)
+        return context.memoize(self, lambda: dict(request.headers))
 
 
 class CookiesProvider(ValueProvider):
@@ -68,11 +69,18 @@ class CookiesProvider(ValueProvider):
 class BodyProvider(ValueProvider):
     """
     Provides arguments from the request body.
+    The body is parsed once per request, even if it is used by multiple parameters.
     """
     def get_data(self, context):
-        formatters = context.input_formatters
+        return context.memoize(self, lambda: self._read_data(context))
 
-        formatter_pair = self._select_input_formatter(formatters)
+    def _read_data(self, context):
+        """
+        Selects the input formatter and reads the request body.
+        :param ActionContext context: The action context.
+        :return: The data read.
+        """
+        formatter_pair = context.content_negotiator.select_input_formatter(context.get_input_formatters())
 
         if formatter_pair is None:
             raise UnsupportedMediaType(request.content_type)
@@ -80,17 +88,3 @@ class BodyProvider(ValueProvider):
         formatter, mimetype = formatter_pair
 
         return formatter.read(request, mimetype)
-
-    def _select_input_formatter(self, formatters):
-        """
-        Selects the appropriated formatter that matches with the request content type.
-        :param formatters: The lists of input formatters.
-        :return: The formatter selected or `None`.
-        """
-        mimetype = MimeType.parse(request.content_type)
-
-        for formatter in formatters:
-            if mimetype.match(formatter.mimetype):
-                return formatter, mimetype
-
-        return None
@@ -0,0 +1,231 @@
+import asyncio
+
+from flask import Flask, json
+from flask_webapi import WebAPI, fields, param, route
+from flask_webapi.decorators import cache, compat
+from flask_webapi.filters import ActionFilter, AuthenticationFilter, AuthorizationFilter, ExceptionFilter, ResultFilter
+from flask_webapi.results import ForbiddenResult, NoContent, UnauthorizedResult
+from unittest import TestCase
+
+
+class TestAsyncAction(TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.api = WebAPI(self.app)
+        self.client = self.app.test_client()
+        self.calls = []
+
+    def test_async_action(self):
+        @route('/view')
+        @param('name', fields.StringField)
+        async def view(name):
+            await asyncio.sleep(0)
+            return {'name': name}
+
+        self.api.add_view(view)
+
+        response = self.client.get('/view?name=foo')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data), {'name': 'foo'})
+
+    def test_async_action_in_class(self):
+        class View(object):
+            @route('/view')
+            async def view(self):
+                return {'name': 'foo'}
+
+        self.api.add_view(View)
+
+        response = self.client.get('/view')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data), {'name': 'foo'})
+
+    def test_filter_order(self):
+        calls = self.calls
+
+        @route('/view')
+        @SyncResultFilter(calls, 'result')
+        @AsyncActionFilter(calls, 'action1')
+        @SyncActionFilter(calls, 'action2')
+        async def view():
+            calls.append('view')
+
+        self.api.add_view(view)
+
+        response = self.client.get('/view')
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(calls, ['action1', 'action2', 'view', 'action1 after', 'result'])
+
+    def test_async_authentication_filter(self):
+        @route('/view')
+        @AsyncAuthenticationFilter()
+        async def view():
+            pass
+
+        self.api.add_view(view)
+
+        response = self.client.get('/view')
+        self.assertEqual(response.status_code, 401)
+
+    def test_async_exception_filter(self):
+        @route('/view')
+        @AsyncExceptionFilter()
+        async def view():
+            raise ValueError()
+
+        self.api.add_view(view)
+
+        response = self.client.get('/view')
+        self.assertEqual(response.status_code, 204)
+
+    def test_sync_filter_is_rejected(self):
+        @route('/view')
+        @SizeResultFilter([])
+        async def view():
+            return {'name': 'foo'}
+
+        with self.assertRaises(RuntimeError):
+            self.api.add_view(view)
+
+    def test_sync_filter_on_sync_action(self):
+        sizes = []
+
+        @route('/view')
+        @SizeResultFilter(sizes)
+        def view():
+            return {'name': 'foo'}
+
+        self.api.add_view(view)
+
+        response = self.client.get('/view')
+        self.assertEqual(sizes, [len(response.data)])
+
+    def test_compat_filter_is_rejected(self):
+        def decorator(func):
+            return func
+
+        @route('/view')
+        @compat(decorator)
+        async def view():
+            pass
+
+        with self.assertRaises(RuntimeError):
+            self.api.add_view(view)
+
+    def test_async_filter_on_sync_action_is_rejected(self):
+        self.api.filters.append(AsyncAuthorizationFilter())
+
+        @route('/view')
+        def view():
+            return {'name': 'foo'}
+
+        with self.assertRaises(RuntimeError):
+            self.api.add_view(view)
+
+    def test_async_global_filter_on_async_action(self):
+        self.api.filters.append(AsyncAuthorizationFilter())
+
+        @route('/view')
+        async def view():
+            return {'name': 'foo'}
+
+        self.api.add_view(view)
+
+        response = self.client.get('/view')
+        self.assertEqual(response.status_code, 403)
+
+    def test_unhandled_exception(self):
+        @route('/view')
+        async def view():
+            raise ValueError()
+
+        self.api.add_view(view)
+
+        response = self.client.get('/view')
+        self.assertEqual(response.status_code, 500)
+
+
+class AsyncAuthenticationFilter(AuthenticationFilter):
+    async def on_authentication(self, context):
+        await asyncio.sleep(0)
+        context.result = UnauthorizedResult()
+
+
+class AsyncAuthorizationFilter(AuthorizationFilter):
+    async def on_authorization(self, context):
+        context.result = ForbiddenResult()
+
+
+class AsyncActionFilter(ActionFilter):
+    def __init__(self, calls, name):
+        super().__init__()
+        self.calls = calls
+        self.name = name
+
+    async def on_action_execution(self, context, next_filter):
+        self.calls.append(self.name)
+        await next_filter(context)
+        self.calls.append(self.name + ' after')
+
+
+class SyncActionFilter(ActionFilter):
+    async_compatible = True
+
+    def __init__(self, calls, name):
+        super().__init__()
+        self.calls = calls
+        self.name = name
+
+    def on_action_execution(self, context, next_filter):
+        self.calls.append(self.name)
+        return next_filter(context)
+
+
+class AsyncExceptionFilter(ExceptionFilter):
+    async def on_exception(self, context):
+        context.result = NoContent()
+        context.exception_handled = True
+
+
+class SyncResultFilter(ResultFilter):
+    async_compatible = True
+
+    def __init__(self, calls, name):
+        super().__init__()
+        self.calls = calls
+        self.name = name
+
+    def on_result_execution(self, context, next_filter):
+        self.calls.append(self.name)
+        return next_filter(context)
+
+
+class SizeResultFilter(ResultFilter):
+    def __init__(self, sizes):
+        super().__init__()
+        self.sizes = sizes
+
+    def on_result_execution(self, context, next_filter):
+        next_filter(context)
+        self.sizes.append(len(context.response.get_data()))
+
+
+class TestAsyncCacheFilter(TestCase):
+    def test_cached_response(self):
+        app = Flask(__name__)
+        api = WebAPI(app)
+        calls = []
+
+        @route('/view')
+        @cache()
+        async def view():
+            calls.append('view')
+            return {'calls': len(calls)}
+
+        api.add_view(view)
+
+        client = app.test_client()
+        client.get('/view')
+        response = client.get('/view')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data), {'calls': 1})
@@ -0,0 +1,163 @@
+import time
+
+from flask import Flask, json, request
+from flask_webapi import WebAPI, filters, route
+from flask_webapi.caches import MemoryCache
+from flask_webapi.decorators import cache
+from unittest import TestCase
+
+
+class TestMemoryCache(TestCase):
+    def test_get_and_set(self):
+        memory_cache = MemoryCache()
+        memory_cache.set('key', 'value')
+        self.assertEqual(memory_cache.get('key'), 'value')
+        self.assertIsNone(memory_cache.get('other'))
+
+    def test_least_recently_used_is_evicted(self):
+        memory_cache = MemoryCache(max_size=2)
+        memory_cache.set('key1', 'value1')
+        memory_cache.set('key2', 'value2')
+        memory_cache.get('key1')
+        memory_cache.set('key3', 'value3')
+
+        self.assertEqual(memory_cache.get('key1'), 'value1')
+        self.assertIsNone(memory_cache.get('key2'))
+        self.assertEqual(memory_cache.get('key3'), 'value3')
+
+    def test_timeout(self):
+        memory_cache = MemoryCache()
+        memory_cache.set('key', 'value', timeout=0.01)
+        time.sleep(0.02)
+        self.assertIsNone(memory_cache.get('key'))
+
+    def test_delete_and_clear(self):
+        memory_cache = MemoryCache()
+        memory_cache.set('key1', 'value1')
+        memory_cache.set('key2', 'value2')
+
+        memory_cache.delete('key1')
+        self.assertIsNone(memory_cache.get('key1'))
+
+        memory_cache.clear()
+        self.assertIsNone(memory_cache.get('key2'))
+
+
+class TestCacheFilter(TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.api = WebAPI(self.app)
+        self.client = self.app.test_client()
+        self.calls = 0
+
+    def add_view(self, query_params=None, **kwargs):
+        @route('/view/<int:id>', methods=['GET', 'POST'])
+        @cache(query_params=query_params, **kwargs)
+        def view(id):
+            self.calls += 1
+            return {'id': id, 'calls': self.calls,
+                    'user': request.headers.get('Authorization') or request.headers.get('Cookie')}
+
+        self.api.add_view(view)
+
+    def test_cached_response(self):
+        self.add_view()
+
+        response = self.client.get('/view/1')
+        self.assertEqual(json.loads(response.data), {'id': 1, 'calls': 1, 'user': None})
+
+        response = self.client.get('/view/1')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content_type, 'application/json')
+        self.assertEqual(json.loads(response.data), {'id': 1, 'calls': 1, 'user': None})
+
+    def test_view_args_in_key(self):
+        self.add_view()
+
+        self.client.get('/view/1')
+        response = self.client.get('/view/2')
+        self.assertEqual(json.loads(response.data), {'id': 2, 'calls': 2, 'user': None})
+
+    def test_query_params_in_key(self):
+        self.add_view(query_params=['page'])
+
+        self.client.get('/view/1?page=1&other=1')
+        response = self.client.get('/view/1?page=1&other=2')
+        self.assertEqual(json.loads(response.data), {'id': 1, 'calls': 1, 'user': None})
+
+        response = self.client.get('/view/1?page=2')
+        self.assertEqual(json.loads(response.data), {'id': 1, 'calls': 2, 'user': None})
+
+    def test_mimetype_in_key(self):
+        self.add_view()
+
+        self.client.get('/view/1')
+        response = self.client.get('/view/1', headers={'accept': 'application/json; indent=2'})
+        self.assertEqual(json.loads(response.data), {'id': 1, 'calls': 2, 'user': None})
+
+    def test_post_is_not_cached(self):
+        self.add_view()
+
+        self.client.post('/view/1')
+        response = self.client.post('/view/1')
+        self.assertEqual(json.loads(response.data), {'id': 1, 'calls': 2, 'user': None})
+
+    def test_credentials_are_not_cached(self):
+        self.add_view()
+
+        for header in ('Authorization', 'Cookie'):
+            response = self.client.get('/view/1', headers={header: 'alice'})
+            self.assertEqual(json.loads(response.data)['user'], 'alice')
+
+            response = self.client.get('/view/1', headers={header: 'bob'})
+            self.assertEqual(json.loads(response.data)['user'], 'bob')
+
+        response = self.client.get('/view/1')
+        self.assertEqual(json.loads(response.data), {'id': 1, 'calls': 5, 'user': None})
+
+    def test_vary_headers_in_key(self):
+        self.add_view(vary_headers=['Authorization'])
+
+        self.client.get('/view/1', headers={'Authorization': 'alice'})
+        self.client.get('/view/1', headers={'Authorization': 'bob'})
+
+        response = self.client.get('/view/1', headers={'Authorization': 'alice'})
+        self.assertEqual(json.loads(response.data), {'id': 1, 'calls': 1, 'user': 'alice'})
+
+        response = self.client.get('/view/1', headers={'Authorization': 'bob'})
+        self.assertEqual(json.loads(response.data), {'id': 1, 'calls': 2, 'user': 'bob'})
+
+    def test_key_func(self):
+        self.add_view(key_func=lambda context: request.headers.get('Authorization'))
+
+        self.client.get('/view/1', headers={'Authorization': 'alice'})
+        self.client.get('/view/1', headers={'Authorization': 'bob'})
+
+        response = self.client.get('/view/1', headers={'Authorization': 'bob'})
+        self.assertEqual(json.loads(response.data), {'id': 1, 'calls': 2, 'user': 'bob'})
+
+    def test_response_vary_in_key(self):
+        @route('/view')
+        @cache()
+        def view():
+            self.calls += 1
+            context.response.vary.add('X-Tenant')
+            return {'tenant': request.headers.get('X-Tenant'), 'calls': self.calls}
+
+        context = None
+
+        class Filter(filters.ResourceFilter):
+            def on_resource_execution(self, action_context, next_filter):
+                nonlocal context
+                context = action_context
+                next_filter(action_context)
+
+        view = Filter()(view)
+        self.api.add_view(view)
+
+        self.client.get('/view', headers={'X-Tenant': 'a'})
+        response = self.client.get('/view', headers={'X-Tenant': 'b'})
+        self.assertEqual(json.loads(response.data), {'tenant': 'b', 'calls': 2})
+
+        response = self.client.get('/view', headers={'X-Tenant': 'a'})
+        self.assertEqual(json.loads(response.data), {'tenant': 'a', 'calls': 1})
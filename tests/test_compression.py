@@ -0,0 +1,83 @@
+import gzip
+import zlib
+
+from flask import Flask, json
+from flask_webapi import WebAPI, route
+from flask_webapi.decorators import compress
+from flask_webapi.formatters import OutputFormatter
+from flask_webapi.utils.mimetypes import MimeType
+from unittest import TestCase
+
+
+class TestCompressionFilter(TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.api = WebAPI(self.app)
+        self.client = self.app.test_client()
+
+    def add_view(self, value, min_size=10):
+        @route('/view')
+        @compress(min_size=min_size)
+        def view():
+            return value
+
+        self.api.add_view(view)
+
+    def test_gzip(self):
+        data = [{'field': 'value'}] * 100
+        self.add_view(data)
+
+        response = self.client.get('/view', headers={'Accept-Encoding': 'gzip, deflate'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(response.headers['Vary'], 'Accept-Encoding')
+        self.assertEqual(json.loads(gzip.decompress(response.data).decode()), data)
+
+    def test_deflate(self):
+        data = [{'field': 'value'}] * 100
+        self.add_view(data)
+
+        response = self.client.get('/view', headers={'Accept-Encoding': 'gzip;q=0.5, deflate'})
+        self.assertEqual(response.headers['Content-Encoding'], 'deflate')
+        self.assertEqual(json.loads(zlib.decompress(response.data).decode()), data)
+
+    def test_encoding_not_accepted(self):
+        data = [{'field': 'value'}] * 100
+        self.add_view(data)
+
+        response = self.client.get('/view', headers={'Accept-Encoding': 'br, gzip;q=0'})
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertEqual(json.loads(response.data), data)
+
+    def test_min_size(self):
+        self.add_view({'field': 'value'}, min_size=1000)
+
+        response = self.client.get('/view', headers={'Accept-Encoding': 'gzip'})
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertEqual(json.loads(response.data), {'field': 'value'})
+
+    def test_compressed_mimetype(self):
+        self.api.output_formatters = [ImageOutputFormatter()]
+        self.add_view('image')
+
+        response = self.client.get('/view', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.content_type, 'image/png')
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertEqual(response.data, b'0' * 100)
+
+    def test_streamed_response(self):
+        data = [{'field': i} for i in range(1000)]
+        self.add_view(iter(data))
+
+        response = self.client.get('/view', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertNotIn('Content-Length', response.headers)
+        self.assertEqual(json.loads(gzip.decompress(response.data).decode()), data)
+
+
+class ImageOutputFormatter(OutputFormatter):
+    mimetype = MimeType.parse('image/png')
+
+    def write(self, response, data, mimetype=None):
+        response.set_data(b'0' * 100)
+        response.content_type = str(mimetype)
@@ -0,0 +1,59 @@
+from flask import Flask, json
+from flask_webapi import WebAPI, route
+from flask_webapi.decorators import etag
+from unittest import TestCase
+
+
+class TestETagFilter(TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.api = WebAPI(self.app)
+        self.client = self.app.test_client()
+        self.calls = 0
+
+    def test_etag_from_body(self):
+        @route('/view', methods=['GET', 'POST'])
+        @etag()
+        def view():
+            self.calls += 1
+            return {'field': 'value'}
+
+        self.api.add_view(view)
+
+        response = self.client.get('/view')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data), {'field': 'value'})
+
+        value = response.headers['ETag']
+
+        response = self.client.get('/view', headers={'If-None-Match': value})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+
+        response = self.client.get('/view', headers={'If-None-Match': '"other"'})
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.post('/view')
+        self.assertNotIn('ETag', response.headers)
+
+    def test_etag_from_func(self):
+        @route('/view/<int:id>')
+        @etag(lambda id: 'version%d' % id)
+        def view(id):
+            self.calls += 1
+            return {'id': id}
+
+        self.api.add_view(view)
+
+        response = self.client.get('/view/1')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['ETag'], '"version1"')
+
+        response = self.client.get('/view/1', headers={'If-None-Match': '"version1"'})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers['ETag'], '"version1"')
+        self.assertEqual(self.calls, 1)
+
+        response = self.client.get('/view/2', headers={'If-None-Match': '"version1"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.calls, 2)
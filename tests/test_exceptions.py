@@ -101,6 +101,15 @@ class TestDenormalize(TestCase):
 
         self.assertEqual(errors, expected_errors)
 
+    def test_dict_message_with_index_keys(self):
+        errors = ValidationError({0: 'bad', 1: {'name': 'bad'}}).denormalize()
+        expected_errors = [
+            {'message': 'bad', 'field': 0},
+            {'message': 'bad', 'field': '1.name'}
+        ]
+
+        self.assertEqual(sorted(errors, key=str), sorted(expected_errors, key=str))
+
 
 class TestView(TestCase):
     def setUp(self):
@@ -1,3 +1,4 @@
+import array
 import datetime
 import uuid
 
@@ -12,7 +13,7 @@ from flask import Flask, json
 from flask_webapi import WebAPI, fields, route, result
 from flask_webapi.exceptions import ValidationError
 from flask_webapi.utils import timezone
-from unittest import TestCase
+from unittest import TestCase, skipIf
 from werkzeug.datastructures import MultiDict
 
 
@@ -486,6 +487,100 @@ class TestListField(TestCase, FieldValues):
         with self.assertRaises(ValidationError):
             field.load([])
 
+    def test_primitive_children(self):
+        inputs = [
+            (fields.IntegerField(), [1, '2', 3.5, True]),
+            (fields.FloatField(), [1, '2.5', 3.5]),
+            (fields.BooleanField(), [True, 'false', 1, 0.0]),
+            (fields.StringField(), [' a ', 1, 'b']),
+            (fields.StringField(trim_whitespace=False), [' a ', 1]),
+            (fields.StringField(allow_none=True), ['a', '', None]),
+            (fields.IntegerField(allow_none=True), [1, None])
+        ]
+
+        for child, value in inputs:
+            self.assertEqual(fields.ListField(child).load(value), [child.load(item) for item in value])
+
+    def test_primitive_children_with_errors(self):
+        inputs = [
+            (fields.IntegerField(), [1, 'a', None], [1, 2]),
+            (fields.IntegerField(), ['1' * 1001, '2'], [0]),
+            (fields.FloatField(), [1.5, {}], [1]),
+            (fields.BooleanField(), [True, 'yes', []], [1, 2]),
+            (fields.StringField(), ['a', ' ', None], [1, 2]),
+            (fields.IntegerField(max_value=10), [1, 20], [1])
+        ]
+
+        for child, value, indexes in inputs:
+            with self.assertRaises(ValidationError) as exc_info:
+                fields.ListField(child).load(value)
+            self.assertEqual(sorted(exc_info.exception.message), indexes)
+
+
+class TestNumericArrayField(TestCase):
+    def test_load(self):
+        field = fields.NumericArrayField(use_numpy=False)
+        value = field.load([1, '2.5', 3])
+        self.assertEqual(value, array.array('d', [1.0, 2.5, 3.0]))
+
+    def test_load_integers(self):
+        field = fields.NumericArrayField('q', use_numpy=False)
+        self.assertEqual(field.load(['1', 2]), array.array('q', [1, 2]))
+
+    def test_load_array(self):
+        field = fields.NumericArrayField(use_numpy=False)
+        self.assertEqual(field.load(array.array('i', [1, 2])), array.array('d', [1.0, 2.0]))
+
+    def test_load_invalid_items(self):
+        field = fields.NumericArrayField(use_numpy=False)
+
+        with self.assertRaises(ValidationError) as exc_info:
+            field.load([1, 'a'])
+        self.assertEqual(exc_info.exception.message, {1: [ValidationError('A valid number is required.')]})
+
+    def test_load_overflow(self):
+        field = fields.NumericArrayField('b', use_numpy=False)
+
+        with self.assertRaises(ValidationError) as exc_info:
+            field.load([1, 1000])
+        self.assertEqual(exc_info.exception.message, 'Value out of range.')
+
+    def test_load_float_overflow(self):
+        field = fields.NumericArrayField('f', use_numpy=False)
+        self.assertEqual(field.load([1.5, float('inf')]), array.array('f', [1.5, float('inf')]))
+
+        with self.assertRaises(ValidationError) as exc_info:
+            field.load([1, 1e40])
+        self.assertEqual(exc_info.exception.message, 'Value out of range.')
+
+    def test_invalid_typecode(self):
+        with self.assertRaises(ValueError):
+            fields.NumericArrayField('x')
+
+        with self.assertRaises(ValueError):
+            fields.NumericArrayField('u')
+
+    def test_dump(self):
+        field = fields.NumericArrayField(use_numpy=False)
+        self.assertEqual(field.dump(array.array('d', [1.0, 2.5])), [1.0, 2.5])
+        self.assertEqual(field.dump([1, '2.5']), [1.0, 2.5])
+
+    @skipIf(fields.numpy is None, 'numpy is not installed')
+    def test_numpy(self):
+        field = fields.NumericArrayField()
+        value = field.load([1, 2.5])
+
+        self.assertIsInstance(value, fields.numpy.ndarray)
+        self.assertEqual(field.dump(value), [1.0, 2.5])
+
+    @skipIf(fields.numpy is None, 'numpy is not installed')
+    def test_numpy_overflow(self):
+        field = fields.NumericArrayField('b')
+
+        with self.assertRaises(ValidationError) as exc_info:
+            field.load([1, 1000])
+        self.assertEqual(exc_info.exception.message, 'Value out of range.')
+
 
 class TestStringField(TestCase, FieldValues):
     """
@@ -856,6 +951,23 @@ class TestErrorMessages(TestCase):
 
 
 class TestValidators(TestCase):
+    def test_validators_are_not_shared(self):
+        class Schema(fields.Schema):
+            name = fields.StringField()
+            tags = fields.ListField(fields.StringField())
+
+        schema = Schema()
+        schema.fields['name'].validators.append(lambda x: False)
+        schema.fields['name'].error_messages['validator_failed'] = 'Changed.'
+        schema.fields['tags'].child.validators.append(lambda x: False)
+
+        other_schema = Schema()
+        self.assertEqual(other_schema.fields['name'].validators, [])
+        self.assertEqual(other_schema.fields['name'].error_messages['validator_failed'], 'Invalid value.')
+        self.assertEqual(other_schema.fields['tags'].child.validators, [])
+        self.assertEqual(Schema._declared_fields['name'].validators, [])
+        self.assertEqual(other_schema.load({'name': 'foo', 'tags': ['bar']}), {'name': 'foo', 'tags': ['bar']})
+
     def test_validator_without_return(self):
         def validate(value):
             pass
@@ -1103,6 +1215,344 @@ class TestLoad(TestCase):
         self.assertEqual(Schema().loads(data), expected)
 
 
+class TestRefresh(TestCase):
+    def test_fields_are_bound_to_each_schema(self):
+        class Schema(fields.Schema):
+            field = fields.IntegerField(min_value=1)
+
+        schema1 = Schema()
+        schema2 = Schema(only=('field',))
+
+        self.assertIsNot(schema1.fields['field'], schema2.fields['field'])
+        self.assertIs(schema1.fields['field'].parent, schema1)
+        self.assertIs(schema2.fields['field'].parent, schema2)
+        self.assertIsNot(schema1.fields['field'].validators, schema2.fields['field'].validators)
+        self.assertIs(schema1.fields['field'].validators[0], schema2.fields['field'].validators[0])
+
+    def test_nested_schema_is_bound_to_each_schema(self):
+        class ChildSchema(fields.Schema):
+            field = fields.IntegerField()
+
+        class Schema(fields.Schema):
+            child = ChildSchema()
+
+        schema = Schema(partial=True)
+        child = schema.fields['child']
+
+        self.assertIsNot(child, Schema().fields['child'])
+        self.assertIs(child.fields['field'].root, schema)
+        self.assertEqual(schema.load({'child': {}}), {'child': {}})
+
+    def test_error_messages_are_not_changed(self):
+        class Schema(fields.Schema):
+            field = fields.BooleanField(error_messages={'invalid': {'message': '"{value}" is invalid.'}})
+
+        with self.assertRaises(ValidationError) as exc_info:
+            Schema().load({'field': 'a'})
+        self.assertEqual(exc_info.exception.message, {'field': [ValidationError('"a" is invalid.')]})
+
+        with self.assertRaises(ValidationError) as exc_info:
+            Schema().load({'field': 'b'})
+        self.assertEqual(exc_info.exception.message, {'field': [ValidationError('"b" is invalid.')]})
+
+
+class TestCompiled(TestCase):
+    def test_dump(self):
+        class Model(object):
+            name = 'foo'
+            age = '30'
+            score = None
+
+        class Schema(fields.Schema):
+            name = fields.StringField()
+            age = fields.IntegerField(dump_to='years')
+            score = fields.FloatField()
+            active = fields.BooleanField(default=True)
+            created = fields.DateField(required=False)
+
+        expected = {'name': 'foo', 'years': 30, 'score': None, 'active': True}
+        self.assertEqual(Schema(compiled=True).dump(Model()), expected)
+        self.assertEqual(Schema(compiled=True).dumps([Model()]), [expected])
+
+    def test_dump_with_only(self):
+        class Schema(fields.Schema):
+            compiled = True
+            name = fields.StringField()
+            age = fields.IntegerField()
+
+        data = {'name': 'foo', 'age': 30}
+        self.assertEqual(Schema(only=('name',)).dump(data), {'name': 'foo'})
+        self.assertEqual(Schema().dump(data), data)
+
+    def test_load(self):
+        class Schema(fields.Schema):
+            name = fields.StringField(load_from='full_name')
+            age = fields.IntegerField(min_value=18)
+            active = fields.BooleanField(default=False)
+
+        data = {'full_name': ' foo ', 'age': '30'}
+        self.assertEqual(Schema(compiled=True).load(data), {'name': 'foo', 'age': 30, 'active': False})
+
+    def test_load_with_html_input(self):
+        class Schema(fields.Schema):
+            name = fields.StringField(required=False)
+            scores = fields.ListField(fields.IntegerField())
+
+        data = MultiDict([('name', ''), ('scores', '1'), ('scores', '2')])
+        self.assertEqual(Schema(compiled=True).load(data), {'scores': [1, 2]})
+
+    def test_load_with_errors(self):
+        class Schema(fields.Schema):
+            name = fields.StringField()
+            age = fields.IntegerField(max_value=10)
+
+        with self.assertRaises(ValidationError) as exc_info:
+            Schema(compiled=True).load({'age': 20})
+        self.assertEqual(exc_info.exception.message, {'name': [ValidationError('This field is required.')],
+                                                      'age': [ValidationError('Must be at most 10.')]})
+
+    def test_load_partial(self):
+        class Schema(fields.Schema):
+            name = fields.StringField()
+            age = fields.IntegerField()
+
+        self.assertEqual(Schema(partial=True, compiled=True).load({'age': 1}), {'age': 1})
+
+
+class TestNestedField(TestCase):
+    class AuthorSchema(fields.Schema):
+        name = fields.StringField()
+        email = fields.StringField()
+
+    def setUp(self):
+        class BookSchema(fields.Schema):
+            title = fields.StringField()
+            author = fields.NestedField(self.AuthorSchema)
+            reviewers = fields.NestedField(self.AuthorSchema, many=True, required=False)
+
+        self.BookSchema = BookSchema
+        self.book = {'title': 'foo',
+                     'author': {'name': 'bar', 'email': 'bar@mail.com'},
+                     'reviewers': [{'name': 'baz', 'email': 'baz@mail.com'}]}
+
+    def test_dump(self):
+        self.assertEqual(self.BookSchema().dump(self.book), self.book)
+        self.assertEqual(self.BookSchema(compiled=True).dump(self.book), self.book)
+
+    def test_dump_none(self):
+        data = self.BookSchema().dump({'title': 'foo', 'author': None, 'reviewers': [None]})
+        self.assertEqual(data, {'title': 'foo', 'author': None, 'reviewers': [None]})
+
+    def test_load(self):
+        self.assertEqual(self.BookSchema().load(self.book), self.book)
+
+    def test_load_with_errors(self):
+        with self.assertRaises(ValidationError) as exc_info:
+            self.BookSchema().load({'title': 'foo', 'author': {'name': 'bar'}, 'reviewers': [{}, self.book['author']]})
+
+        errors = exc_info.exception.denormalize()
+        self.assertEqual(sorted(error['field'] for error in errors),
+                         ['author.email', 'reviewers.0.email', 'reviewers.0.name'])
+
+    def test_load_many_invalid(self):
+        with self.assertRaises(ValidationError) as exc_info:
+            self.BookSchema().load({'title': 'foo', 'author': self.book['author'], 'reviewers': {}})
+        self.assertEqual(exc_info.exception.message, {'reviewers': [ValidationError('Not a valid list.')]})
+
+    def test_load_partial(self):
+        self.assertEqual(self.BookSchema(partial=True).load({'author': {'name': 'bar'}}), {'author': {'name': 'bar'}})
+
+    def test_schema_is_shared(self):
+        schema1 = self.BookSchema()
+        schema2 = self.BookSchema()
+        self.assertIs(schema1.fields['author'].get_schema(), schema2.fields['author'].get_schema())
+
+    def test_only(self):
+        class BookSchema(fields.Schema):
+            title = fields.StringField()
+            author = fields.NestedField(self.AuthorSchema(only=('name',)))
+
+        self.assertEqual(BookSchema().dump(self.book), {'title': 'foo', 'author': {'name': 'bar'}})
+
+    def test_dotted_only(self):
+        schema = self.BookSchema(only=('title', 'author.name', 'reviewers.email'))
+        self.assertEqual(schema.dump(self.book), {'title': 'foo',
+                                                  'author': {'name': 'bar'},
+                                                  'reviewers': [{'email': 'baz@mail.com'}]})
+        self.assertEqual(self.BookSchema().dump(self.book), self.book)
+
+    def test_dotted_only_with_whole_field(self):
+        schema = self.BookSchema(only=('author', 'author.name'))
+        self.assertEqual(schema.dump(self.book), {'author': self.book['author']})
+
+    def test_dotted_only_restricted_by_field(self):
+        class BookSchema(fields.Schema):
+            author = fields.NestedField(self.AuthorSchema, only=('name',))
+
+        self.assertEqual(BookSchema(only=('author.email',)).dump(self.book), {'author': {}})
+
+    def test_fields_parameter(self):
+        app = Flask(__name__)
+        api = WebAPI(app)
+
+        @route('/view')
+        @result(self.BookSchema)
+        def view():
+            return self.book
+
+        api.add_view(view)
+        response = app.test_client().get('/view?fields=title,author.name')
+        self.assertEqual(json.loads(response.data), {'title': 'foo', 'author': {'name': 'bar'}})
+
+    def test_fields_parameter_with_dotted_only(self):
+        app = Flask(__name__)
+        api = WebAPI(app)
+
+        @route('/view')
+        @result(self.BookSchema(only=('title', 'author.name')))
+        def view():
+            return self.book
+
+        api.add_view(view)
+        client = app.test_client()
+
+        response = client.get('/view?fields=author')
+        self.assertEqual(json.loads(response.data), {'author': {'name': 'bar'}})
+
+        response = client.get('/view?fields=author.email,reviewers')
+        self.assertEqual(json.loads(response.data), {})
+
+    def test_restrict_only(self):
+        schema = self.BookSchema(only=('title', 'author.name'))
+        self.assertEqual(schema.restrict_only(['title.x']), ['title.x'])
+        self.assertEqual(schema.restrict_only(['author']), ['author.name'])
+        self.assertEqual(schema.restrict_only(['author.name.x', 'author.email']), ['author.name.x'])
+        self.assertEqual(schema.restrict_only(['reviewers']), [])
+        self.assertEqual(self.BookSchema().restrict_only(['reviewers']), ['reviewers'])
+
+
+class TestFailFast(TestCase):
+    class Schema(fields.Schema):
+        name = fields.StringField()
+        age = fields.IntegerField()
+        scores = fields.ListField(fields.IntegerField(), required=False)
+
+    def test_load(self):
+        for compiled in (False, True):
+            with self.assertRaises(ValidationError) as exc_info:
+                self.Schema(fail_fast=True, compiled=compiled).load({'age': 'a'})
+            self.assertEqual(exc_info.exception.message, {'name': [ValidationError('This field is required.')]})
+
+    def test_load_all_errors_by_default(self):
+        for compiled in (False, True):
+            with self.assertRaises(ValidationError) as exc_info:
+                self.Schema(compiled=compiled).load({'age': 'a'})
+            self.assertEqual(sorted(exc_info.exception.message), ['age', 'name'])
+
+    def test_load_list(self):
+        with self.assertRaises(ValidationError) as exc_info:
+            self.Schema(fail_fast=True).load({'name': 'foo', 'age': 1, 'scores': [1, 'a', 'b']})
+        self.assertEqual(exc_info.exception.message, {'scores': {1: [ValidationError('A valid integer is required.')]}})
+
+    def test_load_nested(self):
+        class ChildSchema(fields.Schema):
+            name = fields.StringField()
+            age = fields.IntegerField()
+
+        class Schema(fields.Schema):
+            fail_fast = True
+            children = fields.NestedField(ChildSchema, many=True)
+
+        with self.assertRaises(ValidationError) as exc_info:
+            Schema().load({'children': [{'name': 'foo', 'age': 1}, {}, {}]})
+        self.assertEqual(exc_info.exception.denormalize(), [{'field': 'children.1.name',
+                                                             'message': 'This field is required.'}])
+
+    def test_valid_data(self):
+        data = {'name': 'foo', 'age': 1, 'scores': [1]}
+        self.assertEqual(self.Schema(fail_fast=True).load(data), data)
+
+
+class TestGetCached(TestCase):
+    class Schema(fields.Schema):
+        name = fields.StringField()
+        age = fields.IntegerField()
+
+    def test_same_instance(self):
+        schema = self.Schema.get_cached(only=['name', 'age'])
+        self.assertIs(self.Schema.get_cached(only=('age', 'name')), schema)
+        self.assertIsNot(self.Schema.get_cached(only=['name']), schema)
+        self.assertIsNot(self.Schema.get_cached(only=['name', 'age'], partial=True), schema)
+
+    def test_arguments(self):
+        schema = self.Schema.get_cached(only=['name'], partial=True)
+        self.assertEqual(schema.dump({'name': 'foo', 'age': 1}), {'name': 'foo'})
+        self.assertEqual(schema.load({}), {})
+
+    def test_cache_per_class(self):
+        class ChildSchema(self.Schema):
+            pass
+
+        self.assertIsInstance(ChildSchema.get_cached(), ChildSchema)
+        self.assertNotIsInstance(self.Schema.get_cached(), ChildSchema)
+
+    def test_max_cached_instances(self):
+        class Schema(fields.Schema):
+            max_cached_instances = 2
+            name = fields.StringField()
+            age = fields.IntegerField()
+
+        schema = Schema.get_cached()
+        Schema.get_cached(only=['name'])
+        self.assertIs(Schema.get_cached(), schema)
+        Schema.get_cached(only=['age'])
+        self.assertIs(Schema.get_cached(), schema)
+        self.assertEqual(len(Schema._cached_instances), 2)
+
+
+class TestDumpColumns(TestCase):
+    def test_dump_columns(self):
+        class Model(object):
+            def __init__(self, name, age, score):
+                self.name = name
+                self.age = age
+                self.score = score
+
+        class Schema(fields.Schema):
+            name = fields.StringField()
+            age = fields.IntegerField(dump_to='years')
+            score = fields.FloatField()
+            active = fields.BooleanField(default=True)
+            created = fields.DateField()
+
+        instances = [Model('foo', '30', None), {'name': 1, 'age': 20.5, 'created': datetime.date(2016, 1, 1)}]
+        self.assertEqual(Schema().dump_columns(instances), {'name': ['foo', '1'],
+                                                            'years': [30, 20],
+                                                            'score': [None, None],
+                                                            'active': [True, True],
+                                                            'created': [None, '2016-01-01']})
+
+    def test_dump_columns_from_iterator(self):
+        class Schema(fields.Schema):
+            value = fields.IntegerField()
+
+        self.assertEqual(Schema().dump_columns({'value': i} for i in range(3)), {'value': [0, 1, 2]})
+
+    def test_dump_columns_with_only(self):
+        class Schema(fields.Schema):
+            name = fields.StringField()
+            password = fields.StringField(load_only=True)
+            age = fields.IntegerField()
+
+        self.assertEqual(Schema(only=('age', 'password')).dump_columns([{'age': 1, 'password': 'x'}]), {'age': [1]})
+
+    def test_dump_columns_empty(self):
+        class Schema(fields.Schema):
+            name = fields.StringField()
+
+        self.assertEqual(Schema().dump_columns([]), {'name': []})
+
+
 class TestView(TestCase):
     def setUp(self):
         self.app = Flask(__name__)
@@ -1136,57 +1586,149 @@ class TestView(TestCase):
         response = self.client.get('/view')
         self.assertEqual(response.status_code, 200)
         self.assertEqual(json.loads(response.data), [dict(field='value')])
-    #
-    # def test_fields_parameter(self):
-    #     class Schema(fields.Schema):
-    #         first_name = fields.StringField()
-    #         last_name = fields.StringField()
-    #         age = fields.IntegerField()
-    #
-    #     @route('/view')
-    #     @serialize(Schema)
-    #     def view():
-    #         return {'first_name': 'foo',
-    #                 'last_name': 'bar',
-    #                 'age': 30}
-    #
-    #     self.api.add_view(view)
-    #     response = self.client.get('/view?fields=last_name')
-    #     self.assertEqual(response.status_code, 200)
-    #     self.assertEqual(json.loads(response.data), {'last_name': 'bar'})
-    #
-    # def test_fields_parameter_with_empty_value(self):
-    #     class Schema(fields.Schema):
-    #         first_name = fields.StringField()
-    #         last_name = fields.StringField()
-    #         age = fields.IntegerField()
-    #
-    #     @route('/view')
-    #     @serialize(Schema)
-    #     def view():
-    #         return {'first_name': 'foo',
-    #                 'last_name': 'bar',
-    #                 'age': 30}
-    #
-    #     self.api.add_view(view)
-    #     response = self.client.get('/view?fields=')
-    #     self.assertEqual(response.status_code, 200)
-    #     self.assertEqual(json.loads(response.data), {'first_name': 'foo', 'last_name': 'bar', 'age': 30})
-    #
-    # def test_fields_parameter_with_invalid_field_name(self):
-    #     class Schema(fields.Schema):
-    #         first_name = fields.StringField()
-    #         last_name = fields.StringField()
-    #         age = fields.IntegerField()
-    #
-    #     @route('/view')
-    #     @serialize(Schema)
-    #     def view():
-    #         return {'first_name': 'foo',
-    #                 'last_name': 'bar',
-    #                 'age': 30}
-    #
-    #     self.api.add_view(view)
-    #     response = self.client.get('/view?fields=password')
-    #     self.assertEqual(response.status_code, 200)
-    #     self.assertEqual(json.loads(response.data), {})
+
+    def test_streamed_results(self):
+        class Schema(fields.Schema):
+            field = fields.IntegerField()
+
+        @route('/view')
+        @result(Schema)
+        def view():
+            return ({'field': i} for i in range(3))
+
+        self.api.add_view(view)
+        response = self.client.get('/view')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_streamed)
+        self.assertEqual(json.loads(response.data), [{'field': 0}, {'field': 1}, {'field': 2}])
+
+    def test_fields_parameter(self):
+        class Schema(fields.Schema):
+            first_name = fields.StringField()
+            last_name = fields.StringField()
+            age = fields.IntegerField()
+
+        @route('/view')
+        @result(Schema)
+        def view():
+            return {'first_name': 'foo',
+                    'last_name': 'bar',
+                    'age': 30}
+
+        self.api.add_view(view)
+        response = self.client.get('/view?fields=last_name')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data), {'last_name': 'bar'})
+
+    def test_fields_parameter_with_empty_value(self):
+        class Schema(fields.Schema):
+            first_name = fields.StringField()
+            last_name = fields.StringField()
+            age = fields.IntegerField()
+
+        @route('/view')
+        @result(Schema)
+        def view():
+            return {'first_name': 'foo',
+                    'last_name': 'bar',
+                    'age': 30}
+
+        self.api.add_view(view)
+        response = self.client.get('/view?fields=')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data), {'first_name': 'foo', 'last_name': 'bar', 'age': 30})
+
+    def test_fields_parameter_with_invalid_field_name(self):
+        class Schema(fields.Schema):
+            first_name = fields.StringField()
+            last_name = fields.StringField()
+            age = fields.IntegerField()
+
+        @route('/view')
+        @result(Schema)
+        def view():
+            return {'first_name': 'foo',
+                    'last_name': 'bar',
+                    'age': 30}
+
+        self.api.add_view(view)
+        response = self.client.get('/view?fields=password')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data), {})
+
+    def test_fields_parameter_with_only(self):
+        class Schema(fields.Schema):
+            first_name = fields.StringField()
+            last_name = fields.StringField()
+
+        @route('/view')
+        @result(Schema(only=('first_name',)))
+        def view():
+            return {'first_name': 'foo',
+                    'last_name': 'bar'}
+
+        self.api.add_view(view)
+        response = self.client.get('/view?fields=last_name')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data), {})
+
+    def test_fields_parameter_with_collection(self):
+        class Schema(fields.Schema):
+            first_name = fields.StringField()
+            last_name = fields.StringField()
+
+        requested_fields = []
+
+        @route('/view')
+        @result(Schema)
+        def view():
+            requested_fields.append(self.api.get_requested_fields())
+            return [{'first_name': 'foo', 'last_name': 'bar'}]
+
+        self.api.add_view(view)
+        response = self.client.get('/view?fields=first_name, unknown')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data), [{'first_name': 'foo'}])
+        self.assertEqual(requested_fields, [{'first_name', 'unknown'}])
+
+    def test_fields_parameter_keeps_schema_options(self):
+        class Schema(fields.Schema):
+            first_name = fields.StringField()
+            last_name = fields.StringField()
+
+        schemas = []
+
+        class ResultSchema(Schema):
+            def post_dump(self, data, original_data):
+                schemas.append(self)
+                return data
+
+        @route('/view')
+        @result(ResultSchema(compiled=True, fail_fast=True))
+        def view():
+            return {'first_name': 'foo',
+                    'last_name': 'bar'}
+
+        self.api.add_view(view)
+
+        response = self.client.get('/view?fields=last_name')
+        self.assertEqual(json.loads(response.data), {'last_name': 'bar'})
+        self.assertTrue(schemas[0].compiled)
+        self.assertTrue(schemas[0].fail_fast)
+
+    def test_fields_parameter_with_custom_name(self):
+        class Schema(fields.Schema):
+            first_name = fields.StringField()
+            last_name = fields.StringField()
+
+        @route('/view')
+        @result(Schema)
+        def view():
+            return {'first_name': 'foo',
+                    'last_name': 'bar'}
+
+        self.api.object_result_executor.fields_param = 'attrs'
+        self.api.add_view(view)
+
+        response = self.client.get('/view?attrs=last_name&fields=first_name')
+        self.assertEqual(json.loads(response.data), {'last_name': 'bar'})
@@ -0,0 +1,225 @@
+from flask import Flask, Response
+from flask_webapi import WebAPI, route
+from flask_webapi.filters import ActionFilter, AuthenticationFilter, ExceptionFilter, ResourceFilter, ResultFilter
+from flask_webapi.results import NoContent
+from unittest import TestCase
+
+
+class TestFilterPipeline(TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.api = WebAPI(self.app)
+        self.client = self.app.test_client()
+        self.calls = []
+
+    def test_execution_order(self):
+        calls = self.calls
+
+        @route('/view')
+        @FakeResultFilter(calls, 'result')
+        @FakeActionFilter(calls, 'action1')
+        @FakeActionFilter(calls, 'action2')
+        @FakeResourceFilter(calls, 'resource')
+        @FakeAuthenticationFilter(calls, 'authentication')
+        def view():
+            calls.append('view')
+
+        self.api.add_view(view)
+
+        response = self.client.get('/view')
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(calls, ['authentication', 'resource', 'action1', 'action2', 'view', 'result'])
+
+    def test_short_circuit_on_authentication(self):
+        calls = self.calls
+
+        @route('/view')
+        @FakeActionFilter(calls, 'action')
+        @FakeAuthenticationFilter(calls, 'authentication', result=NoContent())
+        def view():
+            calls.append('view')
+
+        self.api.add_view(view)
+
+        response = self.client.get('/view')
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(calls, ['authentication'])
+
+    def test_short_circuit_on_action_filter(self):
+        calls = self.calls
+
+        @route('/view')
+        @FakeResultFilter(calls, 'result')
+        @FakeActionFilter(calls, 'action1', result=NoContent())
+        @FakeActionFilter(calls, 'action2')
+        def view():
+            calls.append('view')
+
+        self.api.add_view(view)
+
+        response = self.client.get('/view')
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(calls, ['action1', 'result'])
+
+    def test_exception_filters_from_innermost(self):
+        calls = self.calls
+
+        @route('/view')
+        @FakeExceptionFilter(calls, 'exception2')
+        @FakeExceptionFilter(calls, 'exception1')
+        def view():
+            raise ValueError()
+
+        self.api.add_view(view)
+
+        response = self.client.get('/view')
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(calls, ['exception1'])
+
+
+class TestActionContext(TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.api = WebAPI(self.app)
+        self.client = self.app.test_client()
+
+    def test_collections_are_copied_on_access(self):
+        contexts = []
+
+        class ContextFilter(ActionFilter):
+            def on_action_execution(self, context, next_filter):
+                contexts.append(context)
+                self.formatters = context.get_output_formatters()
+                context.output_formatters.clear()
+                next_filter(context)
+
+        context_filter = ContextFilter()
+
+        @route('/view')
+        @context_filter
+        def view():
+            pass
+
+        self.api.add_view(view)
+
+        response = self.client.get('/view')
+        self.assertEqual(response.status_code, 204)
+        self.assertIs(context_filter.formatters, self.api.output_formatters)
+        self.assertEqual(contexts[0].output_formatters, [])
+        self.assertEqual(len(self.api.output_formatters), 1)
+
+    def test_filters_added_on_authentication(self):
+        calls = []
+        added_filters = [FakeAuthenticationFilter(calls, 'authentication2'),
+                         FakeResourceFilter(calls, 'resource'),
+                         FakeActionFilter(calls, 'action')]
+
+        class AddFiltersFilter(AuthenticationFilter):
+            def on_authentication(self, context):
+                calls.append('authentication1')
+                context.filters.extend(added_filters)
+
+        @route('/view')
+        @AddFiltersFilter()
+        def view():
+            calls.append('view')
+
+        self.api.add_view(view)
+
+        response = self.client.get('/view')
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(calls, ['authentication1', 'authentication2', 'resource', 'action', 'view'])
+
+        # the filters of the action are not changed.
+        del calls[:]
+        self.client.get('/view')
+        self.assertEqual(calls, ['authentication1', 'authentication2', 'resource', 'action', 'view'])
+
+    def test_filters_removed_on_resource_execution(self):
+        calls = []
+
+        class RemoveFiltersFilter(ResourceFilter):
+            def on_resource_execution(self, context, next_filter):
+                context.filters = [self]
+                next_filter(context)
+
+        @route('/view')
+        @RemoveFiltersFilter()
+        @FakeActionFilter(calls, 'action')
+        def view():
+            calls.append('view')
+
+        self.api.add_view(view)
+
+        self.client.get('/view')
+        self.assertEqual(calls, ['view'])
+
+    def test_response_returned_by_action(self):
+        response = Response('text')
+
+        @route('/view')
+        def view():
+            return response
+
+        self.api.add_view(view)
+
+        self.assertEqual(self.client.get('/view').get_data(), b'text')
+
+
+class FakeAuthenticationFilter(AuthenticationFilter):
+    def __init__(self, calls, name, result=None):
+        super().__init__()
+        self.calls = calls
+        self.name = name
+        self.result = result
+
+    def on_authentication(self, context):
+        self.calls.append(self.name)
+        context.result = self.result
+
+
+class FakeResourceFilter(ResourceFilter):
+    def __init__(self, calls, name):
+        super().__init__()
+        self.calls = calls
+        self.name = name
+
+    def on_resource_execution(self, context, next_filter):
+        self.calls.append(self.name)
+        next_filter(context)
+
+
+class FakeActionFilter(ActionFilter):
+    def __init__(self, calls, name, result=None):
+        super().__init__()
+        self.calls = calls
+        self.name = name
+        self.result = result
+
+    def on_action_execution(self, context, next_filter):
+        self.calls.append(self.name)
+        context.result = self.result
+        next_filter(context)
+
+
+class FakeExceptionFilter(ExceptionFilter):
+    def __init__(self, calls, name):
+        super().__init__()
+        self.calls = calls
+        self.name = name
+
+    def on_exception(self, context):
+        self.calls.append(self.name)
+        context.result = NoContent()
+        context.exception_handled = True
+
+
+class FakeResultFilter(ResultFilter):
+    def __init__(self, calls, name):
+        super().__init__()
+        self.calls = calls
+        self.name = name
+
+    def on_result_execution(self, context, next_filter):
+        self.calls.append(self.name)
+        next_filter(context)
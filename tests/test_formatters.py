@@ -1,10 +1,19 @@
+import datetime
+import decimal
+import json as std_json
 import pickle
+import uuid
 
-from flask import Flask, json, Response
-from flask_webapi import WebAPI, route
-from flask_webapi.formatters import OutputFormatter, JsonOutputFormatter, PickleOutputFormatter
+from flask import Flask, json, request, Response
+from flask_webapi import WebAPI, fields, param, result, route
+from flask_webapi.formatters import OutputFormatter, JsonInputFormatter, JsonOutputFormatter, PickleOutputFormatter
+from flask_webapi.formatters import OrjsonBackend, StdlibJsonBackend, orjson
+from flask_webapi.formatters import MessagePackInputFormatter, MessagePackOutputFormatter
+from flask_webapi.exceptions import ValidationError
+from flask_webapi.formatters import NdjsonInputFormatter, NdjsonOutputFormatter, CsvOutputFormatter
+from flask_webapi.utils import msgpack
 from flask_webapi.utils.mimetypes import MimeType
-from unittest import TestCase
+from unittest import TestCase, skipIf
 
 
 class TestView(TestCase):
@@ -84,6 +93,79 @@ class TestJsonOutputFormatter(TestCase):
         self.assertEqual(response.get_data(), b'{"field": "value"}')
         self.assertEqual(json.loads(response.get_data()), data)
 
+    def test_write_stream(self):
+        data = [dict(field=i) for i in range(3)]
+        response = Response()
+
+        self.formatter.write_stream(response, iter(data))
+        self.assertEqual(response.get_data(), b'[{"field": 0},{"field": 1},{"field": 2}]')
+        self.assertEqual(json.loads(response.get_data()), data)
+
+    def test_write_stream_with_chunks(self):
+        data = [dict(field=i) for i in range(3)]
+        response = Response()
+
+        self.formatter.chunk_size = 1
+        self.formatter.write_stream(response, iter(data))
+        self.assertEqual(list(response.iter_encoded()), [b'[{"field": 0}', b',{"field": 1}', b',{"field": 2}', b']'])
+
+    def test_write_empty_stream(self):
+        response = Response()
+
+        self.formatter.write_stream(response, iter([]))
+        self.assertEqual(response.get_data(), b'[]')
+
+
+class TestJsonBackend(TestCase):
+    class DecimalEncoder(std_json.JSONEncoder):
+        def default(self, o):
+            if isinstance(o, decimal.Decimal):
+                return str(o)
+            return super().default(o)
+
+    def test_stdlib_backend(self):
+        formatter = JsonOutputFormatter(StdlibJsonBackend())
+        response = Response()
+
+        formatter.write(response, dict(field='value'))
+        self.assertEqual(response.get_data(), b'{"field": "value"}')
+
+    def test_stdlib_backend_with_encoder_class(self):
+        formatter = JsonOutputFormatter(StdlibJsonBackend(encoder_class=self.DecimalEncoder))
+        response = Response()
+
+        formatter.write(response, dict(field=decimal.Decimal('1.5')))
+        self.assertEqual(response.get_data(), b'{"field": "1.5"}')
+
+    def test_stdlib_backend_read(self):
+        app = Flask(__name__)
+        formatter = JsonInputFormatter(StdlibJsonBackend())
+
+        with app.test_request_context(data='{"field": "value"}', content_type='application/json'):
+            self.assertEqual(formatter.read(request), dict(field='value'))
+
+    @skipIf(orjson is None, 'orjson is not installed')
+    def test_orjson_backend(self):
+        formatter = JsonOutputFormatter(OrjsonBackend())
+        response = Response()
+
+        formatter.write(response, dict(field=datetime.date(2016, 1, 1)))
+        self.assertEqual(response.get_data(), b'{"field":"2016-01-01"}')
+
+    def test_api_backend(self):
+        app = Flask(__name__)
+        api = WebAPI(app, json_backend=StdlibJsonBackend(encoder_class=self.DecimalEncoder))
+
+        @route('/view')
+        def view():
+            return {'field': decimal.Decimal('1.5')}
+
+        api.add_view(view)
+
+        response = app.test_client().get('/view')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_data(), b'{"field": "1.5"}')
+
 
 class TestPickleOutputFormatter(TestCase):
     def setUp(self):
@@ -96,3 +178,250 @@ class TestPickleOutputFormatter(TestCase):
         self.formatter.write(response, data)
         self.assertEqual(response.get_data(), b'\x80\x03}q\x00X\x05\x00\x00\x00fieldq\x01X\x05\x00\x00\x00valueq\x02s.')
         self.assertEqual(pickle.loads(response.get_data()), data)
+
+
+class TestNdjsonFormatters(TestCase):
+    class Schema(fields.Schema):
+        id = fields.IntegerField()
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.api = WebAPI(self.app)
+        self.api.input_formatters.append(NdjsonInputFormatter())
+        self.api.output_formatters.append(NdjsonOutputFormatter())
+        self.client = self.app.test_client()
+
+    def test_write(self):
+        formatter = NdjsonOutputFormatter()
+        response = Response()
+
+        formatter.write(response, [{'id': 1}, {'id': 2}])
+        self.assertEqual(response.content_type, 'application/x-ndjson')
+        self.assertEqual(response.get_data(), b'{"id": 1}\n{"id": 2}\n')
+
+    def test_write_single_item(self):
+        formatter = NdjsonOutputFormatter()
+        response = Response()
+
+        formatter.write(response, {'id': 1})
+        self.assertEqual(response.get_data(), b'{"id": 1}\n')
+
+    def test_write_stream_with_chunks(self):
+        formatter = NdjsonOutputFormatter()
+        formatter.chunk_size = 10
+        response = Response()
+
+        formatter.write_stream(response, iter([{'id': 1}, {'id': 2}, {'id': 3}]))
+        self.assertEqual(list(response.response), [b'{"id": 1}\n', b'{"id": 2}\n', b'{"id": 3}\n'])
+
+    def test_streamed_view(self):
+        @route('/view')
+        @result(self.Schema)
+        def view():
+            return ({'id': i, 'other': i} for i in range(3))
+
+        self.api.add_view(view)
+
+        response = self.client.get('/view', headers={'accept': 'application/x-ndjson'})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_streamed)
+        self.assertEqual(response.get_data(), b'{"id": 0}\n{"id": 1}\n{"id": 2}\n')
+
+    def test_read(self):
+        formatter = NdjsonInputFormatter()
+
+        with self.app.test_request_context(data=b'{"id": 1}\n\n{"id": 2}', content_type='application/x-ndjson'):
+            items = formatter.read(request)
+            self.assertFalse(isinstance(items, list))
+            self.assertEqual(list(items), [{'id': 1}, {'id': 2}])
+
+    def test_lazy_parameter(self):
+        received = []
+
+        @route('/view', methods=['POST'])
+        @param('items', self.Schema, location='body')
+        def view(items):
+            for item in items:
+                received.append(item)
+
+        self.api.add_view(view)
+
+        response = self.client.post('/view', data=b'{"id": "1"}\n{"id": 2}\n', content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(received, [{'id': 1}, {'id': 2}])
+
+    def test_lazy_parameter_with_invalid_item(self):
+        received = []
+
+        @route('/view', methods=['POST'])
+        @param('items', self.Schema, location='body')
+        def view(items):
+            for item in items:
+                received.append(item)
+
+        self.api.add_view(view)
+
+        response = self.client.post('/view', data=b'{"id": 1}\n{"id": "a"}\n{"id": 3}\n',
+                                    content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(received, [{'id': 1}])
+        self.assertEqual(json.loads(response.data)['errors'][0]['field'], '1.id')
+
+    def test_lazy_parameter_with_invalid_line(self):
+        @route('/view', methods=['POST'])
+        @param('items', self.Schema, location='body')
+        def view(items):
+            list(items)
+
+        self.api.add_view(view)
+
+        response = self.client.post('/view', data=b'{"id": 1}\n\n{"id"\n', content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(json.loads(response.data)['errors'][0]['field'], 1)
+
+    def test_lazy_parameter_with_invalid_first_item(self):
+        @route('/view', methods=['POST'])
+        @param('items', self.Schema, location='body')
+        def view(items):
+            list(items)
+
+        self.api.add_view(view)
+
+        response = self.client.post('/view', data=b'{"id": "a"}\n', content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(json.loads(response.data)['errors'][0]['field'], '0.id')
+
+    def test_read_invalid_line(self):
+        formatter = NdjsonInputFormatter()
+
+        with self.app.test_request_context(data=b'{"id": 1}\n[', content_type='application/x-ndjson'):
+            items = formatter.read(request)
+            self.assertEqual(next(items), {'id': 1})
+
+            with self.assertRaises(ValidationError) as exc_info:
+                next(items)
+            self.assertEqual(list(exc_info.exception.message), [1])
+
+
+class TestCsvOutputFormatter(TestCase):
+    class Schema(fields.Schema):
+        last_name = fields.StringField()
+        first_name = fields.StringField(dump_to='name')
+        password = fields.StringField(load_only=True)
+        age = fields.IntegerField()
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.api = WebAPI(self.app)
+        self.api.output_formatters.append(CsvOutputFormatter())
+        self.client = self.app.test_client()
+
+    def test_write(self):
+        formatter = CsvOutputFormatter()
+        response = Response()
+
+        formatter.write(response, [{'a': 1, 'b': 'x,y'}, {'a': 2, 'c': 3}])
+        self.assertEqual(response.content_type, 'text/csv')
+        self.assertTrue(response.is_streamed)
+        self.assertEqual(response.get_data(), b'a,b\r\n1,"x,y"\r\n2,\r\n')
+
+    def test_write_with_schema(self):
+        formatter = CsvOutputFormatter()
+        response = Response()
+
+        formatter.write(response, [{'age': 1, 'name': 'foo'}], schema=self.Schema())
+        self.assertEqual(response.get_data(), b'last_name,name,age\r\n,foo,1\r\n')
+
+    def test_write_empty_stream(self):
+        formatter = CsvOutputFormatter()
+        response = Response()
+
+        formatter.write_stream(response, iter([]))
+        self.assertEqual(response.get_data(), b'')
+
+        formatter.write_stream(response, iter([]), schema=self.Schema())
+        self.assertEqual(response.get_data(), b'last_name,name,age\r\n')
+
+    def test_write_stream_with_chunks(self):
+        formatter = CsvOutputFormatter()
+        formatter.chunk_size = 4
+        response = Response()
+
+        formatter.write_stream(response, iter([{'a': 1}, {'a': 2}]))
+        self.assertEqual(list(response.response), [b'a\r\n1\r\n', b'2\r\n'])
+
+    def test_view_with_schema(self):
+        @route('/view')
+        @result(self.Schema)
+        def view():
+            return ({'first_name': 'foo', 'last_name': 'bar', 'age': i, 'password': 'x'} for i in range(2))
+
+        self.api.add_view(view)
+
+        response = self.client.get('/view', headers={'accept': 'text/csv'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content_type, 'text/csv')
+        self.assertEqual(response.get_data(), b'last_name,name,age\r\nbar,foo,0\r\nbar,foo,1\r\n')
+
+    def test_view_without_schema(self):
+        @route('/view')
+        def view():
+            return [{'id': 1}, {'id': 2}]
+
+        self.api.add_view(view)
+
+        response = self.client.get('/view', headers={'accept': 'text/csv'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_data(), b'id\r\n1\r\n2\r\n')
+
+
+class TestMessagePackFormatters(TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.api = WebAPI(self.app)
+        self.api.input_formatters.append(MessagePackInputFormatter())
+        self.api.output_formatters.append(MessagePackOutputFormatter())
+        self.client = self.app.test_client()
+
+    def test_write(self):
+        formatter = MessagePackOutputFormatter()
+        response = Response()
+
+        formatter.write(response, dict(field='value'))
+        self.assertEqual(response.content_type, 'application/msgpack')
+        self.assertEqual(response.get_data(), b'\x81\xa5field\xa5value')
+
+    def test_write_non_native_types(self):
+        formatter = MessagePackOutputFormatter()
+        response = Response()
+        value = uuid.UUID('6a5f2c0e-1b5b-4a89-9d1e-6a0c7e1d4b3a')
+
+        formatter.write(response, [datetime.date(2016, 1, 1), decimal.Decimal('1.5'), value, b'\x00'])
+        self.assertEqual(msgpack.unpackb(response.get_data()), ['2016-01-01', '1.5', str(value), b'\x00'])
+
+    def test_view(self):
+        @route('/view', methods=['POST'])
+        def view():
+            return {'received': request.get_data()}
+
+        self.api.add_view(view)
+
+        response = self.client.post('/view', data=msgpack.packb([1, 2]),
+                                    headers={'accept': 'application/msgpack'},
+                                    content_type='application/msgpack')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content_type, 'application/msgpack')
+        self.assertEqual(msgpack.unpackb(response.get_data()), {'received': b'\x92\x01\x02'})
+
+    def test_read(self):
+        formatter = MessagePackInputFormatter()
+
+        with self.app.test_request_context(data=msgpack.packb({'field': 1.5}), content_type='application/msgpack'):
+            self.assertEqual(formatter.read(request), {'field': 1.5})
+
+    def test_read_invalid_data(self):
+        formatter = MessagePackInputFormatter()
+
+        with self.app.test_request_context(data=b'\x92\x01', content_type='application/msgpack'):
+            with self.assertRaises(ValueError):
+                formatter.read(request)
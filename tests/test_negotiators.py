@@ -1,74 +1,129 @@
-# from flask import Flask, request
-# from flask_webapi.formatters import JsonInputFormatter, JsonOutputFormatter, PickleOutputFormatter, MimeType
-# from flask_webapi.negotiators import DefaultContentNegotiator
-# from unittest import TestCase
-
-#
-# class TestSelectInputFormatter(TestCase):
-#     def setUp(self):
-#         self.app = Flask(__name__)
-#         self.negotiation = DefaultContentNegotiator()
-#
-#     def test_empty_formatters(self):
-#         with self.app.test_request_context():
-#             self.assertIsNone(self.negotiation.select_input_formatter([]))
-#
-#     def test_empty_content_type(self):
-#         with self.app.test_request_context():
-#             formatters = [JsonInputFormatter()]
-#             self.assertIsNone(self.negotiation.select_input_formatter(formatters))
-#
-#     def test_valid_content_type(self):
-#         with self.app.test_request_context(content_type='application/json;charset=utf-8'):
-#             parsers = [JsonInputFormatter()]
-#             parser, mimetype = self.negotiation.select_input_formatter(parsers)
-#             self.assertEqual(parser, parsers[0])
-#             self.assertEqual(mimetype, MimeType.parse(request.content_type))
-#
-#     def test_invalid_content_type(self):
-#         with self.app.test_request_context(content_type='application/data'):
-#             formatters = [JsonInputFormatter()]
-#             self.assertIsNone(self.negotiation.select_input_formatter(formatters))
-#
-#
-# class TestSelectOutputFormatter(TestCase):
-#     def setUp(self):
-#         self.app = Flask(__name__)
-#         self.negotiation = DefaultContentNegotiator()
-#
-#     def test_empty_formatters(self):
-#         with self.app.test_request_context():
-#             self.assertIsNone(self.negotiation.select_output_formatter([]))
-#
-#     def test_empty_accept_header(self):
-#         with self.app.test_request_context():
-#             renderers = [JsonOutputFormatter(), PickleOutputFormatter()]
-#             renderer, mimetype = self.negotiation.select_output_formatter(renderers)
-#             self.assertEqual(renderer, renderers[0])
-#             self.assertEqual(mimetype, renderers[0].mimetype)
-#
-#     def test_valid_accept_header(self):
-#         with self.app.test_request_context(headers={'accept': 'application/json; indent=6'}):
-#             renderers = [JsonOutputFormatter()]
-#             renderer, mimetype = self.negotiation.select_output_formatter(renderers)
-#             self.assertEqual(renderer, renderers[0])
-#             self.assertEqual(mimetype, MimeType.parse(request.headers['accept']))
-#
-#     def test_invalid_accept_header(self):
-#         with self.app.test_request_context(headers={'accept': 'application/data'}):
-#             formatters = [JsonOutputFormatter()]
-#             self.assertIsNone(self.negotiation.select_output_formatter(formatters))
-#
-#     def test_multiple_accept_header(self):
-#         with self.app.test_request_context(headers={'accept': 'application/xml,application/json;'}):
-#             renderers = [JsonOutputFormatter()]
-#             renderer, mimetype = self.negotiation.select_output_formatter(renderers)
-#             self.assertEqual(renderer, renderers[0])
-#             self.assertEqual(str(mimetype), 'application/json')
-#
-#     def test_any_in_accept_header(self):
-#         with self.app.test_request_context(headers={'accept': '*/*'}):
-#             renderers = [JsonOutputFormatter()]
-#             renderer, mimetype = self.negotiation.select_output_formatter(renderers)
-#             self.assertEqual(renderer, renderers[0])
-#             self.assertEqual(str(mimetype), 'application/json')
+from flask import Flask, request
+from flask_webapi.formatters import (CsvOutputFormatter, JsonInputFormatter, JsonOutputFormatter, PickleOutputFormatter,
+                                     MimeType)
+from flask_webapi.negotiators import DefaultContentNegotiator
+from unittest import TestCase
+
+
+class TestSelectInputFormatter(TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.negotiation = DefaultContentNegotiator()
+
+    def test_empty_formatters(self):
+        with self.app.test_request_context():
+            self.assertIsNone(self.negotiation.select_input_formatter([]))
+
+    def test_empty_content_type(self):
+        with self.app.test_request_context():
+            formatters = [JsonInputFormatter()]
+            self.assertIsNone(self.negotiation.select_input_formatter(formatters))
+
+    def test_valid_content_type(self):
+        with self.app.test_request_context(content_type='application/json;charset=utf-8'):
+            parsers = [JsonInputFormatter()]
+            parser, mimetype = self.negotiation.select_input_formatter(parsers)
+            self.assertEqual(parser, parsers[0])
+            self.assertEqual(mimetype, MimeType.parse(request.content_type))
+
+    def test_invalid_content_type(self):
+        with self.app.test_request_context(content_type='application/data'):
+            formatters = [JsonInputFormatter()]
+            self.assertIsNone(self.negotiation.select_input_formatter(formatters))
+
+
+class TestSelectOutputFormatter(TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.negotiation = DefaultContentNegotiator()
+
+    def test_empty_formatters(self):
+        with self.app.test_request_context():
+            self.assertIsNone(self.negotiation.select_output_formatter([]))
+
+    def test_empty_accept_header(self):
+        with self.app.test_request_context():
+            renderers = [JsonOutputFormatter(), PickleOutputFormatter()]
+            renderer, mimetype = self.negotiation.select_output_formatter(renderers)
+            self.assertEqual(renderer, renderers[0])
+            self.assertEqual(mimetype, renderers[0].mimetype)
+
+    def test_valid_accept_header(self):
+        with self.app.test_request_context(headers={'accept': 'application/json; indent=6'}):
+            renderers = [JsonOutputFormatter()]
+            renderer, mimetype = self.negotiation.select_output_formatter(renderers)
+            self.assertEqual(renderer, renderers[0])
+            self.assertEqual(mimetype, MimeType.parse(request.headers['accept']))
+
+    def test_invalid_accept_header(self):
+        with self.app.test_request_context(headers={'accept': 'application/data'}):
+            formatters = [JsonOutputFormatter()]
+            self.assertIsNone(self.negotiation.select_output_formatter(formatters))
+
+    def test_multiple_accept_header(self):
+        with self.app.test_request_context(headers={'accept': 'application/xml,application/json;'}):
+            renderers = [JsonOutputFormatter()]
+            renderer, mimetype = self.negotiation.select_output_formatter(renderers)
+            self.assertEqual(renderer, renderers[0])
+            self.assertEqual(str(mimetype), 'application/json')
+
+    def test_any_in_accept_header(self):
+        with self.app.test_request_context(headers={'accept': '*/*'}):
+            renderers = [JsonOutputFormatter()]
+            renderer, mimetype = self.negotiation.select_output_formatter(renderers)
+            self.assertEqual(renderer, renderers[0])
+            self.assertEqual(str(mimetype), 'application/json')
+
+    def test_quality_in_accept_header(self):
+        with self.app.test_request_context(headers={'accept': 'application/json;q=0.5,application/pickle'}):
+            renderers = [JsonOutputFormatter(), PickleOutputFormatter()]
+            renderer, mimetype = self.negotiation.select_output_formatter(renderers)
+            self.assertEqual(renderer, renderers[1])
+            self.assertEqual(str(mimetype), 'application/pickle')
+
+    def test_quality_zero_in_accept_header(self):
+        with self.app.test_request_context(headers={'accept': 'application/json;q=0'}):
+            renderers = [JsonOutputFormatter()]
+            self.assertIsNone(self.negotiation.select_output_formatter(renderers))
+
+    def test_quality_zero_excludes_wildcard_match(self):
+        with self.app.test_request_context(headers={'accept': '*/*, application/json;q=0'}):
+            self.assertIsNone(self.negotiation.select_output_formatter([JsonOutputFormatter()]))
+
+        with self.app.test_request_context(headers={'accept': 'text/*;q=0.5, text/csv;q=0'}):
+            self.assertIsNone(self.negotiation.select_output_formatter([CsvOutputFormatter()]))
+
+    def test_quality_of_most_specific_range(self):
+        with self.app.test_request_context(headers={'accept': '*/*, application/json;q=0.1'}):
+            renderers = [JsonOutputFormatter(), CsvOutputFormatter()]
+            renderer, mimetype = self.negotiation.select_output_formatter(renderers)
+            self.assertEqual(renderer, renderers[1])
+            self.assertEqual(str(mimetype), 'text/csv')
+
+    def test_specificity_in_accept_header(self):
+        with self.app.test_request_context(headers={'accept': '*/*,application/pickle'}):
+            renderers = [JsonOutputFormatter(), PickleOutputFormatter()]
+            renderer, mimetype = self.negotiation.select_output_formatter(renderers)
+            self.assertEqual(renderer, renderers[1])
+            self.assertEqual(str(mimetype), 'application/pickle')
+
+    def test_force_with_invalid_accept_header(self):
+        with self.app.test_request_context(headers={'accept': 'application/data'}):
+            renderers = [JsonOutputFormatter()]
+            renderer, mimetype = self.negotiation.select_output_formatter(renderers, force=True)
+            self.assertEqual(renderer, renderers[0])
+            self.assertEqual(mimetype, renderers[0].mimetype)
+
+
+class TestParseAccept(TestCase):
+    def setUp(self):
+        self.negotiation = DefaultContentNegotiator()
+
+    def test_sort_by_quality_and_specificity(self):
+        mimetypes = self.negotiation.parse_accept('text/*;q=0.8, */*;q=0.1, text/html, text/html;level=1, text/plain')
+        self.assertEqual([str(mimetype) for mimetype in mimetypes],
+                         ['text/html; level=1', 'text/html', 'text/plain', 'text/*', '*/*'])
+
+    def test_invalid_quality(self):
+        mimetypes = self.negotiation.parse_accept('text/html;q=a')
+        self.assertEqual([str(mimetype) for mimetype in mimetypes], ['text/html'])
@@ -1,5 +1,6 @@
 from flask import Flask, json
 from flask_webapi import WebAPI, fields, param, route
+from flask_webapi.formatters import JsonInputFormatter
 from unittest import TestCase
 from werkzeug.datastructures import Headers
 
@@ -87,6 +88,52 @@ class TestLocation(TestCase):
         self.assertTrue('Value provider' in response.get_data(as_text=True))
 
 
+class TestMultipleParameters(TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.debug = True
+        self.api = WebAPI(self.app)
+        self.client = self.app.test_client()
+
+    def test_body_is_read_once(self):
+        formatter = CountingInputFormatter()
+        self.api.input_formatters = [formatter]
+
+        @route('/view', methods=['POST'])
+        @param('first_name', fields.StringField, location='body')
+        @param('last_name', fields.StringField, location='body')
+        def view(first_name, last_name):
+            return {'first_name': first_name, 'last_name': last_name}
+        self.api.add_view(view)
+
+        data = {'first_name': 'foo', 'last_name': 'bar'}
+
+        response = self.client.post('/view', data=json.dumps(data), content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data), data)
+        self.assertEqual(formatter.reads, 1)
+
+    def test_headers(self):
+        @route('/view')
+        @param('first_name', fields.StringField(load_from='First-Name'), location='headers')
+        @param('last_name', fields.StringField(load_from='Last-Name'), location='headers')
+        def view(first_name, last_name):
+            return {'first_name': first_name, 'last_name': last_name}
+        self.api.add_view(view)
+
+        response = self.client.get('/view', headers={'First-Name': 'foo', 'Last-Name': 'bar'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data), {'first_name': 'foo', 'last_name': 'bar'})
+
+
+class CountingInputFormatter(JsonInputFormatter):
+    reads = 0
+
+    def read(self, request, mimetype=None):
+        self.reads += 1
+        return super().read(request, mimetype)
+
+
 class TestWithoutLocation(TestCase):
     def setUp(self):
         self.app = Flask(__name__)
@@ -0,0 +1,60 @@
+import datetime
+
+from flask_webapi.utils import dateparse
+from flask_webapi.utils.timezone import get_fixed_timezone, utc
+from unittest import TestCase
+
+
+class TestParseDate(TestCase):
+    def test_canonical_form(self):
+        self.assertEqual(dateparse.parse_date('2016-01-31'), datetime.date(2016, 1, 31))
+
+    def test_other_forms(self):
+        self.assertEqual(dateparse.parse_date('2016-1-3'), datetime.date(2016, 1, 3))
+        self.assertIsNone(dateparse.parse_date('2016-+1-01'))
+        self.assertIsNone(dateparse.parse_date('2016/01/31'))
+
+    def test_invalid_date(self):
+        with self.assertRaises(ValueError):
+            dateparse.parse_date('2016-02-30')
+
+
+class TestParseDatetime(TestCase):
+    def test_canonical_forms(self):
+        values = [
+            ('2016-01-31T10:20:30', datetime.datetime(2016, 1, 31, 10, 20, 30)),
+            ('2016-01-31 10:20:30', datetime.datetime(2016, 1, 31, 10, 20, 30)),
+            ('2016-01-31T10:20:30.123', datetime.datetime(2016, 1, 31, 10, 20, 30, 123000)),
+            ('2016-01-31T10:20:30.123456789', datetime.datetime(2016, 1, 31, 10, 20, 30, 123456)),
+            ('2016-01-31T10:20:30Z', datetime.datetime(2016, 1, 31, 10, 20, 30, tzinfo=utc)),
+            ('2016-01-31T10:20:30.5+02:30',
+             datetime.datetime(2016, 1, 31, 10, 20, 30, 500000, tzinfo=get_fixed_timezone(150))),
+            ('2016-01-31T10:20:30-05:00', datetime.datetime(2016, 1, 31, 10, 20, 30, tzinfo=get_fixed_timezone(-300)))
+        ]
+
+        for value, expected in values:
+            parsed = dateparse._parse_canonical_datetime(value)
+            self.assertEqual(parsed, expected)
+            self.assertEqual(parsed.utcoffset(), expected.utcoffset())
+            self.assertEqual(dateparse.parse_datetime(value), expected)
+
+    def test_other_forms(self):
+        values = [
+            ('2016-1-3T1:2', datetime.datetime(2016, 1, 3, 1, 2)),
+            ('2016-01-31T10:20', datetime.datetime(2016, 1, 31, 10, 20)),
+            ('2016-01-31T10:20:30+02', datetime.datetime(2016, 1, 31, 10, 20, 30, tzinfo=get_fixed_timezone(120))),
+            ('2016-01-31T10:20:30+0230', datetime.datetime(2016, 1, 31, 10, 20, 30, tzinfo=get_fixed_timezone(150)))
+        ]
+
+        for value, expected in values:
+            self.assertIsNone(dateparse._parse_canonical_datetime(value))
+            self.assertEqual(dateparse.parse_datetime(value), expected)
+
+    def test_not_well_formatted(self):
+        self.assertIsNone(dateparse.parse_datetime('2016-01-31T10:20:30.'))
+        self.assertIsNone(dateparse.parse_datetime('2016-01-31T10:20:30X'))
+        self.assertIsNone(dateparse.parse_datetime('2016-01-31T+1:20:30'))
+
+    def test_invalid_datetime(self):
+        with self.assertRaises(ValueError):
+            dateparse.parse_datetime('2016-01-31T25:20:30')
@@ -14,3 +14,9 @@ class TestFormatErrorMessage(TestCase):
         expected_message = {'message': 'Invalid value: 123'}
 
         self.assertEqual(format_error_message(input_message, value=123), expected_message)
+
+    def test_dict_message_is_not_changed(self):
+        input_message = {'message': 'Invalid value: {value}'}
+
+        format_error_message(input_message, value=123)
+        self.assertEqual(input_message, {'message': 'Invalid value: {value}'})
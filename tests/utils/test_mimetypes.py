@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 from flask_webapi.utils import missing
 from flask_webapi.utils.mimetypes import MimeType
 from unittest import TestCase
@@ -70,3 +73,39 @@ class TestMimeType(TestCase):
         mimetype2 = MimeType.parse('*/json')
         self.assertTrue(mimetype.match(mimetype2))
         self.assertTrue(mimetype2.match(mimetype))
+
+    def test_immutable(self):
+        mimetype = MimeType.parse('application/json;indent=4')
+
+        with self.assertRaises(AttributeError):
+            mimetype.main_type = 'text'
+
+        with self.assertRaises(TypeError):
+            mimetype.params['indent'] = '2'
+
+    def test_hash(self):
+        mimetype = MimeType('application', 'json', {'indent': '4'})
+        mimetype2 = MimeType('application', 'json', {'indent': '4'})
+        self.assertEqual(mimetype, mimetype2)
+        self.assertEqual(hash(mimetype), hash(mimetype2))
+        self.assertEqual(len({mimetype, mimetype2}), 1)
+
+    def test_parse_is_cached(self):
+        self.assertIs(MimeType.parse('application/json'), MimeType.parse('application/json'))
+
+    def test_replace(self):
+        mimetype = MimeType.parse('application/json')
+        mimetype2 = mimetype.replace(params={'indent': '4'})
+        self.assertEqual(str(mimetype), 'application/json')
+        self.assertEqual(str(mimetype2), 'application/json; indent=4')
+
+    def test_copy(self):
+        mimetype = MimeType.parse('application/json;indent=4')
+        self.assertIs(copy.copy(mimetype), mimetype)
+        self.assertIs(copy.deepcopy(mimetype), mimetype)
+
+    def test_pickle(self):
+        mimetype = MimeType.parse('application/json;indent=4')
+        mimetype2 = pickle.loads(pickle.dumps(mimetype))
+        self.assertEqual(mimetype2, mimetype)
+        self.assertEqual(mimetype2.params['indent'], '4')
@@ -0,0 +1,89 @@
+from flask_webapi.utils import msgpack
+from unittest import TestCase
+
+
+class TestPackb(TestCase):
+    def test_nil_and_bool(self):
+        self.assertEqual(msgpack.packb(None), b'\xc0')
+        self.assertEqual(msgpack.packb(True), b'\xc3')
+        self.assertEqual(msgpack.packb(False), b'\xc2')
+
+    def test_int(self):
+        self.assertEqual(msgpack.packb(1), b'\x01')
+        self.assertEqual(msgpack.packb(-1), b'\xff')
+        self.assertEqual(msgpack.packb(200), b'\xcc\xc8')
+        self.assertEqual(msgpack.packb(-200), b'\xd1\xff\x38')
+        self.assertEqual(msgpack.packb(2 ** 32), b'\xcf\x00\x00\x00\x01\x00\x00\x00\x00')
+
+    def test_int_overflow(self):
+        with self.assertRaises(OverflowError):
+            msgpack.packb(2 ** 64)
+
+    def test_float(self):
+        self.assertEqual(msgpack.packb(1.5), b'\xcb\x3f\xf8\x00\x00\x00\x00\x00\x00')
+
+    def test_str(self):
+        self.assertEqual(msgpack.packb('abc'), b'\xa3abc')
+        self.assertEqual(msgpack.packb('a' * 32), b'\xd9\x20' + b'a' * 32)
+
+    def test_bin(self):
+        self.assertEqual(msgpack.packb(b'abc'), b'\xc4\x03abc')
+
+    def test_array_and_map(self):
+        self.assertEqual(msgpack.packb([1, 2]), b'\x92\x01\x02')
+        self.assertEqual(msgpack.packb({'a': 1}), b'\x81\xa1a\x01')
+        self.assertEqual(msgpack.packb(list(range(16)))[:3], b'\xdc\x00\x10')
+
+    def test_unsupported_type(self):
+        with self.assertRaises(TypeError):
+            msgpack.packb(object())
+
+    def test_default(self):
+        self.assertEqual(msgpack.packb(object(), default=lambda o: 'obj'), b'\xa3obj')
+
+
+class TestUnpackb(TestCase):
+    def test_roundtrip(self):
+        data = {
+            'nil': None,
+            'bool': [True, False],
+            'int': [0, 127, 128, 255, 256, 65536, 2 ** 32, 2 ** 64 - 1, -1, -32, -33, -129, -32769, -2 ** 63],
+            'float': 1.5,
+            'str': ['', 'abc', 'x' * 300, 'x' * 70000, 'ação'],
+            'bin': b'\x00\x01',
+            'array': list(range(20)),
+            'map': {str(i): i for i in range(20)}
+        }
+
+        self.assertEqual(msgpack.unpackb(msgpack.packb(data)), data)
+
+    def test_truncated_data(self):
+        with self.assertRaises(ValueError):
+            msgpack.unpackb(b'\xa3ab')
+
+        with self.assertRaises(ValueError):
+            msgpack.unpackb(b'\xcd\x01')
+
+        with self.assertRaises(ValueError):
+            msgpack.unpackb(b'')
+
+    def test_extra_data(self):
+        with self.assertRaises(ValueError):
+            msgpack.unpackb(b'\x01\x02')
+
+    def test_unsupported_type(self):
+        with self.assertRaises(ValueError):
+            msgpack.unpackb(b'\xd4\x01\x00')
+
+    def test_max_depth(self):
+        obj = msgpack.unpackb(b'\x91' * (msgpack.MAX_DEPTH - 1) + b'\x81\xc0\xc0')
+
+        for _ in range(msgpack.MAX_DEPTH - 1):
+            obj = obj[0]
+        self.assertEqual(obj, {None: None})
+
+        with self.assertRaises(ValueError):
+            msgpack.unpackb(b'\x91' * 5000 + b'\xc0')
+
+        with self.assertRaises(ValueError):
+            msgpack.unpackb(b'\x81\xc0' * 5000 + b'\xc0')
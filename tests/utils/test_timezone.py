@@ -0,0 +1,26 @@
+import datetime
+
+from flask_webapi.utils.timezone import FixedOffset, get_fixed_timezone
+from unittest import TestCase
+
+
+class TestFixedOffset(TestCase):
+    def test_equality(self):
+        self.assertEqual(FixedOffset(60, '+0100'), FixedOffset(60, '+0100'))
+        self.assertNotEqual(FixedOffset(60, '+0100'), FixedOffset(-60, '-0100'))
+        self.assertNotEqual(FixedOffset(60, '+0100'), datetime.timezone.utc)
+
+    def test_hash(self):
+        self.assertEqual(hash(FixedOffset(60, '+0100')), hash(FixedOffset(60, '+0100')))
+        self.assertEqual(len({FixedOffset(60, '+0100'), FixedOffset(60, '+0100')}), 1)
+
+
+class TestGetFixedTimezone(TestCase):
+    def test_name_and_offset(self):
+        tz = get_fixed_timezone(-150)
+        self.assertEqual(tz.tzname(None), '-0230')
+        self.assertEqual(tz.utcoffset(None), datetime.timedelta(minutes=-150))
+
+    def test_instances_are_cached(self):
+        self.assertIs(get_fixed_timezone(120), get_fixed_timezone(120))
+        self.assertIs(get_fixed_timezone(datetime.timedelta(hours=-2)), get_fixed_timezone(-120))